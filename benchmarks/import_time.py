@@ -0,0 +1,68 @@
+"""
+Import time of pysapscript in a fresh interpreter
+
+Fails when the median import of the core (Sapscript and Window) exceeds the budget,
+or when it loads a heavy dependency - those are imported on first use only.
+
+    python benchmarks/import_time.py                # compare with budget
+    python benchmarks/import_time.py --budget 0.5   # seconds
+    python benchmarks/import_time.py --runs 11
+"""
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+
+IMPORT_BUDGET_SECONDS = 0.25
+
+# modules the core must not load
+HEAVY_MODULES = ("polars", "pandas", "pyarrow", "numpy", "asyncio", "sqlite3")
+
+PROBE = f"""
+import sys, json, time
+started = time.perf_counter()
+import pysapscript
+pysapscript.Sapscript, pysapscript.Window
+seconds = time.perf_counter() - started
+print(json.dumps({{"seconds": seconds, "loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def measure() -> dict:
+    """
+    imports pysapscript core in a new interpreter, returns seconds and loaded heavy modules
+    """
+    output = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True, check=True).stdout
+
+    return json.loads(output)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget", type=float, default=IMPORT_BUDGET_SECONDS, help="allowed median in seconds")
+    parser.add_argument("--runs", type=int, default=5, help="number of fresh interpreters")
+    args = parser.parse_args()
+
+    results = [measure() for _ in range(args.runs)]
+    median = statistics.median(r["seconds"] for r in results)
+    loaded = sorted({m for r in results for m in r["loaded"]})
+
+    print(f"import pysapscript core: median {median:.4f}s of {args.runs} runs, budget {args.budget}s")
+
+    found = []
+    if median > args.budget:
+        found.append(f"import time {median:.4f}s over budget {args.budget}s")
+
+    if loaded:
+        found.append(f"heavy modules loaded at import: {', '.join(loaded)}")
+
+    for regression in found:
+        print(f"REGRESSION {regression}")
+
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,301 @@
+"""
+Benchmarks of table, tree and window hot paths against the simulated SAP GUI scripting engine
+
+Reports COM calls, wall time and peak memory of every case and fails
+when a case regresses against benchmarks/baselines.json.
+
+    python benchmarks/run.py                  # compare with baselines
+    python benchmarks/run.py --update         # store current results as baselines
+    python benchmarks/run.py --latency 0.0005 # seconds added to every COM call
+    python benchmarks/run.py -k tree          # only cases containing "tree"
+"""
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+# pysapscript imports polars on first use, it is loaded here so that no case pays for the import
+import polars  # noqa: F401
+
+from pysapscript.window import Window
+from pysapscript.shell_table import ShellTable
+from pysapscript.shell_tree import ShellTree
+from pysapscript.simulated import SimulatedSapGui, SimulatedSession, SimulatedGridView, SimulatedTree, SimulatedTextField
+
+
+BASELINES = Path(__file__).with_name("baselines.json")
+
+# allowed growth against baseline, calls must not grow at all
+TIME_TOLERANCE = 0.5
+TIME_FLOOR_SECONDS = 0.05
+MEMORY_TOLERANCE = 0.5
+# every case runs this many times on a fresh session, the fastest run counts
+REPEAT = 3
+
+GRID_ELEMENT = "wnd[0]/usr/cntlGRID1/shellcont/shell"
+TREE_ELEMENT = "wnd[0]/shellcont/shellcont/tree"
+FORM_FIELDS = [f"wnd[0]/usr/txtP_FIELD{i:02}" for i in range(40)]
+
+Prepared = tuple[Callable[[], Any], SimulatedSapGui]
+
+
+def _session(latency: float) -> tuple[SimulatedSapGui, SimulatedSession, Any]:
+    """
+    simulated engine with one session, returns engine, the session and its counted handle
+    """
+    sap_gui = SimulatedSapGui(latency=latency)
+    session = sap_gui.application.open_connection().Children(0)
+
+    return sap_gui, session, sap_gui.GetScriptingEngine.Children(0).Children(0)
+
+
+def _grid(rows: int, columns: int) -> SimulatedGridView:
+    names = [f"COL{c}" for c in range(columns)]
+
+    return SimulatedGridView("shell", names, [[f"{r}-{c}" for c in names] for r in range(rows)])
+
+
+def _tree(folders: int, children_per_folder: int) -> SimulatedTree:
+    """
+    expanded folders with children_per_folder leaf nodes each
+    """
+    tree = SimulatedTree("tree")
+    number = 1
+
+    for f in range(folders):
+        folder = f"{number:>10}"
+        tree.add_node(folder, f"Folder {f}", folder=True, expanded=True)
+        number += 1
+
+        for c in range(children_per_folder):
+            tree.add_node(f"{number:>10}", f"Node {f}.{c}", parent=folder)
+            number += 1
+
+    return tree
+
+
+def _deep_tree(levels: int, fanout: int) -> SimulatedTree:
+    """
+    fanout children per folder down to levels, children sent by the tree on first expand
+    """
+    tree = SimulatedTree("tree", load_on_expand=True)
+    parents: list[tuple[str | None, str]] = [(None, "")]
+
+    for level in range(levels):
+        next_parents = []
+        for parent, label in parents:
+            for c in range(fanout):
+                key = f"{parent or ''}{c:02}"
+                tree.add_node(key, f"{label}{c}", parent=parent, folder=level < levels - 1)
+                next_parents.append((key, f"{label}{c}."))
+        parents = next_parents
+
+    return tree
+
+
+def case_table_read(rows: int, columns: int) -> Callable[[float], Prepared]:
+    def prepare(latency: float) -> Prepared:
+        sap_gui, session, handle = _session(latency)
+        session.place(GRID_ELEMENT, _grid(rows, columns))
+
+        return lambda: Window(0, None, 0, handle).read_shell_table(GRID_ELEMENT), sap_gui
+
+    return prepare
+
+
+def case_table_load(rows: int, columns: int) -> Callable[[float], Prepared]:
+    def prepare(latency: float) -> Prepared:
+        sap_gui, session, handle = _session(latency)
+        session.place(GRID_ELEMENT, _grid(rows, columns))
+        table = ShellTable(handle, GRID_ELEMENT, load_table=False)
+        table.data_present = True
+
+        return table.load, sap_gui
+
+    return prepare
+
+
+def case_tree_read(folders: int, children: int, attributes: list[str] | None = None) -> Callable[[float], Prepared]:
+    def prepare(latency: float) -> Prepared:
+        sap_gui, session, handle = _session(latency)
+        session.place(TREE_ELEMENT, _tree(folders, children))
+
+        return lambda: ShellTree(handle, TREE_ELEMENT, attributes), sap_gui
+
+    return prepare
+
+
+def case_tree_children(folders: int, children: int) -> Callable[[float], Prepared]:
+    def prepare(latency: float) -> Prepared:
+        sap_gui, session, handle = _session(latency)
+        session.place(TREE_ELEMENT, _tree(folders, children))
+        tree = ShellTree(handle, TREE_ELEMENT)
+
+        def run() -> None:
+            for folder in tree.get_node_folders():
+                folder.get_children()
+
+        return run, sap_gui
+
+    return prepare
+
+
+def case_tree_lookup(folders: int, children: int) -> Callable[[float], Prepared]:
+    def prepare(latency: float) -> Prepared:
+        sap_gui, session, handle = _session(latency)
+        session.place(TREE_ELEMENT, _tree(folders, children))
+        tree = ShellTree(handle, TREE_ELEMENT, ["label"])
+        keys = [node.key for node in tree]
+
+        def run() -> None:
+            for key in keys:
+                tree.get_node_by_key(key)
+            tree.find_nodes(prefix="Node 1.")
+
+        return run, sap_gui
+
+    return prepare
+
+
+def case_tree_lazy_path(levels: int, fanout: int) -> Callable[[float], Prepared]:
+    def prepare(latency: float) -> Prepared:
+        sap_gui, session, handle = _session(latency)
+        session.place(TREE_ELEMENT, _deep_tree(levels, fanout))
+        path = "/".join(".".join(["1"] * (level + 1)) for level in range(levels))
+
+        def run() -> None:
+            ShellTree(handle, TREE_ELEMENT, lazy=True).get_node_by_path(path)
+
+        return run, sap_gui
+
+    return prepare
+
+
+def case_form_write(many: bool) -> Callable[[float], Prepared]:
+    """
+    write_many() makes the same COM calls as write() per field, both cases show 2 calls per field
+    """
+    def prepare(latency: float) -> Prepared:
+        sap_gui, session, handle = _session(latency)
+        for field in FORM_FIELDS:
+            session.place(field, SimulatedTextField(field.rsplit("/", 1)[1]))
+
+        window = Window(0, None, 0, handle)
+
+        def run() -> None:
+            if many:
+                window.write_many({field: "VALUE" for field in FORM_FIELDS})
+            else:
+                for field in FORM_FIELDS:
+                    window.write(field, "VALUE")
+
+        return run, sap_gui
+
+    return prepare
+
+
+CASES: dict[str, Callable[[float], Prepared]] = {
+    "table_read_100x10": case_table_read(100, 10),
+    "table_read_1000x10": case_table_read(1000, 10),
+    "table_read_1000x50": case_table_read(1000, 50),
+    "table_load_5000x10": case_table_load(5000, 10),
+    "tree_read_100x10": case_tree_read(100, 10),
+    "tree_read_1000x20": case_tree_read(1000, 20),
+    "tree_read_labels_1000x20": case_tree_read(1000, 20, ["label"]),
+    "tree_get_children_100x10": case_tree_children(100, 10),
+    "tree_lookup_1000x20": case_tree_lookup(1000, 20),
+    "tree_lazy_path_5x10": case_tree_lazy_path(5, 10),
+    "window_write_40": case_form_write(many=False),
+    "window_write_many_40": case_form_write(many=True),
+}
+
+
+def run_case(prepare: Callable[[float], Prepared], latency: float) -> dict[str, float]:
+    """
+    runs one case REPEAT times, returns COM calls, fastest wall time in seconds and lowest peak memory in KiB
+
+    calls made while preparing the case are not counted
+    """
+    runs = [_measure(*prepare(latency)) for _ in range(REPEAT)]
+
+    return {
+        "calls": runs[0]["calls"],
+        "seconds": min(run["seconds"] for run in runs),
+        "peak_kib": min(run["peak_kib"] for run in runs),
+    }
+
+
+def _measure(function: Callable[[], Any], sap_gui: SimulatedSapGui) -> dict[str, float]:
+    """
+    runs prepared case once
+    """
+    sap_gui.reset_calls()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"calls": sap_gui.call_count, "seconds": round(seconds, 4), "peak_kib": round(peak / 1024, 1)}
+
+
+def regressions(name: str, result: dict[str, float], baseline: dict[str, float]) -> list[str]:
+    """
+    compares result of a case with its baseline
+    """
+    found = []
+
+    if result["calls"] > baseline["calls"]:
+        found.append(f"{name}: COM calls {baseline['calls']} -> {result['calls']}")
+
+    allowed_seconds = max(baseline["seconds"] * (1 + TIME_TOLERANCE), baseline["seconds"] + TIME_FLOOR_SECONDS)
+    if result["seconds"] > allowed_seconds:
+        found.append(f"{name}: time {baseline['seconds']}s -> {result['seconds']}s")
+
+    if result["peak_kib"] > baseline["peak_kib"] * (1 + MEMORY_TOLERANCE) + 64:
+        found.append(f"{name}: peak memory {baseline['peak_kib']} KiB -> {result['peak_kib']} KiB")
+
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--update", action="store_true", help="store results as baselines")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every COM call")
+    parser.add_argument("-k", dest="keyword", default="", help="run only cases containing keyword")
+    args = parser.parse_args()
+
+    baselines = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+    results = {}
+    found = []
+
+    print(f"{'case':<28}{'calls':>10}{'seconds':>10}{'peak KiB':>12}")
+    for name, prepare in CASES.items():
+        if args.keyword not in name:
+            continue
+
+        result = run_case(prepare, args.latency)
+        results[name] = result
+        print(f"{name:<28}{result['calls']:>10}{result['seconds']:>10}{result['peak_kib']:>12}")
+
+        if not args.update and args.latency == 0 and name in baselines:
+            found.extend(regressions(name, result, baselines[name]))
+
+    if args.update:
+        BASELINES.write_text(json.dumps({**baselines, **results}, indent=2) + "\n")
+        print(f"baselines stored in {BASELINES}")
+        return 0
+
+    for regression in found:
+        print(f"REGRESSION {regression}")
+
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,8 +2,45 @@
 .. include:: ../../README.md
 """
 
-from .pysapscript import Sapscript
-from .window import Window
-from .shell_table import ShellTable
+from importlib import import_module
+from typing import Any, TYPE_CHECKING
+
 from .types_.types import NavigateAction
 from .types_ import exceptions
+
+if TYPE_CHECKING:
+    from .pysapscript import Sapscript
+    from .window import Window
+    from .shell_table import ShellTable
+    from .async_window import AsyncSapscript, AsyncWindow
+    from .scheduler import JobScheduler
+    from .popups import PopupHandler
+
+
+# public names imported on first access, so that importing pysapscript stays cheap
+_LAZY_NAMES = {
+    "Sapscript": ".pysapscript",
+    "Window": ".window",
+    "ShellTable": ".shell_table",
+    "AsyncSapscript": ".async_window",
+    "AsyncWindow": ".async_window",
+    "JobScheduler": ".scheduler",
+    "PopupHandler": ".popups",
+}
+
+__all__ = [*_LAZY_NAMES, "NavigateAction", "exceptions"]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_NAMES})
@@ -0,0 +1,284 @@
+import asyncio
+import inspect
+from pathlib import Path
+from typing import Any, Iterator
+
+from pysapscript.pysapscript import Sapscript
+from pysapscript.window import Window
+from pysapscript.shell_table import ShellTable
+from pysapscript.shell_tree import ShellTree, Node
+from pysapscript.session_worker import SessionWorker
+from pysapscript.backends import Backend
+
+
+class _AsyncProxy:
+    """
+    Exposes methods of an object living in a session worker as awaitables
+
+    Plain attributes (table data, node labels, ...) are returned directly,
+    every method call is sent to the worker thread that owns the session.
+    Methods that yield (Window.iter_list_output, ShellTree.walk) return an async iterator,
+    each item is read in the worker too.
+    """
+
+    def __init__(self, worker: SessionWorker, target: Any) -> None:
+        self._worker = worker
+        self._target = target
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._target!r})"
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}({self._target})"
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if not callable(attribute):
+            return attribute
+
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            future = self._worker.submit(attribute, *args, **kwargs)
+            result = await asyncio.wrap_future(future)
+
+            return _wrap(self._worker, result)
+
+        method.__name__ = name
+        method.__doc__ = attribute.__doc__
+
+        return method
+
+
+class AsyncIterator:
+    """
+    Async iterator over a generator living in a session worker, every step runs in the worker
+
+    Example:
+        ```
+        async for row in await window.iter_list_output():
+            print(row["Material"])
+        ```
+    """
+
+    def __init__(self, worker: SessionWorker, generator: Iterator[Any]) -> None:
+        self._worker = worker
+        self._generator = generator
+
+    def __repr__(self) -> str:
+        return f"AsyncIterator({self._generator!r})"
+
+    def __str__(self) -> str:
+        return f"AsyncIterator({self._generator})"
+
+    def __aiter__(self) -> "AsyncIterator":
+        return self
+
+    async def __anext__(self) -> Any:
+        item = await asyncio.wrap_future(self._worker.submit(next, self._generator, _END))
+        if item is _END:
+            raise StopAsyncIteration
+
+        return _wrap(self._worker, item)
+
+    async def aclose(self) -> None:
+        """
+        Stops the generator in the worker, e.g. when leaving the loop early
+        """
+        await asyncio.wrap_future(self._worker.submit(self._generator.close))
+
+
+# marks the end of a generator read by AsyncIterator
+_END = object()
+
+
+class AsyncWindow(_AsyncProxy):
+    """
+    Awaitable counterpart of Window, every method of Window is a coroutine here
+
+    Example:
+        ```
+        await window.start_transaction("SE16")
+        table = await window.read_shell_table("wnd[0]/usr/cntlGRID1/shellcont/shell")
+        await table.select_row(1)
+        ```
+    """
+
+
+class AsyncShellTable(_AsyncProxy):
+    """
+    Awaitable counterpart of ShellTable, data getters are available without awaiting
+    """
+
+    def __getitem__(self, item: object) -> dict[str, Any] | list[dict[str, Any]]:
+        return self._target[item]
+
+    def __iter__(self) -> Any:
+        return iter(self._target)
+
+
+class AsyncShellTree(_AsyncProxy):
+    """
+    Awaitable counterpart of ShellTree, indexing returns AsyncNode without awaiting
+    """
+
+    def __len__(self) -> int:
+        return len(self._target)
+
+    def __getitem__(self, item: object) -> "list[AsyncNode] | AsyncNode":
+        return _wrap(self._worker, self._target[item])
+
+
+class AsyncNode(_AsyncProxy):
+    """
+    Awaitable counterpart of Node
+    """
+
+
+def _wrap(worker: SessionWorker, value: Any) -> Any:
+    """
+    wraps objects bound to the session worker into their async counterparts
+    """
+    if isinstance(value, Window):
+        return AsyncWindow(worker, value)
+    elif isinstance(value, ShellTable):
+        return AsyncShellTable(worker, value)
+    elif isinstance(value, ShellTree):
+        return AsyncShellTree(worker, value)
+    elif isinstance(value, Node):
+        return AsyncNode(worker, value)
+    elif isinstance(value, list) and value and isinstance(value[0], Node):
+        return [AsyncNode(worker, node) for node in value]
+    elif inspect.isgenerator(value):
+        return AsyncIterator(worker, value)
+
+    return value
+
+
+class AsyncSapscript:
+    """
+    asyncio interface to SAP, every session gets its own worker thread
+
+    Calls of one session run one after another, calls of different sessions run in parallel.
+    """
+
+    def __init__(self, default_window_title: str = "SAP Easy Access", backend: Backend | None = None) -> None:
+        """
+        Args:
+            default_window_title (str): default SAP window title
+            backend (Backend | None): provides scripting engine, Pywin32Backend if None
+
+        Example:
+            ```
+            async with AsyncSapscript() as sapscript:
+                windows = [await sapscript.attach_window(0, s) for s in range(6)]
+                await asyncio.gather(*(w.start_transaction("SE16") for w in windows))
+            ```
+        """
+        self.sapscript = Sapscript(default_window_title, backend=backend)
+        self._workers: dict[tuple[int, int], SessionWorker] = {}
+
+    def __repr__(self) -> str:
+        return f"AsyncSapscript(default_window_title={self.sapscript.default_window_title})"
+
+    def __str__(self) -> str:
+        return f"AsyncSapscript(default_window_title={self.sapscript.default_window_title})"
+
+    async def __aenter__(self) -> "AsyncSapscript":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    async def launch_sap(self,
+                         sid: str,
+                         client: str,
+                         user: str,
+                         password: str,
+                         *,
+                         root_sap_dir: Path = Path(r"C:\Program Files (x86)\SAP\FrontEnd\SAPgui"),
+                         maximise: bool = True,
+                         language: str = "en",
+                         timeout: int = 30,
+                         quit_auto: bool = True) -> None:
+        """
+        Launches SAP and waits for it to load, see Sapscript.launch_sap
+
+        Raises:
+            WindowDidNotAppearException: No SAP window appeared
+        """
+        await asyncio.to_thread(
+            self.sapscript.launch_sap,
+            sid,
+            client,
+            user,
+            password,
+            root_sap_dir=root_sap_dir,
+            maximise=maximise,
+            language=language,
+            timeout=timeout,
+            quit_auto=quit_auto,
+        )
+
+    async def attach_window(self, connection: int, session: int) -> AsyncWindow:
+        """
+        Attaches window by connection and session number ID in its own worker thread
+
+        Args:
+            connection (int): connection number
+            session (int): session number
+
+        Returns:
+            AsyncWindow: window attached
+
+        Raises:
+            AttributeError: wrong connection or session
+            AttachException: could not attach to SAP window
+
+        Example:
+            ```
+            main_window = await pss.attach_window(0, 0)
+            ```
+        """
+        worker = self._workers.get((connection, session))
+        if worker is None:
+            worker = SessionWorker(self.sapscript, connection, session)
+            self._workers[(connection, session)] = worker
+
+        try:
+            attached = await asyncio.wrap_future(worker.attach())
+
+        except Exception:
+            del self._workers[(connection, session)]
+            worker.shutdown(wait=False)
+            raise
+
+        return AsyncWindow(worker, attached)
+
+    async def quit(self) -> None:
+        """
+        Tries to close the sap normal way (from main window), then kills the process
+
+        Runs in the worker of the main window if it is attached, in a temporary worker otherwise
+        """
+        worker = self._workers.get((0, 0)) or next(iter(self._workers.values()), None)
+        if worker is not None:
+            await asyncio.wrap_future(worker.submit(worker.sapscript.quit))
+            return
+
+        worker = SessionWorker(self.sapscript, 0, 0)
+
+        try:
+            await asyncio.wrap_future(worker.submit(worker.sapscript.quit))
+
+        finally:
+            worker.shutdown(wait=False)
+
+    async def close(self) -> None:
+        """
+        Stops all session workers, SAP stays opened
+        """
+        workers = list(self._workers.values())
+        self._workers.clear()
+
+        await asyncio.gather(
+            *(asyncio.to_thread(worker.shutdown) for worker in workers)
+        )
@@ -0,0 +1,31 @@
+"""
+Scripting backends - where Sapscript gets the SAP GUI scripting engine from
+
+Pywin32Backend and SimulatedBackend are the backends. Remote access is not a backend:
+RemoteClient (pysapscript.remote) drives a RemoteServer, which runs Sapscript with its own
+backend on the SAP GUI machine. Remote failures raise RemoteException, which is not part
+of scripting_errors().
+"""
+
+from functools import cache
+
+from .base import Backend, Handle
+from .pywin32 import Pywin32Backend
+from .simulated import SimulatedBackend
+from pysapscript.types_.exceptions import ScriptingError
+
+
+@cache
+def scripting_errors() -> tuple[type[Exception], ...]:
+    """
+    Errors a failed scripting call can raise with any available backend, for use in except clauses,
+    RemoteException of pysapscript.remote is not included
+
+    Returns:
+        tuple[type[Exception], ...]: ScriptingError, and COM error when pywin32 is installed
+    """
+    try:
+        return (ScriptingError, *Pywin32Backend().errors)
+
+    except ImportError:
+        return (ScriptingError,)
@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+Handle = Any
+"""
+Handle of a scripting object - application, connection, session or element
+
+Handles implement the SAP GUI Scripting API (findById, Children, Text, press, ...),
+whatever backend provides them - pywin32 CDispatch, simulated or recorded object.
+"""
+
+
+class Backend(ABC):
+    """
+    Provides the SAP GUI scripting engine to Sapscript
+
+    The engine (GuiApplication) leads to connections, sessions and elements through
+    the Scripting API itself, so a backend only has to connect, prepare worker threads
+    and name the errors its handles raise.
+    """
+
+    name: str = ""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    @abstractmethod
+    def connect(self) -> Handle:
+        """
+        Connects to the scripting engine, called in the thread that uses the handles
+
+        Returns:
+            Handle: GuiApplication
+        """
+
+    @property
+    @abstractmethod
+    def errors(self) -> tuple[type[Exception], ...]:
+        """
+        Errors raised by handles of this backend when a scripting call fails
+        """
+
+    def thread_init(self) -> None:
+        """
+        Prepares a worker thread before it connects, e.g. initializes COM
+        """
+
+    def thread_close(self) -> None:
+        """
+        Releases what thread_init prepared, runs in the same thread
+        """
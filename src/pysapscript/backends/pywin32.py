@@ -0,0 +1,30 @@
+from pysapscript.backends.base import Backend, Handle
+
+
+class Pywin32Backend(Backend):
+    """
+    SAP GUI for Windows through COM with pywin32, the default backend
+    """
+
+    name = "pywin32"
+
+    def connect(self) -> Handle:
+        import win32com.client
+
+        return win32com.client.GetObject("SAPGUI").GetScriptingEngine
+
+    @property
+    def errors(self) -> tuple[type[Exception], ...]:
+        from win32com.universal import com_error
+
+        return (com_error,)
+
+    def thread_init(self) -> None:
+        import pythoncom
+
+        pythoncom.CoInitialize()
+
+    def thread_close(self) -> None:
+        import pythoncom
+
+        pythoncom.CoUninitialize()
@@ -0,0 +1,37 @@
+from typing import Any
+
+from pysapscript.backends.base import Backend, Handle
+from pysapscript.types_.exceptions import ScriptingError
+
+
+class SimulatedBackend(Backend):
+    """
+    In-process engine - SimulatedSapGui, or any object providing GetScriptingEngine like ReplaySapGui
+    """
+
+    name = "simulated"
+
+    def __init__(self, sap_gui: Any = None) -> None:
+        """
+        Args:
+            sap_gui (Any): engine, new SimulatedSapGui if None
+        """
+        if sap_gui is None:
+            from pysapscript.simulated import SimulatedSapGui
+
+            sap_gui = SimulatedSapGui()
+
+        self.sap_gui = sap_gui
+
+    def __repr__(self) -> str:
+        return f"SimulatedBackend({self.sap_gui!r})"
+
+    def __str__(self) -> str:
+        return f"SimulatedBackend({self.sap_gui})"
+
+    def connect(self) -> Handle:
+        return self.sap_gui.GetScriptingEngine
+
+    @property
+    def errors(self) -> tuple[type[Exception], ...]:
+        return (ScriptingError,)
@@ -0,0 +1,160 @@
+from dataclasses import dataclass, field
+from concurrent.futures import Future
+from typing import Callable, TYPE_CHECKING
+
+import polars as pl
+
+from pysapscript import window
+from pysapscript.shell_table import ShellTable
+from pysapscript.session_worker import SessionWorker
+from pysapscript.types_ import exceptions
+
+if TYPE_CHECKING:
+    from pysapscript.pysapscript import Sapscript
+
+
+# (connection, session) pair, or system ID with optional client, e.g. "SQ4" or "SQ4/012"
+Target = tuple[int, int] | str
+
+
+@dataclass
+class FanOutResult:
+    """
+    Combined result of fan_out, failed targets are in errors
+    """
+    data: pl.DataFrame
+    sources: list[str] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+
+def fan_out(
+    sapscript: "Sapscript",
+    targets: list[Target],
+    read_function: Callable[[window.Window], ShellTable | pl.DataFrame],
+    source_column: str = "source",
+) -> FanOutResult:
+    """
+    Runs the same extraction on many sessions or systems at once and unions the results
+
+    Every target runs in its own session worker. Rows are tagged with
+    the source system as "SID/client", columns missing in some results are filled with nulls.
+    A result whose columns cannot be unioned with the results before it is reported in errors.
+
+    Args:
+        sapscript (Sapscript): sapscript object used to attach sessions
+        targets (list[Target]): (connection, session) pairs or system IDs, system ID uses the first session of its connection
+        read_function (Callable): takes Window and returns ShellTable or polars DataFrame
+        source_column (str): name of the column with the source system
+
+    Returns:
+        FanOutResult: combined data, successful sources and errors by target
+
+    Raises:
+        ValueError: a target is listed twice
+
+    Example:
+        ```
+        def read_lfa1(window: Window) -> ShellTable:
+            window.start_transaction("SE16")
+            ...
+            return window.read_shell_table("wnd[0]/usr/cntlGRID1/shellcont/shell")
+
+        result = fan_out(pss, ["SQ4", "SQ8", (2, 0)], read_lfa1)
+        result.data.group_by("source").len()
+        result.errors  # {"SQ8": AttachException(...)}
+        ```
+    """
+    labels = [_label(target) for target in targets]
+    duplicates = list(dict.fromkeys(label for label in labels if labels.count(label) > 1))
+    if duplicates:
+        raise ValueError(f"Targets listed more than once: {', '.join(duplicates)}")
+
+    result = FanOutResult(data=pl.DataFrame())
+    workers: dict[tuple[int, int], SessionWorker] = {}
+    pending: dict[str, Future] = {}
+
+    for label, target in zip(labels, targets):
+        try:
+            key = _resolve(sapscript, target)
+
+        except Exception as ex:
+            result.errors[label] = ex
+            continue
+
+        if key not in workers:
+            workers[key] = SessionWorker(sapscript, *key)
+
+        pending[label] = workers[key].submit(_extract, workers[key], read_function, source_column)
+
+    data: pl.DataFrame | None = None
+    for label, future in pending.items():
+        try:
+            source, frame = future.result()
+            # unioned one by one, so a result with incompatible column types does not discard the others
+            data = frame if data is None else pl.concat([data, frame], how="diagonal_relaxed")
+            result.sources.append(source)
+
+        except Exception as ex:
+            result.errors[label] = ex
+
+    for worker in workers.values():
+        worker.shutdown(wait=False)
+
+    if data is not None:
+        result.data = data
+
+    return result
+
+
+def _label(target: Target) -> str:
+    """
+    readable name of a target
+    """
+    if isinstance(target, str):
+        return target
+
+    return f"{target[0]}/{target[1]}"
+
+
+def _resolve(sapscript: "Sapscript", target: Target) -> tuple[int, int]:
+    """
+    finds (connection, session) pair of a target
+    """
+    if not isinstance(target, str):
+        return target
+
+    system, _, client = target.partition("/")
+    connections = sapscript._get_application().Children
+
+    for connection in range(connections.Count):
+        sessions = connections(connection).Children
+        if sessions.Count == 0:
+            continue
+
+        first = sessions(0)
+        info = first.Info
+        if info.SystemName == system and (not client or info.Client == client):
+            return connection, sapscript._session_number(first)
+
+    raise exceptions.AttachException(f"No connection to system {target}!")
+
+
+def _extract(
+    worker: SessionWorker,
+    read_function: Callable[[window.Window], ShellTable | pl.DataFrame],
+    source_column: str,
+) -> tuple[str, pl.DataFrame]:
+    """
+    runs read_function in the session worker, returns tagged data
+    """
+    attached = worker._attach()
+    info = attached._session_handle.Info
+    source = f"{info.SystemName}/{info.Client}"
+
+    table = read_function(attached)
+    if isinstance(table, ShellTable):
+        frame = table.data
+    else:
+        frame = table
+
+    return source, frame.with_columns(pl.lit(source).alias(source_column))
@@ -0,0 +1,218 @@
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Literal
+
+from pysapscript.utils.handle_proxy import HandleProxy
+
+
+@dataclass
+class ComCallEvent:
+    """
+    One COM operation - property get, property set or method call
+    """
+    element: str
+    operation: str
+    kind: str
+    duration: float
+    ok: bool
+    error: str | None = None
+
+
+Sink = Callable[[ComCallEvent], None]
+
+
+class InstrumentedHandle(HandleProxy):
+    """
+    COM handle that sends ComCallEvent of every operation to a sink
+    """
+
+    __slots__ = ("_sink",)
+
+    def __init__(self, handle: Any, element: str, sink: Sink) -> None:
+        """
+        Args:
+            handle (Any): wrapped COM handle
+            element (str): element ID the handle belongs to
+            sink (Callable[[ComCallEvent], None]): receives events, e.g. InMemoryAggregator
+        """
+        super().__init__(handle, element)
+        object.__setattr__(self, "_sink", sink)
+
+    def _spawn(self, handle: Any, element: str) -> "InstrumentedHandle":
+        return InstrumentedHandle(handle, element, self._sink)
+
+    def _on_operation(
+        self,
+        kind: str,
+        name: str,
+        args: tuple,
+        result: Any,
+        error: Exception | None,
+        duration: float,
+    ) -> None:
+        element = str(args[0]) if name.lower() == "findbyid" and args else self._element
+
+        self._sink(
+            ComCallEvent(
+                element=element,
+                operation=name,
+                kind=kind,
+                duration=duration,
+                ok=error is None,
+                error=None if error is None else str(error),
+            )
+        )
+
+
+def instrument(handle: Any, element: str, sink: Sink | None) -> Any:
+    """
+    Wraps handle by InstrumentedHandle, unwraps it when sink is None
+
+    Args:
+        handle (Any): COM handle, instrumented or not
+        element (str): element ID the handle belongs to
+        sink (Callable[[ComCallEvent], None] | None): receives events, None turns instrumentation off
+
+    Returns:
+        Any: handle to use
+    """
+    if isinstance(handle, InstrumentedHandle):
+        handle = handle._handle
+
+    if sink is None or handle is None:
+        return handle
+
+    return InstrumentedHandle(handle, element, sink)
+
+
+@dataclass
+class CallStats:
+    """
+    Aggregated durations of one operation or one element and operation, in seconds
+    """
+    key: str
+    count: int
+    errors: int
+    total: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+
+
+class InMemoryAggregator:
+    """
+    Collects ComCallEvent durations in memory, percentiles are computed on request
+
+    Example:
+        ```
+        aggregator = InMemoryAggregator()
+        pss.instrument(aggregator)
+        ...
+        for stats in aggregator.stats(by="element")[:10]:
+            print(stats)
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._durations: dict[tuple[str, str], list[float]] = {}
+        self._errors: dict[tuple[str, str], int] = {}
+
+    def __repr__(self) -> str:
+        return f"InMemoryAggregator(calls={self.count})"
+
+    def __str__(self) -> str:
+        return f"InMemoryAggregator(calls={self.count})"
+
+    def __call__(self, event: ComCallEvent) -> None:
+        key = (event.element, event.operation)
+
+        with self._lock:
+            durations = self._durations.get(key)
+            if durations is None:
+                durations = self._durations[key] = []
+
+            durations.append(event.duration)
+
+            if not event.ok:
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+    @property
+    def count(self) -> int:
+        """
+        Number of collected events
+        """
+        with self._lock:
+            return sum(len(d) for d in self._durations.values())
+
+    def reset(self) -> None:
+        """
+        Drops collected events
+        """
+        with self._lock:
+            self._durations.clear()
+            self._errors.clear()
+
+    def counts(self) -> dict[str, int]:
+        """
+        Gets number of calls by operation
+
+        Returns:
+            dict[str, int]: operation and number of calls
+        """
+        counts: dict[str, int] = {}
+
+        with self._lock:
+            for (_, operation), durations in self._durations.items():
+                counts[operation] = counts.get(operation, 0) + len(durations)
+
+        return counts
+
+    def stats(self, by: Literal["operation", "element"] = "operation") -> list[CallStats]:
+        """
+        Gets statistics grouped by operation, or by element and operation
+
+        Args:
+            by (Literal): operation or element
+
+        Returns:
+            list[CallStats]: statistics, slowest total first
+        """
+        grouped: dict[str, list[float]] = {}
+        errors: dict[str, int] = {}
+
+        with self._lock:
+            for (element, operation), durations in self._durations.items():
+                key = operation if by == "operation" else f"{element} {operation}"
+                grouped.setdefault(key, []).extend(durations)
+                errors[key] = errors.get(key, 0) + self._errors.get((element, operation), 0)
+
+        result = []
+        for key, durations in grouped.items():
+            durations.sort()
+            total = sum(durations)
+
+            result.append(
+                CallStats(
+                    key=key,
+                    count=len(durations),
+                    errors=errors[key],
+                    total=total,
+                    mean=total / len(durations),
+                    p50=_percentile(durations, 50),
+                    p95=_percentile(durations, 95),
+                    p99=_percentile(durations, 99),
+                )
+            )
+
+        return sorted(result, key=lambda s: s.total, reverse=True)
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    """
+    nearest-rank percentile of sorted values
+    """
+    rank = max(1, -(-len(ordered) * percent // 100))
+
+    return ordered[int(rank) - 1]
@@ -0,0 +1,556 @@
+import os
+import json
+import time
+import socket
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Literal
+
+from pysapscript import window
+
+
+JobStatus = Literal["queued", "running", "done", "failed"]
+
+
+@dataclass
+class QueuedJob:
+    """
+    A job stored in JobQueue, params and result must be JSON serializable
+    """
+    id: int
+    name: str
+    params: dict[str, Any]
+    priority: int = 0
+    status: JobStatus = "queued"
+    attempts: int = 0
+    max_attempts: int = 1
+    worker: str | None = None
+    lease_until: float | None = None
+    result: Any = None
+    error: str | None = None
+
+
+class JobQueue(ABC):
+    """
+    Durable queue shared by worker processes, jobs are claimed atomically with a lease
+
+    A job whose lease expired (its worker crashed) is queued again on the next claim.
+    """
+
+    @abstractmethod
+    def put(self, name: str, params: dict[str, Any] | None = None, *, priority: int = 0, max_attempts: int = 1) -> int:
+        """
+        Adds job to the queue
+
+        Args:
+            name (str): name of the handler that runs the job
+            params (dict | None): JSON serializable parameters of the job
+            priority (int): lower value is claimed first, default 0
+            max_attempts (int): number of attempts before the job is failed, default 1
+
+        Returns:
+            int: job id
+        """
+
+    @abstractmethod
+    def claim(self, worker: str, lease_seconds: float = 300) -> QueuedJob | None:
+        """
+        Claims the next queued job
+
+        Args:
+            worker (str): worker id
+            lease_seconds (float): seconds the job stays claimed without heartbeat
+
+        Returns:
+            QueuedJob | None: claimed job, None if queue is empty
+        """
+
+    @abstractmethod
+    def heartbeat(self, job_id: int, worker: str, lease_seconds: float = 300) -> bool:
+        """
+        Extends lease of a running job
+
+        Returns:
+            bool: False if the job is no longer leased by the worker
+        """
+
+    @abstractmethod
+    def complete(self, job_id: int, worker: str, result: Any = None) -> bool:
+        """
+        Marks running job as done
+
+        Returns:
+            bool: False if the job is no longer leased by the worker
+        """
+
+    @abstractmethod
+    def fail(self, job_id: int, worker: str, error: str) -> bool:
+        """
+        Marks running job as failed, or queues it again while attempts are left
+
+        Returns:
+            bool: False if the job is no longer leased by the worker
+        """
+
+    @abstractmethod
+    def requeue_expired(self) -> int:
+        """
+        Queues again running jobs with expired lease, fails them when no attempts are left
+
+        Returns:
+            int: number of jobs queued again
+        """
+
+    @abstractmethod
+    def get(self, job_id: int) -> QueuedJob | None:
+        """
+        Gets job by id
+
+        Returns:
+            QueuedJob | None: job, None if not found
+        """
+
+    @abstractmethod
+    def counts(self) -> dict[str, int]:
+        """
+        Gets number of jobs by status
+
+        Returns:
+            dict[str, int]: status and number of jobs
+        """
+
+
+class SQLiteJobQueue(JobQueue):
+    """
+    JobQueue stored in a SQLite file, the file can be shared by processes on one host
+
+    SQLite locking is not reliable over network file systems (SMB, NFS),
+    do not share the file between hosts.
+    """
+
+    def __init__(self, path: Path | str, timeout: float = 30) -> None:
+        """
+        Args:
+            path (Path | str): database file, created if missing
+            timeout (float): seconds to wait for a lock held by other worker
+
+        Example:
+            ```
+            queue = SQLiteJobQueue("jobs.sqlite")
+            queue.put("read_vendor", {"vendor": "100001"}, max_attempts=3)
+            ```
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                params TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL DEFAULT 1,
+                worker TEXT,
+                lease_until REAL,
+                result TEXT,
+                error TEXT
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, priority, id)"
+        )
+
+    def __repr__(self) -> str:
+        return f"SQLiteJobQueue(path={self.path})"
+
+    def __str__(self) -> str:
+        return f"SQLiteJobQueue(path={self.path})"
+
+    def close(self) -> None:
+        """
+        Closes database connection
+        """
+        self._connection.close()
+
+    def put(self, name: str, params: dict[str, Any] | None = None, *, priority: int = 0, max_attempts: int = 1) -> int:
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO jobs (name, params, priority, max_attempts) VALUES (?, ?, ?, ?)",
+                (name, json.dumps(params or {}), priority, max_attempts),
+            )
+
+            return int(cursor.lastrowid or 0)
+
+    def claim(self, worker: str, lease_seconds: float = 300) -> QueuedJob | None:
+        self.requeue_expired()
+
+        with self._lock, self._transaction():
+            row = self._connection.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' ORDER BY priority, id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._connection.execute(
+                "UPDATE jobs SET status = 'running', worker = ?, lease_until = ?, attempts = attempts + 1 "
+                "WHERE id = ?",
+                (worker, time.time() + lease_seconds, row["id"]),
+            )
+
+            return self._read(row["id"])
+
+    def heartbeat(self, job_id: int, worker: str, lease_seconds: float = 300) -> bool:
+        with self._lock:
+            cursor = self._connection.execute(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND worker = ? AND status = 'running'",
+                (time.time() + lease_seconds, job_id, worker),
+            )
+
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker: str, result: Any = None) -> bool:
+        with self._lock:
+            cursor = self._connection.execute(
+                "UPDATE jobs SET status = 'done', result = ?, error = NULL, lease_until = NULL "
+                "WHERE id = ? AND worker = ? AND status = 'running'",
+                (json.dumps(result), job_id, worker),
+            )
+
+            return cursor.rowcount == 1
+
+    def fail(self, job_id: int, worker: str, error: str) -> bool:
+        with self._lock:
+            cursor = self._connection.execute(
+                "UPDATE jobs SET error = ?, lease_until = NULL, "
+                "status = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END "
+                "WHERE id = ? AND worker = ? AND status = 'running'",
+                (error, job_id, worker),
+            )
+
+            return cursor.rowcount == 1
+
+    def requeue_expired(self) -> int:
+        with self._lock, self._transaction():
+            now = time.time()
+            self._connection.execute(
+                "UPDATE jobs SET status = 'failed', error = 'Lease expired', lease_until = NULL "
+                "WHERE status = 'running' AND lease_until < ? AND attempts >= max_attempts",
+                (now,),
+            )
+            cursor = self._connection.execute(
+                "UPDATE jobs SET status = 'queued', error = 'Lease expired', lease_until = NULL "
+                "WHERE status = 'running' AND lease_until < ?",
+                (now,),
+            )
+
+            return cursor.rowcount
+
+    def get(self, job_id: int) -> QueuedJob | None:
+        with self._lock:
+            return self._read(job_id)
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT status, COUNT(*) AS count FROM jobs GROUP BY status"
+            ).fetchall()
+
+            return {row["status"]: row["count"] for row in rows}
+
+    def _transaction(self) -> "_ImmediateTransaction":
+        """
+        write transaction that locks the database for other workers right away
+        """
+        return _ImmediateTransaction(self._connection)
+
+    def _read(self, job_id: int) -> QueuedJob | None:
+        """
+        reads job row
+        """
+        row = self._connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        return QueuedJob(
+            id=row["id"],
+            name=row["name"],
+            params=json.loads(row["params"]),
+            priority=row["priority"],
+            status=row["status"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            worker=row["worker"],
+            lease_until=row["lease_until"],
+            result=json.loads(row["result"]) if row["result"] is not None else None,
+            error=row["error"],
+        )
+
+
+class _ImmediateTransaction:
+    """
+    BEGIN IMMEDIATE ... COMMIT, rolled back on error
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def __enter__(self) -> None:
+        self._connection.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type: type | None, *_: Any) -> None:
+        if exc_type is None:
+            self._connection.execute("COMMIT")
+        else:
+            self._connection.execute("ROLLBACK")
+
+
+class MemoryJobQueue(JobQueue):
+    """
+    JobQueue held in memory of one process, stand-in for SQLiteJobQueue in tests
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._jobs: dict[int, QueuedJob] = {}
+
+    def __repr__(self) -> str:
+        return f"MemoryJobQueue(jobs={len(self._jobs)})"
+
+    def __str__(self) -> str:
+        return f"MemoryJobQueue(jobs={len(self._jobs)})"
+
+    def put(self, name: str, params: dict[str, Any] | None = None, *, priority: int = 0, max_attempts: int = 1) -> int:
+        with self._lock:
+            job_id = len(self._jobs) + 1
+            self._jobs[job_id] = QueuedJob(
+                id=job_id,
+                name=name,
+                params=json.loads(json.dumps(params or {})),
+                priority=priority,
+                max_attempts=max_attempts,
+            )
+
+            return job_id
+
+    def claim(self, worker: str, lease_seconds: float = 300) -> QueuedJob | None:
+        self.requeue_expired()
+
+        with self._lock:
+            queued = [j for j in self._jobs.values() if j.status == "queued"]
+            if not queued:
+                return None
+
+            job = min(queued, key=lambda j: (j.priority, j.id))
+            job.status = "running"
+            job.worker = worker
+            job.lease_until = time.time() + lease_seconds
+            job.attempts += 1
+
+            return replace(job)
+
+    def heartbeat(self, job_id: int, worker: str, lease_seconds: float = 300) -> bool:
+        with self._lock:
+            job = self._leased(job_id, worker)
+            if job is None:
+                return False
+
+            job.lease_until = time.time() + lease_seconds
+            return True
+
+    def complete(self, job_id: int, worker: str, result: Any = None) -> bool:
+        with self._lock:
+            job = self._leased(job_id, worker)
+            if job is None:
+                return False
+
+            job.result = json.loads(json.dumps(result))
+            job.status = "done"
+            job.error = None
+            job.lease_until = None
+            return True
+
+    def fail(self, job_id: int, worker: str, error: str) -> bool:
+        with self._lock:
+            job = self._leased(job_id, worker)
+            if job is None:
+                return False
+
+            job.status = "queued" if job.attempts < job.max_attempts else "failed"
+            job.error = error
+            job.lease_until = None
+            return True
+
+    def requeue_expired(self) -> int:
+        with self._lock:
+            now = time.time()
+            requeued = 0
+
+            for job in self._jobs.values():
+                if job.status != "running" or job.lease_until is None or job.lease_until >= now:
+                    continue
+
+                job.error = "Lease expired"
+                job.lease_until = None
+
+                if job.attempts < job.max_attempts:
+                    job.status = "queued"
+                    requeued += 1
+                else:
+                    job.status = "failed"
+
+            return requeued
+
+    def get(self, job_id: int) -> QueuedJob | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return replace(job) if job is not None else None
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            counts: dict[str, int] = {}
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+
+            return counts
+
+    def _leased(self, job_id: int, worker: str) -> QueuedJob | None:
+        """
+        gets running job leased by the worker
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.status != "running" or job.worker != worker:
+            return None
+
+        return job
+
+
+class QueueWorker:
+    """
+    Claims jobs from JobQueue and runs them with a Window, one job at a time
+
+    Lease of the running job is renewed from a background thread every third of lease_seconds,
+    so a job may run longer than its lease without being claimed again by another worker.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        attached_window: window.Window,
+        handlers: dict[str, Callable[..., Any]],
+        worker_id: str | None = None,
+        lease_seconds: float = 300,
+    ) -> None:
+        """
+        Args:
+            queue (JobQueue): queue to claim jobs from
+            attached_window (Window): window the jobs run in
+            handlers (dict[str, Callable]): job name and handler, called as handler(window, **params)
+            worker_id (str | None): worker id, host name and process id if None
+            lease_seconds (float): seconds a claimed job is reserved for this worker, renewed while it runs
+
+        Example:
+            ```
+            worker = QueueWorker(queue, pss.attach_window(0, 0), {"read_vendor": read_vendor})
+            worker.run()
+            ```
+        """
+        self.queue = queue
+        self.window = attached_window
+        self.handlers = handlers
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{attached_window.session}"
+        self.lease_seconds = lease_seconds
+
+    def __repr__(self) -> str:
+        return f"QueueWorker(worker_id={self.worker_id}, queue={self.queue})"
+
+    def __str__(self) -> str:
+        return f"QueueWorker(worker_id={self.worker_id}, queue={self.queue})"
+
+    def run_once(self) -> QueuedJob | None:
+        """
+        Claims and runs one job, result or error is written back to the queue
+
+        Returns:
+            QueuedJob | None: finished job, None if queue is empty
+        """
+        job = self.queue.claim(self.worker_id, self.lease_seconds)
+        if job is None:
+            return None
+
+        handler = self.handlers.get(job.name)
+
+        try:
+            with _LeaseRenewal(self.queue, job.id, self.worker_id, self.lease_seconds):
+                if handler is None:
+                    raise KeyError(f"No handler for job {job.name}")
+
+                result = handler(self.window, **job.params)
+
+            # result is serialized here, a result that is not JSON serializable fails the job
+            self.queue.complete(job.id, self.worker_id, result)
+
+        except Exception as ex:
+            self.queue.fail(job.id, self.worker_id, f"{type(ex).__name__}: {ex}")
+
+        return self.queue.get(job.id)
+
+    def run(self, poll_interval: float = 1, stop_when_empty: bool = False) -> int:
+        """
+        Runs jobs until stopped, waits poll_interval seconds when queue is empty
+
+        Args:
+            poll_interval (float): seconds to wait when no job is queued
+            stop_when_empty (bool): returns when queue is empty if True
+
+        Returns:
+            int: number of jobs run
+        """
+        jobs_run = 0
+
+        while True:
+            job = self.run_once()
+
+            if job is not None:
+                jobs_run += 1
+                continue
+
+            if stop_when_empty:
+                return jobs_run
+
+            time.sleep(poll_interval)
+
+
+class _LeaseRenewal:
+    """
+    extends lease of a running job from a background thread until the block ends
+    """
+
+    def __init__(self, queue: JobQueue, job_id: int, worker: str, lease_seconds: float) -> None:
+        self._queue = queue
+        self._job_id = job_id
+        self._worker = worker
+        self._lease_seconds = lease_seconds
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._renew, name=f"pysapscript-lease-{job_id}", daemon=True)
+
+    def __enter__(self) -> None:
+        self._thread.start()
+
+    def __exit__(self, *_: Any) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _renew(self) -> None:
+        while not self._stopped.wait(self._lease_seconds / 3):
+            if not self._queue.heartbeat(self._job_id, self._worker, self._lease_seconds):
+                return
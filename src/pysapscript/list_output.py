@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, TYPE_CHECKING
+
+from pysapscript.backends.base import Handle
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+# text elements of a list, ID holds column and row - wnd[0]/usr/lbl[12,3]
+_LIST_ELEMENT_ID = re.compile(r"/(?:lbl|txt)\[(\d+),(\d+)\]$")
+
+# characters of frame and separator lines
+_SEPARATOR_CHARACTERS = "-_=|+ "
+
+
+@dataclass
+class ListLabel:
+    """
+    Text chunk of a list line, left is the character column
+    """
+    left: int
+    text: str
+
+    @property
+    def right(self) -> int:
+        return self.left + len(self.text)
+
+
+@dataclass
+class ListLine:
+    """
+    Line of a list, number counts from the first line of the whole list
+    """
+    number: int
+    labels: list[ListLabel]
+
+    @property
+    def text(self) -> str:
+        """
+        Line text with labels at their columns
+        """
+        line = ""
+        for label in self.labels:
+            line = line.ljust(label.left) + label.text
+
+        return line
+
+    @property
+    def is_separator(self) -> bool:
+        """
+        True for empty lines and lines drawn from frame characters only
+        """
+        return all(not label.text.strip(_SEPARATOR_CHARACTERS) for label in self.labels)
+
+
+class ListColumns:
+    """
+    Columns of a list reconstructed from character positions of labels
+    """
+
+    def __init__(self, names: list[str], lefts: list[int], rights: list[int]) -> None:
+        """
+        Args:
+            names (list[str]): column names
+            lefts (list[int]): first character column of each column
+            rights (list[int]): character column after each column
+        """
+        self.names = names
+        self.lefts = lefts
+        self.rights = rights
+
+    def __repr__(self) -> str:
+        return f"ListColumns(names={self.names})"
+
+    def __str__(self) -> str:
+        return f"ListColumns(names={self.names})"
+
+    @classmethod
+    def from_header(cls, header: ListLine) -> "ListColumns":
+        """
+        Columns named and placed by labels of the header line
+        """
+        names: list[str] = []
+        for label in header.labels:
+            name = label.text.strip(_SEPARATOR_CHARACTERS)
+            names.append(name if name not in names else f"{name}_{label.left}")
+
+        return cls(names, [label.left for label in header.labels], [label.right for label in header.labels])
+
+    @classmethod
+    def from_positions(cls, lines: Iterable[ListLine]) -> "ListColumns":
+        """
+        Columns by distinct label positions, named col_<left>
+        """
+        rights: dict[int, int] = {}
+        for line in lines:
+            for label in line.labels:
+                rights[label.left] = max(rights.get(label.left, 0), label.right)
+
+        lefts = sorted(rights)
+
+        return cls([f"col_{left}" for left in lefts], lefts, [rights[left] for left in lefts])
+
+    def row(self, line: ListLine) -> dict[str, str | None]:
+        """
+        Assigns labels of the line to columns, labels sharing a column are joined by space
+
+        Label belongs to the column it overlaps most, left or right aligned values overlap their heading.
+        Label overlapping no column belongs to the nearest one.
+        """
+        row: dict[str, str | None] = dict.fromkeys(self.names)
+
+        for label in line.labels:
+            text = label.text.strip("|").strip()
+            if not text:
+                continue
+
+            name = self.names[self._column_of(label)]
+            row[name] = text if row[name] is None else f"{row[name]} {text}"
+
+        return row
+
+    def _column_of(self, label: ListLabel) -> int:
+        overlaps = [min(label.right, right) - max(label.left, left) for left, right in zip(self.lefts, self.rights)]
+        best = max(range(len(overlaps)), key=overlaps.__getitem__)
+        if overlaps[best] > 0:
+            return best
+
+        gaps = [max(left - label.right, label.left - right) for left, right in zip(self.lefts, self.rights)]
+
+        return min(range(len(gaps)), key=gaps.__getitem__)
+
+
+def iter_list_lines(session_handle: Handle, root: str = "wnd[0]/usr") -> Iterator[ListLine]:
+    """
+    Reads lines of a list page by page, each page in one traversal of the user area
+
+    Pages are changed by the vertical scrollbar of root, which is found again after each scroll.
+    Lines shown again on the last page are read once.
+
+    Args:
+        session_handle (Handle): SAP session handle
+        root (str): user area with the list
+
+    Yields:
+        ListLine: non empty lines in list order
+    """
+    user_area = session_handle.findById(root)
+    scrollbar = user_area.VerticalScrollbar
+    maximum = scrollbar.Maximum
+    page_size = scrollbar.PageSize
+    position = 0
+    last_number = -1
+
+    if scrollbar.Position != position:
+        scrollbar.Position = position
+        user_area = session_handle.findById(root)
+
+    while True:
+        for row, labels in sorted(_read_page(user_area).items()):
+            if position + row > last_number:
+                last_number = position + row
+                yield ListLine(last_number, sorted(labels, key=lambda label: label.left))
+
+        if position >= maximum or page_size <= 0:
+            return
+
+        position = min(position + page_size, maximum)
+        user_area.VerticalScrollbar.Position = position
+        user_area = session_handle.findById(root)
+
+
+def iter_list_rows(
+    session_handle: Handle,
+    root: str = "wnd[0]/usr",
+    header: int | None = 0,
+) -> Iterator[dict[str, str | None]]:
+    """
+    Reads rows of a list page by page, columns are reconstructed from label positions
+
+    Separator lines are skipped, so are repetitions of the header on later pages.
+
+    Args:
+        session_handle (Handle): SAP session handle
+        root (str): user area with the list
+        header (int | None): index of the header line among non separator lines, lines before it are skipped,
+            None for lists without header - columns are then named col_<left> and the whole list is read first
+
+    Yields:
+        dict[str, str | None]: text by column name, None for empty cells
+    """
+    lines = (line for line in iter_list_lines(session_handle, root) if not line.is_separator)
+
+    if header is None:
+        read_lines = list(lines)
+        columns = ListColumns.from_positions(read_lines)
+        yield from (columns.row(line) for line in read_lines)
+        return
+
+    for index, header_line in enumerate(lines):
+        if index == header:
+            break
+    else:
+        return
+
+    columns = ListColumns.from_header(header_line)
+    for line in lines:
+        if line.text != header_line.text:
+            yield columns.row(line)
+
+
+def read_list_output(session_handle: Handle, root: str = "wnd[0]/usr", header: int | None = 0) -> pl.DataFrame:
+    """
+    Reads the whole list into a DataFrame, see iter_list_rows()
+
+    Returns:
+        polars.DataFrame: one row per list line, all columns are strings
+    """
+    import polars as pl
+
+    rows = list(iter_list_rows(session_handle, root, header))
+    if not rows:
+        return pl.DataFrame()
+
+    return pl.DataFrame(rows, schema={name: pl.String for name in rows[0]})
+
+
+def _read_page(user_area: Handle) -> dict[int, list[ListLabel]]:
+    """
+    reads text elements of the visible page by row
+    """
+    children = user_area.Children
+    rows: dict[int, list[ListLabel]] = {}
+
+    for i in range(children.Count):
+        child = children(i)
+        match = _LIST_ELEMENT_ID.search(child.Id)
+        if match is None:
+            continue
+
+        left, row = int(match.group(1)), int(match.group(2))
+        rows.setdefault(row, []).append(ListLabel(left, child.Text))
+
+    return rows
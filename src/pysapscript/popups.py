@@ -0,0 +1,156 @@
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, TYPE_CHECKING
+
+from pysapscript import screen
+
+from pysapscript.backends.base import Handle
+
+if TYPE_CHECKING:
+    from pysapscript.window import Window
+
+
+# text carrying types of a popup user area
+_TEXT_TYPES = ("GuiLabel", "GuiTextField", "GuiTextedit")
+
+# popups handled in a row after one action, stops handlers that do not close their popup
+MAX_HANDLED_POPUPS = 10
+
+
+@dataclass
+class Popup:
+    """
+    Popup window opened over the main window, text is read on first access
+    """
+    id: str
+    title: str
+    _session_handle: Handle = field(repr=False, compare=False)
+
+    @cached_property
+    def text(self) -> str:
+        """
+        Texts of labels and text fields in the popup, one per line
+        """
+        snapshot = screen.read_screen(self._session_handle, f"{self.id}/usr")
+
+        return "\n".join(e.text for e in snapshot.elements if e.type in _TEXT_TYPES and e.text)
+
+
+@dataclass
+class PopupHandler:
+    """
+    Matches popup window and handles it, all given criteria must match
+
+    Args:
+        title (str | None): part of the popup title, case insensitive
+        text (str | None): part of the popup text, case insensitive
+        element (str | None): element that must exist in popup, relative to it, e.g. "usr/btnSPOP-OPTION1"
+        press (str | None): element to press, relative to popup, e.g. "tbar[0]/btn[0]"
+        action (Callable[[Window, Popup], None] | None): called with window and popup before press
+        capture (bool): stores popup text in the popup log if True
+        name (str): name of the handler in the popup log
+
+    Example:
+        ```
+        PopupHandler(title="Information", press="tbar[0]/btn[0]", capture=True, name="confirm info")
+        ```
+    """
+    title: str | None = None
+    text: str | None = None
+    element: str | None = None
+    press: str | None = None
+    action: "Callable[[Window, Popup], None] | None" = None
+    capture: bool = False
+    name: str = ""
+
+    def matches(self, popup: Popup) -> bool:
+        """
+        Checks whether the handler matches popup, cheap criteria are checked first
+
+        Args:
+            popup (Popup): popup window
+
+        Returns:
+            bool: True if all criteria match
+        """
+        if self.title is not None and self.title.casefold() not in popup.title.casefold():
+            return False
+
+        if self.element is not None:
+            try:
+                popup._session_handle.findById(f"{popup.id}/{self.element}")
+
+            except Exception:
+                return False
+
+        if self.text is not None and self.text.casefold() not in popup.text.casefold():
+            return False
+
+        return True
+
+
+@dataclass
+class HandledPopup:
+    """
+    Record of a popup handled by PopupHandler, text is None unless captured
+    """
+    handler: str
+    id: str
+    title: str
+    text: str | None = None
+    error: str | None = None
+
+
+def handle_popups(attached_window: "Window", handlers: list[PopupHandler]) -> list[HandledPopup]:
+    """
+    Handles popups opened over the main window, costs one call when no popup is opened
+
+    Args:
+        attached_window (Window): window to check
+        handlers (list[PopupHandler]): handlers, the first matching one handles the popup
+
+    Returns:
+        list[HandledPopup]: handled popups
+    """
+    session_handle = attached_window._session_handle
+    handled: list[HandledPopup] = []
+
+    for _ in range(MAX_HANDLED_POPUPS):
+        windows_count = session_handle.Children.Count
+        if windows_count < 2:
+            break
+
+        popup_id = f"wnd[{windows_count - 1}]"
+        popup = Popup(
+            id=popup_id,
+            title=session_handle.findById(popup_id).Text,
+            _session_handle=session_handle,
+        )
+
+        handler = next((h for h in handlers if h.matches(popup)), None)
+        if handler is None:
+            break
+
+        record = HandledPopup(
+            handler=handler.name,
+            id=popup.id,
+            title=popup.title,
+            text=popup.text if handler.capture else None,
+        )
+        handled.append(record)
+
+        try:
+            if handler.action is not None:
+                handler.action(attached_window, popup)
+
+            if handler.press is not None:
+                session_handle.findById(f"{popup.id}/{handler.press}").press()
+
+        except Exception as ex:
+            record.error = str(ex)
+            break
+
+        if session_handle.Children.Count >= windows_count:
+            break
+
+    return handled
@@ -1,20 +1,40 @@
+from __future__ import annotations
+
+import copy
+import re
 import time
 import atexit
 from pathlib import Path
 from subprocess import Popen
-
-import win32com.client
+from typing import Any
 
 from pysapscript import window
+from pysapscript import session_pool
+from pysapscript import popups
+from pysapscript import instrumentation
+from pysapscript import recording
 from pysapscript.utils import utils
 from pysapscript.types_ import exceptions
+from pysapscript.backends import Backend, Handle, Pywin32Backend, SimulatedBackend
+
+
+# session number at the end of session ID - /app/con[0]/ses[2]
+_SESSION_NUMBER = re.compile(r"ses\[(\d+)\]$")
 
 
 class Sapscript:
-    def __init__(self, default_window_title: str = "SAP Easy Access") -> None:
+    def __init__(
+        self,
+        default_window_title: str = "SAP Easy Access",
+        sap_gui_auto: Any = None,
+        backend: Backend | None = None,
+    ) -> None:
         """
         Args:
             default_window_title (str): default SAP window title
+            sap_gui_auto (Any): object used instead of GetObject("SAPGUI"), e.g. SimulatedSapGui for tests,
+                shortcut for backend=SimulatedBackend(sap_gui_auto)
+            backend (Backend | None): provides scripting engine, Pywin32Backend if None
 
         Example:
             sapscript = Sapscript()
@@ -22,9 +42,15 @@ class Sapscript:
             main_window.write("wnd[0]/tbar[0]/okcd", "ZLOGON")
             main_window.press("wnd[0]/tbar[0]/btn[0]")
         """
-        self._sap_gui_auto = None
+        if backend is None:
+            backend = SimulatedBackend(sap_gui_auto) if sap_gui_auto is not None else Pywin32Backend()
+
+        self.backend = backend
         self._application = None
         self.default_window_title = default_window_title
+        self.popup_handlers: list[popups.PopupHandler] = []
+        self.instrumentation: instrumentation.Sink | None = None
+        self.recorder: recording.Recorder | None = None
 
     def __repr__(self) -> str:
         return f"Sapscript(default_window_title={self.default_window_title})"
@@ -107,7 +133,8 @@ class Sapscript:
         Attaches window by connection and session number ID
 
         Connection starts with 0 and is +1 for each client
-        Session start with 0 and is +1 for each new window opened
+        Session start with 0 and is +1 for each new window opened,
+        the number is the one in session ID (ses[n]) and does not change when other sessions close
 
         Args:
             connection (int): connection number
@@ -131,20 +158,14 @@ class Sapscript:
         if not isinstance(session, int):
             raise AttributeError("Wrong session argument!")
 
-        if not isinstance(self._sap_gui_auto, win32com.client.CDispatch):
-            self._sap_gui_auto = win32com.client.GetObject("SAPGUI")
-
-        if not isinstance(self._application, win32com.client.CDispatch):
-            self._application = self._sap_gui_auto.GetScriptingEngine
-
         try:
-            connection_handle = self._application.Children(connection)
+            connection_handle = self._get_application().Children(connection)
 
         except Exception:
             raise exceptions.AttachException("Could not attach connection %s!" % connection)
 
         try:
-            session_handle = connection_handle.Children(session)
+            session_handle = connection_handle.findById(f"ses[{session}]")
 
         except Exception:
             raise exceptions.AttachException("Could not attach session %s!" % session)
@@ -154,18 +175,97 @@ class Sapscript:
             connection_handle=connection_handle,
             session=session,
             session_handle=session_handle,
+            popup_handlers=self.popup_handlers,
         )
 
-    def open_new_window(self, window_to_handle_opening: window.Window) -> None:
+    def add_popup_handler(self, handler: popups.PopupHandler) -> None:
+        """
+        Registers popup handler for all windows attached by this object
+
+        Args:
+            handler (PopupHandler): popup handler
+
+        Example:
+            ```
+            pss.add_popup_handler(PopupHandler(title="Information", press="tbar[0]/btn[0]"))
+            ```
+        """
+        self.popup_handlers.append(handler)
+
+    def instrument(self, sink: instrumentation.Sink | None) -> None:
+        """
+        Reports every COM call of windows attached from now on, None turns reporting off
+
+        Args:
+            sink (Callable[[ComCallEvent], None] | None): receives events, e.g. InMemoryAggregator
+
+        Example:
+            ```
+            aggregator = InMemoryAggregator()
+            pss.instrument(aggregator)
+            main_window = pss.attach_window(0, 0)
+            ...
+            print(aggregator.stats())
+            ```
+        """
+        self.instrumentation = sink
+
+    def record(self, recorder: recording.Recorder | None) -> None:
+        """
+        Records every COM call of windows attached from now on, None turns recording off
+
+        The recording can be replayed offline by ReplaySapGui
+
+        Args:
+            recorder (Recorder | None): writes calls to its file
+
+        Example:
+            ```
+            with Recorder("run.jsonl.gz") as recorder:
+                pss.record(recorder)
+                main_window = pss.attach_window(0, 0)
+                ...
+
+            pss = Sapscript(sap_gui_auto=ReplaySapGui("run.jsonl.gz"))
+            ```
+        """
+        self.recorder = recorder
+
+    def list_sessions(self) -> list[tuple[int, int]]:
+        """
+        Lists all opened sessions of all connections
+
+        Returns:
+            list[tuple[int, int]]: (connection, session) pairs, usable with attach_window
+
+        Example:
+            ```
+            for connection, session in pss.list_sessions():
+                window = pss.attach_window(connection, session)
+            ```
+        """
+        connections = self._get_application().Children
+        sessions = []
+
+        for connection in range(connections.Count):
+            for session_handle in self._session_handles(connections(connection)):
+                sessions.append((connection, self._session_number(session_handle)))
+
+        return sessions
+
+    def open_new_window(self, window_to_handle_opening: window.Window, timeout: int = 30) -> window.Window:
         """
         Opens new sap window
 
         SAP must be already launched and window that is not busy must be available
-        Warning, as of now, this method will not wait for window to appear if any
-        other window is opened and has the default windows title
+        The new session is recognized by its ID, that was not present before opening
 
         Args:
             window_to_handle_opening: idle SAP window that will be used to open new window
+            timeout (int): timeout in seconds to wait for the new session to appear
+
+        Returns:
+            window.Window: the new window
 
         Raises:
             WindowDidNotAppearException: no SAP window appeared
@@ -173,12 +273,101 @@ class Sapscript:
         Example:
             ```
             main_window = pss.attach_window(0, 0)
-            pss.open_new_window(main_window)
+            new_window = pss.open_new_window(main_window)
             ```
         """
+        connection_handle = window_to_handle_opening._connection_handle
+        known_ids = {handle.Id for handle in self._session_handles(connection_handle)}
+
         window_to_handle_opening._session_handle.createSession()
 
-        utils.wait_for_window_title(self.default_window_title)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            for session_handle in self._session_handles(connection_handle):
+                if session_handle.Id in known_ids or session_handle.Busy:
+                    continue
+
+                return window.Window(
+                    connection=window_to_handle_opening.connection,
+                    connection_handle=connection_handle,
+                    session=self._session_number(session_handle),
+                    session_handle=session_handle,
+                    popup_handlers=self.popup_handlers,
+                )
+
+            time.sleep(0.2)
+
+        raise exceptions.WindowDidNotAppearException(
+            "New session did not appear within %s seconds!" % timeout
+        )
+
+    def session_pool(self, size: int, connection: int = 0) -> session_pool.SessionPool:
+        """
+        Creates pool of sessions of one connection, that can be leased one by one
+
+        Sessions already opened on the connection are used first,
+        missing ones are created up to size, max 6 sessions per connection
+
+        Args:
+            size (int): number of sessions in the pool
+            connection (int): connection number
+
+        Returns:
+            SessionPool: pool of sessions
+
+        Raises:
+            ValueError: size out of allowed range
+            AttachException: could not attach to SAP window
+
+        Example:
+            ```
+            pool = pss.session_pool(4)
+            with pool.lease() as window:
+                window.start_transaction("SE16")
+            ```
+        """
+        return session_pool.SessionPool(self, size, connection)
+
+    def _get_application(self) -> Handle:
+        """
+        gets SAP scripting engine, connects to it on first use
+        """
+        if self._application is None:
+            self._application = self.backend.connect()
+
+        application = self._application
+        if self.recorder is not None:
+            application = recording.record(application, "app", self.recorder)
+
+        if self.instrumentation is not None:
+            application = instrumentation.instrument(application, "app", self.instrumentation)
+
+        return application
+
+    @staticmethod
+    def _session_handles(connection_handle: Handle) -> list[Handle]:
+        """
+        lists handles of all sessions of the connection
+        """
+        sessions = connection_handle.Children
+
+        return [sessions(i) for i in range(sessions.Count)]
+
+    @staticmethod
+    def _session_number(session_handle: Handle) -> int:
+        """
+        number of session from its ID, ses[2] -> 2
+        """
+        return int(_SESSION_NUMBER.search(session_handle.Id).group(1))
+
+    def _copy_for_thread(self) -> "Sapscript":
+        """
+        copy of sapscript without handles, COM handles cannot be shared between threads
+        """
+        sapscript = copy.copy(self)
+        sapscript._application = None
+
+        return sapscript
 
     def _launch(self, working_dir: Path, sid: str, client: str, 
                 user: str, password: str, maximise: bool, language: str, timeout: int = 30) -> None:
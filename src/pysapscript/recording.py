@@ -0,0 +1,455 @@
+import gzip
+import json
+import base64
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+from pysapscript.utils.handle_proxy import HandleProxy
+from pysapscript.types_ import exceptions
+
+
+FORMAT = "pysapscript-recording"
+VERSION = 1
+
+# kinds of operations as stored in the recording
+_KINDS = {"get": "g", "set": "s", "call": "c"}
+
+
+class Recorder:
+    """
+    Writes COM operations - element, operation, arguments, result, error and duration -
+    to a gzipped JSON lines file, one operation per line
+
+    Element labels are stored once and referenced by number, so long recordings stay compact.
+
+    Example:
+        ```
+        with Recorder("se16_run.jsonl.gz") as recorder:
+            pss.record(recorder)
+            main_window = pss.attach_window(0, 0)
+            ...
+        ```
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Args:
+            path (str | Path): file to write, overwritten if it exists
+        """
+        self.path = Path(path)
+        self.operations = 0
+        self._labels: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._file = gzip.open(self.path, "wt", encoding="utf-8")
+        self._write({"format": FORMAT, "version": VERSION, "created": time.time()})
+
+    def __repr__(self) -> str:
+        return f"Recorder(path={self.path}, operations={self.operations})"
+
+    def __str__(self) -> str:
+        return f"Recorder(path={self.path}, operations={self.operations})"
+
+    def __enter__(self) -> "Recorder":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Flushes and closes the file, operations done later are not recorded
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def add(
+        self,
+        element: str,
+        kind: str,
+        name: str,
+        args: tuple,
+        result: Any,
+        result_labels: list[str],
+        error: Exception | None,
+        duration: float,
+    ) -> None:
+        """
+        Writes one operation, called by RecordingHandle
+
+        Args:
+            element (str): label of the handle the operation was done on
+            kind (str): get, set or call
+            name (str): property or method name
+            args (tuple): arguments, the value for set
+            result (Any): returned value
+            result_labels (list[str]): label of handles in result, one per item for __iter__
+            error (Exception | None): raised error
+            duration (float): duration in seconds
+        """
+        with self._lock:
+            if self._file.closed:
+                return
+
+            self._write(
+                [
+                    self._label(element),
+                    _KINDS[kind],
+                    name,
+                    [_encode(a, None) for a in args],
+                    None if error is not None else self._encode_result(name, result, result_labels),
+                    None if error is None else [type(error).__name__, str(error)],
+                    round(duration * 1_000_000),
+                ]
+            )
+            self.operations += 1
+
+    def _label(self, element: str) -> int:
+        """
+        number of element label, label is written on first use
+        """
+        number = self._labels.get(element)
+
+        if number is None:
+            number = self._labels[element] = len(self._labels)
+            self._write(["L", number, element])
+
+        return number
+
+    def _encode_result(self, name: str, value: Any, labels: list[str]) -> Any:
+        """
+        encodes result, handles get the label of the operation or of their position when iterated
+        """
+        if name == "__iter__":
+            return [_encode(item, lambda label=label: self._label(label)) for item, label in zip(value, labels)]
+
+        return _encode(value, lambda: self._label(labels[0]))
+
+    def _write(self, line: Any) -> None:
+        self._file.write(json.dumps(line, ensure_ascii=False, separators=(",", ":")))
+        self._file.write("\n")
+
+
+class RecordingHandle(HandleProxy):
+    """
+    COM handle that writes every operation to a Recorder
+
+    Returned handles are labelled by the path they were reached by,
+    e.g. app.Children(0).Children(0).findById('wnd[0]/usr/txtRSYST-BNAME')
+    """
+
+    __slots__ = ("_recorder",)
+
+    def __init__(self, handle: Any, element: str, recorder: Recorder) -> None:
+        """
+        Args:
+            handle (Any): wrapped COM handle
+            element (str): label of the handle
+            recorder (Recorder): receives operations
+        """
+        super().__init__(handle, element)
+        object.__setattr__(self, "_recorder", recorder)
+
+    def _spawn(self, handle: Any, element: str) -> "RecordingHandle":
+        return RecordingHandle(handle, element, self._recorder)
+
+    def _child_element(self, kind: str, name: str, args: tuple) -> str:
+        arguments = ", ".join(repr(a) for a in args)
+
+        if name == "__call__":
+            return f"{self._element}({arguments})"
+
+        if name in ("__getitem__", "__iter__"):
+            return f"{self._element}[{arguments}]"
+
+        if kind == "get":
+            return f"{self._element}.{name}"
+
+        return f"{self._element}.{name}({arguments})"
+
+    def _on_operation(
+        self,
+        kind: str,
+        name: str,
+        args: tuple,
+        result: Any,
+        error: Exception | None,
+        duration: float,
+    ) -> None:
+        if name == "__iter__" and error is None:
+            labels = [self._child_element(kind, name, (i,)) for i in range(len(result))]
+        else:
+            labels = [self._child_element(kind, name, args)]
+
+        self._recorder.add(self._element, kind, name, args, result, labels, error, duration)
+
+
+def record(handle: Any, element: str, recorder: Recorder | None) -> Any:
+    """
+    Wraps handle by RecordingHandle, unwraps it when recorder is None
+
+    Args:
+        handle (Any): COM handle, recorded or not
+        element (str): label of the handle, replay starts from it
+        recorder (Recorder | None): receives operations, None turns recording off
+
+    Returns:
+        Any: handle to use
+    """
+    if isinstance(handle, RecordingHandle):
+        handle = handle._handle
+
+    if recorder is None or handle is None:
+        return handle
+
+    return RecordingHandle(handle, element, recorder)
+
+
+class ReplaySapGui:
+    """
+    Serves a recording made by Recorder instead of SAP GUI, offline and deterministic
+
+    In strict mode operations must come in the recorded order, any other operation raises ReplayException.
+    Otherwise results are looked up by element, operation and arguments - repeated operations get
+    the recorded results in order and the last one repeats, so code doing fewer calls replays as well.
+    Recorded errors are raised as ScriptingError, AttributeError stays AttributeError.
+
+    Example:
+        ```
+        pss = pysapscript.Sapscript(sap_gui_auto=ReplaySapGui("se16_run.jsonl.gz"))
+        main_window = pss.attach_window(0, 0)
+        ```
+    """
+
+    def __init__(self, path: str | Path, strict: bool = False, speed: float = 0.0) -> None:
+        """
+        Args:
+            path (str | Path): recording
+            strict (bool): operations must come in the recorded order if True
+            speed (float): recorded durations are waited multiplied by speed, 0 does not wait, 1 is real time
+        """
+        self.path = Path(path)
+        self.strict = strict
+        self.speed = speed
+        self._lock = threading.Lock()
+        self._labels: list[str] = []
+        self._records: list[tuple[tuple[str, str, str, str], Any, list | None, float]] = []
+        self._by_key: dict[tuple[str, str, str, str], list[int]] = {}
+        self._served: dict[tuple[str, str, str, str], int] = {}
+        self._methods: set[tuple[str, str]] = set()
+        self._position = 0
+        self._load()
+
+    def __repr__(self) -> str:
+        return f"ReplaySapGui(path={self.path}, operations={len(self._records)})"
+
+    def __str__(self) -> str:
+        return f"ReplaySapGui(path={self.path}, operations={len(self._records)})"
+
+    @property
+    def GetScriptingEngine(self) -> "ReplayHandle":
+        return self.handle("app")
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of recorded operations not replayed yet in strict mode
+        """
+        return len(self._records) - self._position
+
+    def handle(self, element: str) -> "ReplayHandle":
+        """
+        Gets handle of a recorded element, e.g. "ses[0]" of a recording made by Window.record()
+
+        Args:
+            element (str): label of the element
+
+        Returns:
+            ReplayHandle: handle serving recorded operations
+
+        Raises:
+            ReplayException: element is not in the recording
+        """
+        if element not in self._labels:
+            raise exceptions.ReplayException(f"Element {element} is not in recording {self.path}")
+
+        return ReplayHandle(self, element)
+
+    def take(self, element: str, kind: str, name: str, args: tuple) -> Any:
+        """
+        Serves recorded result of an operation, called by ReplayHandle
+
+        Raises:
+            ReplayException: operation was not recorded
+        """
+        key = (element, _KINDS[kind], name, json.dumps([_encode(a, None) for a in args]))
+
+        with self._lock:
+            index = self._next_strict(key) if self.strict else self._next_keyed(key)
+
+        _, result, error, duration = self._records[index]
+
+        if self.speed:
+            time.sleep(duration * self.speed)
+
+        if error is not None:
+            if error[0] == "AttributeError":
+                raise AttributeError(error[1])
+
+            raise exceptions.ScriptingError(error[1])
+
+        return self._decode(result)
+
+    def is_method(self, element: str, name: str) -> bool:
+        """
+        Checks whether name was called on element as a method
+        """
+        return (element, name) in self._methods
+
+    def _next_strict(self, key: tuple[str, str, str, str]) -> int:
+        if self._position >= len(self._records):
+            raise exceptions.ReplayException(f"Recording ended, got {_describe(key)}")
+
+        expected = self._records[self._position][0]
+        if expected != key:
+            raise exceptions.ReplayException(f"Expected {_describe(expected)}, got {_describe(key)}")
+
+        self._position += 1
+
+        return self._position - 1
+
+    def _next_keyed(self, key: tuple[str, str, str, str]) -> int:
+        indexes = self._by_key.get(key)
+        if indexes is None:
+            raise exceptions.ReplayException(f"Operation was not recorded: {_describe(key)}")
+
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+
+        return indexes[min(served, len(indexes) - 1)]
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as file:
+            header = json.loads(file.readline() or "{}")
+            if header.get("format") != FORMAT or header.get("version") != VERSION:
+                raise exceptions.ReplayException(f"{self.path} is not a pysapscript recording of version {VERSION}")
+
+            for line in file:
+                record = json.loads(line)
+
+                if record[0] == "L":
+                    self._labels.append(record[2])
+                    continue
+
+                element, kind, name, args, result, error, duration = record
+                key = (self._labels[element], kind, name, json.dumps(args))
+
+                self._by_key.setdefault(key, []).append(len(self._records))
+                self._records.append((key, result, error, duration / 1_000_000))
+
+                if kind == "c":
+                    self._methods.add((self._labels[element], name))
+
+    def _decode(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self._decode(v) for v in value]
+
+        if isinstance(value, dict):
+            if "h" in value:
+                return ReplayHandle(self, self._labels[value["h"]])
+            if "t" in value:
+                return tuple(self._decode(v) for v in value["t"])
+            if "b" in value:
+                return base64.b64decode(value["b"])
+            if "d" in value:
+                return {k: self._decode(v) for k, v in value["d"].items()}
+
+        return value
+
+
+class ReplayHandle:
+    """
+    Stands in for a recorded COM handle, every operation is served by ReplaySapGui
+    """
+
+    __slots__ = ("_replay", "_element")
+
+    def __init__(self, replay: ReplaySapGui, element: str) -> None:
+        object.__setattr__(self, "_replay", replay)
+        object.__setattr__(self, "_element", element)
+
+    def __repr__(self) -> str:
+        return f"ReplayHandle({self._element})"
+
+    def __str__(self) -> str:
+        return f"ReplayHandle({self._element})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ReplayHandle) and other._element == self._element
+
+    def __hash__(self) -> int:
+        return hash(self._element)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+
+        if self._replay.is_method(self._element, name):
+            return lambda *args: self._replay.take(self._element, "call", name, args)
+
+        return self._replay.take(self._element, "get", name, ())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._replay.take(self._element, "set", name, (value,))
+
+    def __call__(self, *args: Any) -> Any:
+        return self._replay.take(self._element, "call", "__call__", args)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._replay.take(self._element, "call", "__getitem__", (key,))
+
+    def __len__(self) -> int:
+        return self._replay.take(self._element, "call", "__len__", ())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._replay.take(self._element, "call", "__iter__", ()))
+
+
+def _encode(value: Any, label: Any) -> Any:
+    """
+    encodes value to JSON, handles in results become {"h": label number} using label(),
+    handles in arguments become {"e": element}
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+
+    if isinstance(value, list):
+        return [_encode(v, label) for v in value]
+
+    if isinstance(value, tuple):
+        return {"t": [_encode(v, label) for v in value]}
+
+    if isinstance(value, bytes):
+        return {"b": base64.b64encode(value).decode("ascii")}
+
+    if isinstance(value, dict):
+        return {"d": {str(k): _encode(v, label) for k, v in value.items()}}
+
+    if label is not None:
+        return {"h": label()}
+
+    if isinstance(value, (HandleProxy, ReplayHandle)):
+        return {"e": value._element}
+
+    return {"r": repr(value)}
+
+
+def _describe(key: tuple[str, str, str, str]) -> str:
+    element, kind, name, args = key
+
+    return f"{element} {kind} {name} {args}"
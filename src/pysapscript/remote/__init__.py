@@ -0,0 +1,6 @@
+"""
+Remote worker - runs SAP GUI calls on the machine with SAP GUI, for clients on any other machine
+"""
+
+from .client import RemoteClient, RemoteResult, RemoteObject, RemoteWindow, RemoteShellTable, RemoteShellTree, RemoteNode
+from .server import RemoteServer
@@ -0,0 +1,393 @@
+"""
+Remote worker client - mirrors the Sapscript, Window, ShellTable and ShellTree API over a socket
+"""
+
+from __future__ import annotations
+
+import socket
+import weakref
+import builtins
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from pysapscript.remote import protocol
+from pysapscript.types_ import exceptions
+
+
+class RemoteClient:
+    """
+    Connects to RemoteServer, e.g. from Linux to the Windows machine running SAP GUI
+
+    Every call is one round trip, unless made inside batch(), which sends all calls
+    of the block in one message when the block ends.
+    """
+
+    def __init__(self, host: str, port: int, token: str | None = None, timeout: float | None = None) -> None:
+        """
+        Args:
+            host (str): host of the server
+            port (int): port of the server
+            token (str | None): shared secret configured on the server
+            timeout (float | None): socket timeout in seconds, None waits forever
+
+        Raises:
+            RemoteException: server refused the connection, e.g. invalid token
+
+        Example:
+            ```
+            client = RemoteClient("sap-vm-01", 8765, token="secret")
+            main_window = client.attach_window(0, 0)
+            main_window.start_transaction("SE16")
+            ```
+        """
+        self.host = host
+        self.port = port
+
+        self._socket = socket.create_connection((host, port), timeout=timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._lock = threading.RLock()
+        self._batch: list[tuple[dict[str, Any], RemoteResult]] | None = None
+        self._released: list[int] = []
+        self._members: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
+        self._next_id = 0
+
+        protocol.send_frame(self._socket, {"version": protocol.VERSION, "token": token})
+        welcome = protocol.recv_frame(self._socket)
+        if welcome is None or not welcome[0].get("ok"):
+            self._socket.close()
+            message = welcome[0].get("message") if welcome is not None else "Connection closed"
+            raise exceptions.RemoteException(f"Server refused connection: {message}")
+
+    def __repr__(self) -> str:
+        return f"RemoteClient(host={self.host}, port={self.port})"
+
+    def __str__(self) -> str:
+        return f"RemoteClient(host={self.host}, port={self.port})"
+
+    def __enter__(self) -> "RemoteClient":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the connection, the server releases all objects of this client
+        """
+        self._socket.close()
+
+    def attach_window(self, connection: int, session: int) -> "RemoteWindow":
+        """
+        Attaches window by connection and session number ID, see Sapscript.attach_window()
+
+        Args:
+            connection (int): connection number
+            session (int): session number
+
+        Returns:
+            RemoteWindow: window living in the server
+        """
+        return self._call("sapscript", "attach_window", (connection, session), {})
+
+    def list_sessions(self) -> list[tuple[int, int]]:
+        """
+        Lists all opened sessions of all connections, see Sapscript.list_sessions()
+
+        Returns:
+            list[tuple[int, int]]: (connection, session) pairs
+        """
+        return self._call("sapscript", "list_sessions", (), {})
+
+    def open_new_window(self, window_to_handle_opening: "RemoteWindow", timeout: int = 30) -> "RemoteWindow":
+        """
+        Opens new sap window, see Sapscript.open_new_window()
+
+        Args:
+            window_to_handle_opening (RemoteWindow): idle window used to open the new one
+            timeout (int): timeout in seconds to wait for the new session to appear
+
+        Returns:
+            RemoteWindow: the new window
+        """
+        return self._call("sapscript", "open_new_window", (window_to_handle_opening,), {"timeout": timeout})
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Sends all calls made in the block as one message when the block ends
+
+        Calls return RemoteResult, its value is available after the block.
+        Operations after a failed one are not run, the first error is raised at the end of the block.
+
+        Raises:
+            RuntimeError: batches cannot be nested
+
+        Example:
+            ```
+            with client.batch():
+                main_window.write("wnd[0]/usr/txtMATNR", "M-01")
+                main_window.write("wnd[0]/usr/txtWERKS", "1000")
+                main_window.press("wnd[0]/tbar[1]/btn[8]")
+                status = main_window.read_status()
+
+            print(status.value)
+            ```
+        """
+        with self._lock:
+            if self._batch is not None:
+                raise RuntimeError("Batches cannot be nested")
+
+            self._batch = []
+            try:
+                yield
+
+            finally:
+                queued, self._batch = self._batch, None
+
+            results = self._send([op for op, _ in queued])
+            for (_, result), answer in zip(queued, results):
+                result._resolve(answer)
+
+            for _, result in queued:
+                result._raise_error()
+
+    def _call(self, target: int | str, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        return self._queue_or_send({"target": target, "method": method}, args, kwargs)
+
+    def _get(self, target: int, name: str) -> Any:
+        return self._queue_or_send({"target": target, "get": name}, (), {})
+
+    def _queue_or_send(self, op: dict[str, Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """
+        queues operation inside batch, otherwise sends it and returns its value
+        """
+        blobs: list[bytes] = []
+        if args:
+            op["args"] = protocol.encode(list(args), blobs, _refuse)
+
+        if kwargs:
+            op["kwargs"] = protocol.encode(kwargs, blobs, _refuse)
+
+        if blobs:
+            raise TypeError("Data frames cannot be sent to the server")
+
+        with self._lock:
+            if self._batch is not None:
+                result = RemoteResult()
+                self._batch.append((op, result))
+
+                return result
+
+            result = RemoteResult()
+            result._resolve(self._send([op])[0])
+
+            return result.value
+
+    def _send(self, ops: list[dict[str, Any]]) -> list[tuple[str, Any]]:
+        """
+        sends operations in one message, decodes answers to ("value" | "error" | "skipped", payload)
+        """
+        with self._lock:
+            self._next_id += 1
+            header: dict[str, Any] = {"id": self._next_id, "ops": ops}
+            if self._released:
+                header["release"], self._released = self._released, []
+
+            protocol.send_frame(self._socket, header)
+            frame = protocol.recv_frame(self._socket)
+            if frame is None:
+                raise exceptions.RemoteException("Server closed the connection")
+
+            response, blobs = frame
+
+            answers: list[tuple[str, Any]] = []
+            for result in response["results"]:
+                if "value" in result:
+                    answers.append(("value", protocol.decode(result["value"], blobs, self._proxy)))
+
+                elif "error" in result:
+                    answers.append(("error", _error(result["error"], result["message"])))
+
+                else:
+                    answers.append(("skipped", exceptions.RemoteException("Skipped, previous operation failed")))
+
+            return answers
+
+    def _proxy(self, reference: dict[str, Any]) -> "RemoteObject":
+        """
+        creates proxy of object living in the server, released there once garbage collected here
+        """
+        kind = reference["type"]
+        if "methods" in reference:
+            self._members[kind] = (frozenset(reference["methods"]), frozenset(reference["attributes"]))
+
+        methods, attributes = self._members[kind]
+        proxy = _PROXY_TYPES.get(kind, RemoteObject)(self, reference["$ref"], kind, methods, attributes)
+        weakref.finalize(proxy, self._released.append, reference["$ref"])
+
+        return proxy
+
+
+class RemoteResult:
+    """
+    Value of a call made inside RemoteClient.batch(), available once the batch is sent
+    """
+
+    def __init__(self) -> None:
+        self._state: str | None = None
+        self._payload: Any = None
+
+    def __repr__(self) -> str:
+        return f"RemoteResult(state={self._state})"
+
+    def __str__(self) -> str:
+        return f"RemoteResult(state={self._state})"
+
+    @property
+    def done(self) -> bool:
+        """
+        True once the batch was sent
+        """
+        return self._state is not None
+
+    @property
+    def value(self) -> Any:
+        """
+        Returned value of the call
+
+        Raises:
+            RuntimeError: batch was not sent yet
+            Exception: error raised by the call in the server
+        """
+        if self._state is None:
+            raise RuntimeError("Result is available after the batch is sent")
+
+        self._raise_error()
+
+        return self._payload
+
+    def _resolve(self, answer: tuple[str, Any]) -> None:
+        self._state, self._payload = answer
+
+    def _raise_error(self) -> None:
+        if self._state in ("error", "skipped"):
+            raise self._payload
+
+
+class RemoteObject:
+    """
+    Proxy of an object living in the server, methods are called remotely
+
+    Attributes are read from the server on every access, use batch() to read many at once
+    """
+
+    def __init__(
+        self,
+        client: RemoteClient,
+        ref: int,
+        kind: str,
+        methods: frozenset[str],
+        attributes: frozenset[str],
+    ) -> None:
+        self._client = client
+        self._ref = ref
+        self._kind = kind
+        self._methods = methods
+        self._attributes = attributes
+
+    def __repr__(self) -> str:
+        return f"Remote{self._kind}(ref={self._ref})"
+
+    def __str__(self) -> str:
+        return f"Remote{self._kind}(ref={self._ref})"
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if name in self._attributes:
+            return self._client._get(self._ref, name)
+
+        if name not in self._methods:
+            raise AttributeError(f"{self._kind} has no attribute {name!r}")
+
+        def method(*args: Any, **kwargs: Any) -> Any:
+            return self._client._call(self._ref, name, args, kwargs)
+
+        method.__name__ = name
+
+        return method
+
+
+class RemoteWindow(RemoteObject):
+    """
+    Remote counterpart of Window, every method of Window is available
+
+    Example:
+        ```
+        main_window = client.attach_window(0, 0)
+        main_window.start_transaction("SE16")
+        table = main_window.read_shell_table("wnd[0]/usr/cntlGRID1/shellcont/shell")
+        frame = table.to_polars_dataframe()
+        ```
+    """
+
+
+class RemoteShellTable(RemoteObject):
+    """
+    Remote counterpart of ShellTable, to_polars_dataframe() streams the table as Arrow IPC
+    """
+
+    def __getitem__(self, item: object) -> dict[str, Any] | list[dict[str, Any]]:
+        return self._client._call(self._ref, "__getitem__", (item,), {})
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self._client._call(self._ref, "to_dicts", (), {}))
+
+
+class RemoteShellTree(RemoteObject):
+    """
+    Remote counterpart of ShellTree, indexing returns RemoteNode
+    """
+
+    def __len__(self) -> int:
+        return self._client._call(self._ref, "__len__", (), {})
+
+    def __getitem__(self, item: object) -> "list[RemoteNode] | RemoteNode":
+        return self._client._call(self._ref, "__getitem__", (item,), {})
+
+
+class RemoteNode(RemoteObject):
+    """
+    Remote counterpart of Node
+    """
+
+
+_PROXY_TYPES: dict[str, type[RemoteObject]] = {
+    "Window": RemoteWindow,
+    "ShellTable": RemoteShellTable,
+    "ShellTree": RemoteShellTree,
+    "Node": RemoteNode,
+}
+
+
+def _refuse(value: Any) -> dict[str, Any]:
+    """
+    proxies are sent as references, other objects cannot leave the client
+    """
+    if isinstance(value, RemoteObject):
+        return {"$ref": value._ref}
+
+    raise TypeError(f"{type(value).__name__} cannot be sent to the server")
+
+
+def _error(name: str, message: str) -> Exception:
+    """
+    rebuilds error raised in the server, pysapscript and builtin exceptions keep their type
+    """
+    error_type = getattr(exceptions, name, None) or getattr(builtins, name, None)
+    if isinstance(error_type, type) and issubclass(error_type, Exception):
+        return error_type(message)
+
+    return exceptions.RemoteException(f"{name}: {message}")
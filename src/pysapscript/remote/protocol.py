@@ -0,0 +1,242 @@
+"""
+Wire format of the remote worker
+
+Every message is one frame: 4 byte big-endian length of a JSON header, the header,
+then the binary blobs whose lengths the header lists under "blobs".
+Polars data frames travel as Arrow IPC stream blobs, so tables are not converted to JSON.
+
+Only types listed by _wire_types() are sent by name, decoding any other name fails,
+so a peer cannot make the other side construct or call arbitrary objects.
+
+Values are plain JSON, other types are tagged objects:
+    {"$tuple": [...]}                   tuple
+    {"$enum": "module:Name", ...}       enum member of pysapscript, e.g. NavigateAction
+    {"$dataclass": "module:Name", ...}  dataclass of pysapscript, e.g. StatusMessage
+    {"$arrow": 0, "pandas": false}      polars (or pandas) data frame in blob 0
+    {"$ref": 3, "type": "ShellTable"}   object living in the server, e.g. table or tree node
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import socket
+import struct
+import dataclasses
+from enum import Enum
+from functools import cache
+from typing import Any, Callable
+
+VERSION = 1
+MAX_FRAME_BYTES = 1 << 30
+
+_LENGTH = struct.Struct(">I")
+
+
+def send_frame(sock: socket.socket, header: dict[str, Any], blobs: list[bytes] | None = None) -> None:
+    """
+    Sends header and blobs as one frame
+
+    Args:
+        sock (socket.socket): connected socket
+        header (dict[str, Any]): JSON serializable header
+        blobs (list[bytes] | None): binary attachments, e.g. Arrow IPC streams
+    """
+    blobs = blobs or []
+    payload = json.dumps({**header, "blobs": [len(blob) for blob in blobs]}, separators=(",", ":")).encode()
+
+    sock.sendall(b"".join([_LENGTH.pack(len(payload)), payload, *blobs]))
+
+
+def recv_frame(sock: socket.socket) -> tuple[dict[str, Any], list[bytes]] | None:
+    """
+    Receives one frame
+
+    Args:
+        sock (socket.socket): connected socket
+
+    Returns:
+        tuple[dict[str, Any], list[bytes]] | None: header and blobs, None when the peer closed the connection
+
+    Raises:
+        ConnectionError: connection closed in the middle of a frame or frame too large
+    """
+    prefix = _recv_exact(sock, _LENGTH.size, allow_eof=True)
+    if prefix is None:
+        return None
+
+    header = json.loads(_recv_exact(sock, _check_size(_LENGTH.unpack(prefix)[0])))
+    blobs = [_recv_exact(sock, _check_size(size)) for size in header.pop("blobs", [])]
+
+    return header, blobs
+
+
+def encode(value: Any, blobs: list[bytes], reference: Callable[[Any], dict[str, Any]]) -> Any:
+    """
+    Converts value to its JSON form, data frames are appended to blobs
+
+    Args:
+        value (Any): value to send
+        blobs (list[bytes]): blobs of the frame being built
+        reference (Callable[[Any], dict[str, Any]]): converts objects that cannot be sent to {"$ref": ...}
+
+    Returns:
+        Any: JSON serializable value
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, list):
+        return [encode(item, blobs, reference) for item in value]
+
+    if isinstance(value, tuple):
+        return {"$tuple": [encode(item, blobs, reference) for item in value]}
+
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        return {key: encode(item, blobs, reference) for key, item in value.items()}
+
+    if isinstance(value, Enum) and _is_wire_type(type(value)):
+        return {"$enum": _type_name(type(value)), "value": value.value}
+
+    frame_type = type(value).__module__.split(".")[0]
+    if frame_type in ("polars", "pandas") and type(value).__name__ == "DataFrame":
+        return {"$arrow": _append_arrow(value, blobs), "pandas": frame_type == "pandas"}
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type) and _is_wire_type(type(value)):
+        fields = {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+        if not any(name.startswith("_") or callable(item) for name, item in fields.items()):
+            return {
+                "$dataclass": _type_name(type(value)),
+                "fields": {name: encode(item, blobs, reference) for name, item in fields.items()},
+            }
+
+    return reference(value)
+
+
+def decode(value: Any, blobs: list[bytes], dereference: Callable[[dict[str, Any]], Any]) -> Any:
+    """
+    Converts JSON form back to value
+
+    Args:
+        value (Any): received value
+        blobs (list[bytes]): blobs of the received frame
+        dereference (Callable[[dict[str, Any]], Any]): converts {"$ref": ...} to an object
+
+    Returns:
+        Any: decoded value
+
+    Raises:
+        ValueError: tagged type is not a wire type
+    """
+    if isinstance(value, list):
+        return [decode(item, blobs, dereference) for item in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    if "$ref" in value:
+        return dereference(value)
+
+    if "$tuple" in value:
+        return tuple(decode(item, blobs, dereference) for item in value["$tuple"])
+
+    if "$enum" in value:
+        return _wire_type(value["$enum"], enum=True)(value["value"])
+
+    if "$arrow" in value:
+        import polars as pl
+
+        frame = pl.read_ipc_stream(io.BytesIO(blobs[value["$arrow"]]))
+
+        return frame.to_pandas() if value.get("pandas") else frame
+
+    if "$dataclass" in value:
+        fields = {name: decode(item, blobs, dereference) for name, item in value["fields"].items()}
+
+        return _wire_type(value["$dataclass"], enum=False)(**fields)
+
+    return {key: decode(item, blobs, dereference) for key, item in value.items()}
+
+
+def _append_arrow(frame: Any, blobs: list[bytes]) -> int:
+    """
+    writes data frame as Arrow IPC stream to blobs, returns its index
+    """
+    import polars as pl
+
+    if not isinstance(frame, pl.DataFrame):
+        frame = pl.from_pandas(frame)
+
+    buffer = io.BytesIO()
+    frame.write_ipc_stream(buffer)
+    blobs.append(buffer.getvalue())
+
+    return len(blobs) - 1
+
+
+@cache
+def _wire_types() -> dict[str, type]:
+    """
+    dataclasses and enums sent by value, imported on first use to keep the client import light
+    """
+    from pysapscript import popups, screen, list_output, tree_loader
+    from pysapscript.types_ import types
+
+    wire_types = (
+        types.NavigateAction,
+        types.FieldResult,
+        types.StatusMessage,
+        screen.ScreenElement,
+        screen.ScreenSnapshot,
+        list_output.ListLabel,
+        list_output.ListLine,
+        popups.HandledPopup,
+        tree_loader.TreeLoadStats,
+    )
+
+    return {_type_name(cls): cls for cls in wire_types}
+
+
+def _is_wire_type(cls: type) -> bool:
+    return _wire_types().get(_type_name(cls)) is cls
+
+
+def _type_name(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _wire_type(name: Any, enum: bool) -> Any:
+    """
+    looks up type sent by name, refuses anything that is not a wire type of the tagged kind
+    """
+    cls = _wire_types().get(name) if isinstance(name, str) else None
+
+    if cls is None or (issubclass(cls, Enum) != enum) or (not enum and not dataclasses.is_dataclass(cls)):
+        raise ValueError(f"Refusing to decode type {name}")
+
+    return cls
+
+
+def _check_size(size: int) -> int:
+    if size > MAX_FRAME_BYTES:
+        raise ConnectionError(f"Frame of {size} bytes exceeds limit of {MAX_FRAME_BYTES} bytes")
+
+    return size
+
+
+def _recv_exact(sock: socket.socket, size: int, allow_eof: bool = False) -> Any:
+    """
+    reads exactly size bytes, None on clean end of stream when allowed
+    """
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = sock.recv(min(size - len(buffer), 1 << 20))
+        if not chunk:
+            if allow_eof and not buffer:
+                return None
+
+            raise ConnectionError("Connection closed in the middle of a frame")
+
+        buffer.extend(chunk)
+
+    return bytes(buffer)
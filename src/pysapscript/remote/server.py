@@ -0,0 +1,404 @@
+"""
+Remote worker server - exposes Window, ShellTable and ShellTree of one machine over a socket
+
+    python -m pysapscript.remote.server --host 0.0.0.0 --port 8765 --token secret
+"""
+
+from __future__ import annotations
+
+import hmac
+import inspect
+import argparse
+import ipaddress
+import threading
+import socketserver
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from pysapscript import pysapscript
+from pysapscript import window
+from pysapscript.session_worker import SessionWorker
+from pysapscript.remote import protocol
+
+# dunder methods the client proxies forward, e.g. tree[0] and len(tree)
+_ALLOWED_DUNDERS = ("__getitem__", "__len__")
+
+# methods of Sapscript reachable by the client
+_SAPSCRIPT_METHODS = ("attach_window", "list_sessions", "open_new_window")
+
+
+class RemoteServer:
+    """
+    Serves calls of RemoteClient, usually on the Windows machine that runs SAP GUI
+
+    Each request is a batch of operations answered by one message, so many field writes
+    cost one network round trip. Operations of a session run in its SessionWorker,
+    objects returned by them (tables, trees, nodes) stay in the server and the client
+    gets references. Data frames are sent as Arrow IPC streams.
+    """
+
+    def __init__(
+        self,
+        sapscript: "pysapscript.Sapscript",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        token: str | None = None,
+    ) -> None:
+        """
+        Args:
+            sapscript (Sapscript): sapscript the sessions are attached with, its backend and popup handlers are used
+            host (str): interface to listen on, 0.0.0.0 for all
+            port (int): port to listen on, 0 picks a free one
+            token (str | None): shared secret the clients must send, None allows any client and is
+                accepted only on a loopback host
+
+        Example:
+            ```
+            with RemoteServer(Sapscript(), host="0.0.0.0", port=8765, token="secret") as server:
+                server.serve_forever()
+            ```
+
+        Raises:
+            ValueError: host is not a loopback address and no token is set
+        """
+        if token is None and not _is_loopback(host):
+            raise ValueError(f"Token is required to listen on {host!r}, only loopback hosts are served without one")
+
+        self.sapscript = sapscript
+        self.token = token
+
+        self._workers: dict[tuple[int, int], SessionWorker] = {}
+        self._workers_lock = threading.Lock()
+        self._engine_sapscript = sapscript._copy_for_thread()
+        self._engine = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="pysapscript-remote",
+            initializer=self._engine_sapscript.backend.thread_init,
+        )
+
+        self._server = _TCPServer((host, port), _RequestHandler)
+        self._server.remote = self
+        self._thread: threading.Thread | None = None
+
+    def __repr__(self) -> str:
+        return f"RemoteServer(address={self.address})"
+
+    def __str__(self) -> str:
+        return f"RemoteServer(address={self.address})"
+
+    def __enter__(self) -> "RemoteServer":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.shutdown()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """
+        Host and port the server listens on
+        """
+        host, port = self._server.server_address[:2]
+
+        return str(host), int(port)
+
+    def start(self) -> "RemoteServer":
+        """
+        Serves clients in a background thread
+
+        Returns:
+            RemoteServer: self, for chaining
+
+        Example:
+            ```
+            server = RemoteServer(pss).start()
+            client = RemoteClient(*server.address)
+            ```
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="pysapscript-remote", daemon=True)
+            self._thread.start()
+
+        return self
+
+    def serve_forever(self) -> None:
+        """
+        Serves clients in the current thread until shutdown() is called from another one
+        """
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """
+        Stops serving and releases session workers
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self._server.server_close()
+
+        with self._workers_lock:
+            workers, self._workers = list(self._workers.values()), {}
+
+        for worker in workers:
+            worker.shutdown()
+
+        self._engine.submit(self._engine_sapscript.backend.thread_close)
+        self._engine.shutdown()
+
+    def _worker(self, connection: int, session: int) -> SessionWorker:
+        """
+        gets worker of the session, one per session shared by all clients
+        """
+        with self._workers_lock:
+            worker = self._workers.get((connection, session))
+            if worker is None:
+                worker = SessionWorker(self.sapscript, connection, session)
+                self._workers[(connection, session)] = worker
+
+        return worker
+
+    def _attach_window(self, connection: int, session: int) -> tuple[window.Window, SessionWorker]:
+        worker = self._worker(connection, session)
+
+        return worker.attach().result(), worker
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    remote: RemoteServer
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    """
+    One client connection, its references live as long as the connection
+    """
+
+    server: _TCPServer
+
+    def setup(self) -> None:
+        self.remote = self.server.remote
+        self.objects: dict[int, tuple[Any, SessionWorker | None]] = {}
+        self.known_types: set[type] = set()
+        self.next_id = 0
+
+    def handle(self) -> None:
+        if not self._handshake():
+            return
+
+        while (frame := protocol.recv_frame(self.request)) is not None:
+            header, blobs = frame
+
+            for ref in header.get("release", []):
+                self.objects.pop(ref, None)
+
+            out_blobs: list[bytes] = []
+            results = self._run_batch(header.get("ops", []), blobs, out_blobs)
+            protocol.send_frame(self.request, {"id": header.get("id"), "results": results}, out_blobs)
+
+    def _handshake(self) -> bool:
+        """
+        checks protocol version and token of the first frame
+        """
+        frame = protocol.recv_frame(self.request)
+        if frame is None:
+            return False
+
+        hello, _ = frame
+        token = self.remote.token
+        if hello.get("version") != protocol.VERSION:
+            error = f"Protocol version {hello.get('version')} not supported, server speaks {protocol.VERSION}"
+
+        elif token is not None and not hmac.compare_digest(str(hello.get("token")), token):
+            error = "Invalid token"
+
+        else:
+            protocol.send_frame(self.request, {"ok": True, "version": protocol.VERSION})
+            return True
+
+        protocol.send_frame(self.request, {"ok": False, "error": "RemoteException", "message": error})
+
+        return False
+
+    def _run_batch(self, ops: list[dict[str, Any]], blobs: list[bytes], out_blobs: list[bytes]) -> list[dict[str, Any]]:
+        """
+        runs operations in order, the ones after a failed one are skipped
+        """
+        results: list[dict[str, Any]] = []
+        failed = False
+
+        for op in ops:
+            if failed:
+                results.append({"skipped": True})
+                continue
+
+            try:
+                results.append({"value": self._run(op, blobs, out_blobs)})
+
+            except Exception as ex:
+                results.append({"error": type(ex).__name__, "message": str(ex)})
+                failed = True
+
+        return results
+
+    def _run(self, op: dict[str, Any], blobs: list[bytes], out_blobs: list[bytes]) -> Any:
+        """
+        runs one operation in the thread that owns its target
+        """
+        target = op["target"]
+        name = op.get("method") or op.get("get")
+        args = protocol.decode(op.get("args", []), blobs, self._dereference)
+        kwargs = protocol.decode(op.get("kwargs", {}), blobs, self._dereference)
+
+        if target == "sapscript":
+            return self._run_sapscript(name, op, args, kwargs, out_blobs)
+
+        obj, worker = self._lookup(target)
+        if name.startswith("_") and name not in _ALLOWED_DUNDERS:
+            raise AttributeError(f"{type(obj).__name__}.{name} is not accessible remotely")
+
+        if "get" in op:
+            def call() -> Any:
+                return getattr(obj, name)
+
+        else:
+            method = getattr(obj, name)
+
+            def call() -> Any:
+                return method(*args, **kwargs)
+
+        return self._in_worker(worker, call, out_blobs)
+
+    def _run_sapscript(
+        self,
+        name: str,
+        op: dict[str, Any],
+        args: list[Any],
+        kwargs: dict[str, Any],
+        out_blobs: list[bytes],
+    ) -> Any:
+        """
+        methods of Sapscript, each window is attached in the worker of its session
+        """
+        if name not in _SAPSCRIPT_METHODS:
+            raise AttributeError(f"Sapscript.{name} is not accessible remotely")
+
+        if name == "attach_window":
+            attached, worker = self.remote._attach_window(*args, **kwargs)
+
+            return self._encode(attached, worker, out_blobs)
+
+        if name == "open_new_window":
+            _, opener_worker = self._lookup(op["args"][0]["$ref"])
+
+            def open_window() -> tuple[int, int]:
+                opened = opener_worker.sapscript.open_new_window(*args, **kwargs)
+                return opened.connection, opened.session
+
+            connection, session = opener_worker.submit(open_window).result()
+            attached, worker = self.remote._attach_window(connection, session)
+
+            return self._encode(attached, worker, out_blobs)
+
+        method: Callable[..., Any] = getattr(self.remote._engine_sapscript, name)
+        future = self.remote._engine.submit(method, *args, **kwargs)
+
+        return self._encode(future.result(), None, out_blobs)
+
+    def _in_worker(self, worker: SessionWorker | None, call: Callable[[], Any], out_blobs: list[bytes]) -> Any:
+        """
+        calls and encodes the result in the worker, objects returned there belong to its thread,
+        generators (iter_list_output, walk) are read to the end there and sent as a list
+        """
+        def run() -> Any:
+            value = call()
+            if inspect.isgenerator(value):
+                value = list(value)
+
+            return self._encode(value, worker, out_blobs)
+
+        if worker is None:
+            return run()
+
+        return worker.submit(run).result()
+
+    def _encode(self, value: Any, worker: SessionWorker | None, out_blobs: list[bytes]) -> Any:
+        return protocol.encode(value, out_blobs, lambda obj: self._reference(obj, worker))
+
+    def _reference(self, obj: Any, worker: SessionWorker | None) -> dict[str, Any]:
+        """
+        keeps object in the server, member names are sent with the first object of each type
+        """
+        self.next_id += 1
+        self.objects[self.next_id] = (obj, worker)
+        reference: dict[str, Any] = {"$ref": self.next_id, "type": type(obj).__name__}
+
+        if type(obj) not in self.known_types:
+            self.known_types.add(type(obj))
+            reference["methods"], reference["attributes"] = _members(obj)
+
+        return reference
+
+    def _dereference(self, reference: dict[str, Any]) -> Any:
+        return self._lookup(reference["$ref"])[0]
+
+    def _lookup(self, ref: int) -> tuple[Any, SessionWorker | None]:
+        try:
+            return self.objects[ref]
+
+        except KeyError:
+            raise LookupError(f"Remote object {ref} does not exist or was released")
+
+
+def _members(obj: Any) -> tuple[list[str], list[str]]:
+    """
+    public method and attribute names, read statically - properties may call COM
+    """
+    methods, attributes = [], []
+    for name in dir(obj):
+        if name.startswith("_") and name not in _ALLOWED_DUNDERS:
+            continue
+
+        member = inspect.getattr_static(obj, name)
+        if isinstance(member, (staticmethod, classmethod)) or callable(member) and not isinstance(member, property):
+            methods.append(name)
+
+        else:
+            attributes.append(name)
+
+    return methods, attributes
+
+
+def _is_loopback(host: str) -> bool:
+    """
+    checks whether host accepts only local connections, host names other than localhost are not resolved
+    """
+    if host == "localhost":
+        return True
+
+    try:
+        return ipaddress.ip_address(host).is_loopback
+
+    except ValueError:
+        return False
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serves pysapscript to remote clients")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on, 0.0.0.0 for all")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--token", default=None, help="shared secret the clients must send, required unless on loopback")
+    parser.add_argument("--window-title", default="SAP Easy Access", help="default SAP window title")
+    args = parser.parse_args()
+
+    if args.token is None and not _is_loopback(args.host):
+        parser.error(f"--token is required with --host {args.host}")
+
+    with RemoteServer(pysapscript.Sapscript(args.window_title), args.host, args.port, args.token) as server:
+        print(f"pysapscript remote server listening on {server.address[0]}:{server.address[1]}")
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
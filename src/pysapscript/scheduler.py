@@ -0,0 +1,327 @@
+import math
+import time
+import threading
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+from queue import PriorityQueue
+from typing import Any, Callable, TYPE_CHECKING
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError, wait
+
+from pysapscript import window
+from pysapscript.session_worker import SessionWorker
+from pysapscript.types_ import exceptions
+
+if TYPE_CHECKING:
+    from pysapscript.pysapscript import Sapscript
+
+
+THROUGHPUT_WINDOW_SECONDS = 60
+
+
+@dataclass(order=True)
+class Job:
+    """
+    A job waiting in the scheduler queue, lower priority value runs first
+    """
+    priority: float
+    sequence: int
+    function: Callable[..., Any] = field(compare=False)
+    args: tuple = field(default=(), compare=False)
+    kwargs: dict = field(default_factory=dict, compare=False)
+    timeout: float | None = field(default=None, compare=False)
+    retries: int = field(default=0, compare=False)
+    attempts: int = field(default=0, compare=False)
+    future: Future = field(default_factory=Future, compare=False)
+
+
+@dataclass
+class SchedulerStats:
+    """
+    Live statistics of JobScheduler
+    """
+    jobs_done: int
+    jobs_failed: int
+    jobs_retried: int
+    jobs_per_minute: float
+    queue_depth: int
+    utilization: dict[tuple[int, int], float]
+
+
+class JobScheduler:
+    """
+    Distributes independent jobs over SAP sessions, each session runs one job at a time
+
+    A job is a callable that takes Window as its first argument.
+
+    A session cannot be interrupted, a job that runs out of time is only marked failed -
+    its future gets TimeoutError at once, while the session stays busy until the job returns.
+    """
+
+    def __init__(self, sapscript: "Sapscript", sessions: list[tuple[int, int]] | None = None) -> None:
+        """
+        Args:
+            sapscript (Sapscript): sapscript object used to attach sessions
+            sessions (list[tuple[int, int]] | None): (connection, session) pairs to use, all opened sessions if None
+
+        Example:
+            ```
+            def read_vendor(window: Window, vendor: str) -> str:
+                window.start_transaction("XK03")
+                ...
+
+            with JobScheduler(pss) as scheduler:
+                futures = [scheduler.submit(read_vendor, v, retries=2) for v in vendors]
+                results = [f.result() for f in futures]
+            ```
+        """
+        self._sapscript = sapscript
+        self._sessions = sessions if sessions is not None else sapscript.list_sessions()
+        self._queue: PriorityQueue[Job] = PriorityQueue()
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._runners: list[threading.Thread] = []
+        self._workers: list[SessionWorker] = []
+        self._started_at = 0.0
+        self._busy: dict[tuple[int, int], float] = {}
+        self._finished: deque[float] = deque()
+        self._done = 0
+        self._failed = 0
+        self._retried = 0
+
+    def __repr__(self) -> str:
+        return f"JobScheduler(sessions={self._sessions})"
+
+    def __str__(self) -> str:
+        return f"JobScheduler(sessions={self._sessions})"
+
+    def __enter__(self) -> "JobScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.shutdown()
+
+    def start(self) -> None:
+        """
+        Starts one worker for every session
+
+        Raises:
+            ValueError: no session to run jobs on
+        """
+        if not self._sessions:
+            raise ValueError("No session to run jobs on")
+
+        self._started_at = time.monotonic()
+
+        for connection, session in self._sessions:
+            worker = SessionWorker(self._sapscript, connection, session)
+            runner = threading.Thread(
+                target=self._run,
+                args=(worker,),
+                name=f"pysapscript-scheduler-{connection}-{session}",
+                daemon=True,
+            )
+
+            self._busy[(connection, session)] = 0.0
+            self._workers.append(worker)
+            self._runners.append(runner)
+            runner.start()
+
+    def submit(
+        self,
+        function: Callable[..., Any],
+        *args: Any,
+        priority: float = 0,
+        timeout: float | None = None,
+        retries: int = 0,
+        **kwargs: Any,
+    ) -> Future:
+        """
+        Adds job to the queue
+
+        Args:
+            function (Callable): job, called as function(window, *args, **kwargs)
+            *args: positional arguments of the job
+            priority (float): lower value runs first, default 0
+            timeout (float | None): seconds after which the future fails with TimeoutError, no limit if None,
+                the job keeps its session until it returns
+            retries (int): number of retries on ActionException
+            **kwargs: keyword arguments of the job
+
+        Returns:
+            Future: future resolved with the result of the job,
+                TimeoutError if the job ran out of time
+
+        Raises:
+            AttachException: scheduler was started, but no session could be attached
+        """
+        job = Job(
+            priority=priority,
+            sequence=next(self._sequence),
+            function=function,
+            args=args,
+            kwargs=kwargs,
+            timeout=timeout,
+            retries=retries,
+        )
+        with self._lock:
+            if self._started_at and not self._busy:
+                raise exceptions.AttachException("No session attached, job cannot run")
+
+            self._queue.put(job)
+
+        return job.future
+
+    def stats(self) -> SchedulerStats:
+        """
+        Gets live statistics
+
+        Returns:
+            SchedulerStats: finished jobs, throughput over last minute, queue depth
+                and share of time each session spent on jobs
+        """
+        now = time.monotonic()
+        elapsed = max(now - self._started_at, 1e-9)
+
+        with self._lock:
+            self._prune_finished(now)
+
+            window_seconds = min(elapsed, THROUGHPUT_WINDOW_SECONDS)
+
+            return SchedulerStats(
+                jobs_done=self._done,
+                jobs_failed=self._failed,
+                jobs_retried=self._retried,
+                jobs_per_minute=len(self._finished) * 60 / window_seconds,
+                queue_depth=self._queue.qsize(),
+                utilization={key: busy / elapsed for key, busy in self._busy.items()},
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops workers after all queued jobs are done
+
+        Args:
+            wait (bool): blocks until workers are stopped if True
+        """
+        with self._lock:
+            running = len(self._busy)
+
+        for _ in range(running):
+            self._queue.put(Job(priority=math.inf, sequence=next(self._sequence), function=_stop))
+
+        if wait:
+            for runner in self._runners:
+                runner.join()
+
+    def _run(self, worker: SessionWorker) -> None:
+        """
+        takes jobs from the queue and runs them in the session worker
+        """
+        key = (worker.connection, worker.session)
+
+        try:
+            attached = worker.attach().result()
+
+        except Exception as ex:
+            worker.shutdown(wait=False)
+            self._drop_session(key, ex)
+            return
+
+        while True:
+            job = self._queue.get()
+            if job.function is _stop:
+                break
+
+            if job.attempts == 0 and not job.future.set_running_or_notify_cancel():
+                continue
+
+            started = time.monotonic()
+            self._execute(worker, attached, job)
+
+            with self._lock:
+                self._busy[key] += time.monotonic() - started
+
+        worker.shutdown()
+
+    def _drop_session(self, key: tuple[int, int], reason: Exception) -> None:
+        """
+        removes session that could not be attached, fails queued jobs when no session is left,
+        submit() refuses new jobs from then on
+        """
+        with self._lock:
+            del self._busy[key]
+            sessions_left = len(self._busy)
+
+        if sessions_left > 0:
+            return
+
+        while not self._queue.empty():
+            job = self._queue.get()
+            if job.function is not _stop and job.future.set_running_or_notify_cancel():
+                self._finish(job, exception=exceptions.AttachException(f"No session attached: {reason}"))
+
+    def _execute(self, worker: SessionWorker, attached: window.Window, job: Job) -> None:
+        """
+        runs one job, requeues it on ActionException while retries are left
+        """
+        call = worker.submit(job.function, attached, *job.args, **job.kwargs)
+
+        try:
+            result = call.result(timeout=job.timeout)
+
+        except FutureTimeoutError:
+            self._finish(job, exception=TimeoutError(f"Job did not finish within {job.timeout} seconds"))
+            # the session is still running the job, next job can use it only after it returns
+            wait([call])
+
+        except exceptions.ActionException as ex:
+            if job.attempts < job.retries:
+                job.attempts += 1
+                with self._lock:
+                    self._retried += 1
+
+                self._queue.put(job)
+
+            else:
+                self._finish(job, exception=ex)
+
+        except Exception as ex:
+            self._finish(job, exception=ex)
+
+        else:
+            self._finish(job, result=result)
+
+    def _prune_finished(self, now: float) -> None:
+        """
+        drops finish times older than the throughput window, called under the lock
+        """
+        while self._finished and self._finished[0] < now - THROUGHPUT_WINDOW_SECONDS:
+            self._finished.popleft()
+
+    def _finish(self, job: Job, result: Any = None, exception: BaseException | None = None) -> None:
+        """
+        resolves job future and counts it
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            self._finished.append(now)
+            self._prune_finished(now)
+
+            if exception is None:
+                self._done += 1
+            else:
+                self._failed += 1
+
+        if exception is None:
+            job.future.set_result(result)
+        else:
+            job.future.set_exception(exception)
+
+
+def _stop(_: window.Window) -> None:
+    """
+    marks the end of the queue for one worker
+    """
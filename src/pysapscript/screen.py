@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Any, TYPE_CHECKING
+
+from pysapscript.backends.base import Handle
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+# types that have selected state
+_SELECTABLE_TYPES = ("GuiCheckBox", "GuiRadioButton", "GuiTab")
+
+# types labelled by the element on their left
+_LABELLED_TYPES = ("GuiTextField", "GuiCTextField", "GuiPasswordField", "GuiComboBox", "GuiOkCodeField")
+
+# types that are their own label
+_SELF_LABELLED_TYPES = ("GuiLabel", "GuiCheckBox", "GuiRadioButton", "GuiButton", "GuiTab")
+
+ScreenFingerprint = tuple[str, str, int, str]
+
+
+@dataclass
+class ScreenElement:
+    """
+    One element of a screen read by Window.read_screen()
+    """
+    id: str
+    type: str
+    name: str
+    text: str
+    changeable: bool
+    selected: bool | None
+    tooltip: str = ""
+    label: str | None = None
+
+
+@dataclass
+class ScreenSnapshot:
+    """
+    All elements under a root element, read in a single traversal
+    """
+    root: str
+    fingerprint: ScreenFingerprint
+    elements: list[ScreenElement]
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """
+        Get elements as a dictionary
+
+        Returns:
+            dict[str, dict[str, Any]]: element properties by element ID
+        """
+        return {element.id: asdict(element) for element in self.elements}
+
+    def to_polars_dataframe(self) -> pl.DataFrame:
+        """
+        Get elements as a polars DataFrame
+
+        Returns:
+            polars.DataFrame: one row per element
+        """
+        import polars as pl
+
+        return pl.DataFrame(
+            [asdict(element) for element in self.elements],
+            schema={
+                "id": pl.String,
+                "type": pl.String,
+                "name": pl.String,
+                "text": pl.String,
+                "changeable": pl.Boolean,
+                "selected": pl.Boolean,
+                "tooltip": pl.String,
+                "label": pl.String,
+            },
+        )
+
+
+def read_fingerprint(session_handle: Handle) -> ScreenFingerprint:
+    """
+    Reads identification of the current screen - transaction, program, screen number and window title
+
+    Args:
+        session_handle (Handle): SAP session handle
+
+    Returns:
+        ScreenFingerprint: transaction, program, screen number, title of active window
+    """
+    info = session_handle.Info
+
+    return (
+        info.Transaction,
+        info.Program,
+        info.ScreenNumber,
+        session_handle.ActiveWindow.Text,
+    )
+
+
+def read_screen(session_handle: Handle, root: str = "wnd[0]/usr") -> ScreenSnapshot:
+    """
+    Walks the element tree under root once and reads properties of every element
+
+    Args:
+        session_handle (Handle): SAP session handle
+        root (str): element to start from
+
+    Returns:
+        ScreenSnapshot: elements in traversal order
+    """
+    fingerprint = read_fingerprint(session_handle)
+    elements = []
+    containers = deque([session_handle.findById(root)])
+
+    while containers:
+        container = containers.popleft()
+        children = container.Children
+
+        for i in range(children.Count):
+            child = children(i)
+            element_type = child.Type
+            text = getattr(child, "Text", "")
+
+            elements.append(
+                ScreenElement(
+                    id=_relative_id(child.Id),
+                    type=element_type,
+                    name=child.Name,
+                    text=text,
+                    changeable=bool(getattr(child, "Changeable", False)),
+                    selected=bool(child.Selected) if element_type in _SELECTABLE_TYPES else None,
+                    tooltip=getattr(child, "Tooltip", ""),
+                    label=text if element_type in _SELF_LABELLED_TYPES else _read_left_label(child, element_type),
+                )
+            )
+
+            if child.ContainerType:
+                containers.append(child)
+
+    return ScreenSnapshot(root=root, fingerprint=fingerprint, elements=elements)
+
+
+class ScreenIndex:
+    """
+    Elements of a screen indexed by name, label, type and tooltip
+    """
+
+    def __init__(self, snapshot: ScreenSnapshot) -> None:
+        """
+        Args:
+            snapshot (ScreenSnapshot): screen read by read_screen()
+        """
+        self.root = snapshot.root
+        self.fingerprint = snapshot.fingerprint
+        self._by_id: dict[str, ScreenElement] = {}
+        self._by_name: dict[str, list[ScreenElement]] = {}
+        self._by_label: dict[str, list[ScreenElement]] = {}
+        self._by_type: dict[str, list[ScreenElement]] = {}
+        self._by_tooltip: dict[str, list[ScreenElement]] = {}
+
+        for element in snapshot.elements:
+            self._by_id[element.id] = element
+            self._by_name.setdefault(element.name, []).append(element)
+            self._by_type.setdefault(element.type, []).append(element)
+
+            if element.label:
+                self._by_label.setdefault(_normalize(element.label), []).append(element)
+
+            if element.tooltip:
+                self._by_tooltip.setdefault(_normalize(element.tooltip), []).append(element)
+
+    def __repr__(self) -> str:
+        return f"ScreenIndex(root={self.root}, elements={len(self._by_id)})"
+
+    def __str__(self) -> str:
+        return f"ScreenIndex(root={self.root}, elements={len(self._by_id)})"
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, element_id: object) -> bool:
+        return element_id in self._by_id
+
+    def find_all(
+        self,
+        name: str | None = None,
+        label: str | None = None,
+        type: str | None = None,
+        tooltip: str | None = None,
+    ) -> list[ScreenElement]:
+        """
+        Finds elements matching all given criteria, label and tooltip ignore case and surrounding spaces
+
+        Args:
+            name (str | None): technical name, e.g. DATABROWSE-TABLENAME
+            label (str | None): text of the label or of the element itself
+            type (str | None): element type, e.g. GuiCTextField
+            tooltip (str | None): tooltip text
+
+        Returns:
+            list[ScreenElement]: matching elements in traversal order
+        """
+        candidates = []
+
+        if name is not None:
+            candidates.append(self._by_name.get(name, []))
+        if label is not None:
+            candidates.append(self._by_label.get(_normalize(label), []))
+        if type is not None:
+            candidates.append(self._by_type.get(type, []))
+        if tooltip is not None:
+            candidates.append(self._by_tooltip.get(_normalize(tooltip), []))
+
+        if not candidates:
+            return list(self._by_id.values())
+
+        smallest, *others = sorted(candidates, key=len)
+        others_ids = [{id(element) for element in other} for other in others]
+
+        return [e for e in smallest if all(id(e) in ids for ids in others_ids)]
+
+
+class DropdownEntries:
+    """
+    Entries of a dropdown (GuiComboBox) read at once, key to text with lookup by text
+    """
+
+    def __init__(self, element: str, fingerprint: ScreenFingerprint, entries: dict[str, str]) -> None:
+        """
+        Args:
+            element (str): dropdown element ID
+            fingerprint (ScreenFingerprint): screen the entries were read on
+            entries (dict[str, str]): text by key, in dropdown order
+        """
+        self.element = element
+        self.fingerprint = fingerprint
+        self.entries = entries
+        self._by_text: dict[str, str] = {}
+        self._by_normalized_text: dict[str, str] = {}
+
+        for key, text in entries.items():
+            self._by_text.setdefault(text, key)
+            self._by_normalized_text.setdefault(_normalize(text), key)
+
+    def __repr__(self) -> str:
+        return f"DropdownEntries(element={self.element}, entries={len(self.entries)})"
+
+    def __str__(self) -> str:
+        return f"DropdownEntries(element={self.element}, entries={len(self.entries)})"
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, text: object) -> bool:
+        return isinstance(text, str) and self.key_of(text) is not None
+
+    def key_of(self, text: str) -> str | None:
+        """
+        Gets key of the entry by its text, exact match first, then ignoring case and surrounding spaces
+
+        Args:
+            text (str): text of the entry
+
+        Returns:
+            str | None: key of the entry, None if not found
+        """
+        key = self._by_text.get(text)
+        if key is None:
+            key = self._by_normalized_text.get(_normalize(text))
+
+        return key
+
+    def texts(self) -> list[str]:
+        """
+        Gets texts of all entries in dropdown order
+
+        Returns:
+            list[str]: entry texts
+        """
+        return list(self.entries.values())
+
+
+def read_dropdown_entries(session_handle: Handle, element: str) -> DropdownEntries:
+    """
+    Reads key and text of every entry of a dropdown
+
+    Args:
+        session_handle (Handle): SAP session handle
+        element (str): dropdown element ID
+
+    Returns:
+        DropdownEntries: entries of the dropdown
+    """
+    fingerprint = read_fingerprint(session_handle)
+    entries = session_handle.findById(element).Entries
+    by_key = {}
+
+    for i in range(entries.Count):
+        entry = entries(i)
+        by_key[entry.Key] = entry.Value
+
+    return DropdownEntries(element, fingerprint, by_key)
+
+
+def _normalize(text: str) -> str:
+    """
+    normalizes text for lookup
+    """
+    return " ".join(text.split()).casefold()
+
+
+def _read_left_label(element: Handle, element_type: str) -> str | None:
+    """
+    reads text of the label on the left of an input field
+    """
+    if element_type not in _LABELLED_TYPES:
+        return None
+
+    try:
+        label = element.LeftLabel
+        return label.Text if label is not None else None
+
+    except Exception:
+        return None
+
+
+def _relative_id(element_id: str) -> str:
+    """
+    strips application, connection and session from ID - /app/con[0]/ses[0]/wnd[0]/usr -> wnd[0]/usr
+    """
+    position = element_id.find("wnd[")
+    if position == -1:
+        return element_id
+
+    return element_id[position:]
@@ -0,0 +1,198 @@
+import logging
+import threading
+from typing import Iterator, TYPE_CHECKING
+from contextlib import contextmanager
+
+from pysapscript import window
+from pysapscript.types_ import exceptions
+
+if TYPE_CHECKING:
+    from pysapscript.pysapscript import Sapscript
+
+
+MAX_SESSIONS_PER_CONNECTION = 6
+
+logger = logging.getLogger(__name__)
+
+
+class SessionPool:
+    """
+    A pool of sessions of one connection, sessions are leased out one at a time
+
+    lease() can be called from several threads, each session is leased to one of them.
+    """
+
+    def __init__(
+        self,
+        sapscript: "Sapscript",
+        size: int,
+        connection: int = 0,
+        reset_transaction: str = "/n",
+    ) -> None:
+        """
+        Attaches sessions already opened on the connection and creates the missing ones
+
+        Args:
+            sapscript (Sapscript): sapscript object used to attach and open sessions
+            size (int): number of sessions in the pool, max 6 per connection
+            connection (int): connection number
+            reset_transaction (str): transaction started on returned sessions, default "/n"
+
+        Raises:
+            ValueError: size out of allowed range
+            AttachException: could not attach to SAP window
+            WindowDidNotAppearException: new session did not appear
+        """
+        if not 0 < size <= MAX_SESSIONS_PER_CONNECTION:
+            raise ValueError(
+                f"Pool size must be between 1 and {MAX_SESSIONS_PER_CONNECTION}, got {size}"
+            )
+
+        self.size = size
+        self.connection = connection
+        self.reset_transaction = reset_transaction
+        self._sapscript = sapscript
+        self._free: list[window.Window] = []
+        self._leased: list[window.Window] = []
+        self._lock = threading.Lock()
+
+        self._fill()
+
+    def __repr__(self) -> str:
+        return f"SessionPool(connection={self.connection}, size={self.size}, free={len(self._free)})"
+
+    def __str__(self) -> str:
+        return f"SessionPool(connection={self.connection}, size={self.size}, free={len(self._free)})"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._free) + len(self._leased)
+
+    @property
+    def free(self) -> int:
+        """
+        Number of sessions that are not leased
+        """
+        with self._lock:
+            return len(self._free)
+
+    @contextmanager
+    def lease(self) -> Iterator[window.Window]:
+        """
+        Leases a free session, returned session is reset to the reset transaction
+
+        Dead sessions are replaced by new ones, both when leasing and returning.
+        A session that could not be replaced stays in the pool and is replaced on a later lease.
+
+        Yields:
+            window.Window: leased window
+
+        Raises:
+            SessionPoolExhaustedException: all sessions are leased
+            WindowDidNotAppearException: dead session could not be replaced
+            AttachException: dead session could not be replaced, no session of the connection is alive
+
+        Example:
+            ```
+            with pool.lease() as window:
+                window.start_transaction("SE16")
+            ```
+        """
+        with self._lock:
+            if not self._free:
+                raise exceptions.SessionPoolExhaustedException(
+                    f"All {len(self._leased)} sessions of connection {self.connection} are leased"
+                )
+
+            leased = self._free.pop()
+
+        if not self._is_alive(leased):
+            try:
+                leased = self._open_session()
+
+            except Exception:
+                self._add_free(leased)
+                raise
+
+        with self._lock:
+            self._leased.append(leased)
+
+        try:
+            yield leased
+
+        finally:
+            with self._lock:
+                self._leased.remove(leased)
+
+            self._release(leased)
+
+    def _fill(self) -> None:
+        """
+        attaches existing sessions and creates missing ones
+        """
+        opened = [session for connection, session in self._sapscript.list_sessions() if connection == self.connection]
+        if not opened:
+            raise exceptions.AttachException(f"Could not attach connection {self.connection}!")
+
+        for session in opened[:self.size]:
+            self._free.append(self._sapscript.attach_window(self.connection, session))
+
+        while len(self._free) < self.size:
+            self._free.append(self._open_session())
+
+    def _open_session(self) -> window.Window:
+        """
+        opens a new session from any free alive session
+        """
+        with self._lock:
+            openers = list(self._free)
+
+        for opener in openers:
+            if self._is_alive(opener):
+                return self._sapscript.open_new_window(opener)
+
+        session = next((s for c, s in self._sapscript.list_sessions() if c == self.connection), None)
+        if session is None:
+            raise exceptions.AttachException(f"No session of connection {self.connection} is alive to open a new one")
+
+        opener = self._sapscript.attach_window(self.connection, session)
+
+        return self._sapscript.open_new_window(opener)
+
+    def _release(self, returned: window.Window) -> None:
+        """
+        resets returned session, replaces it if it died - never raises, it runs while the lease ends,
+        possibly with an exception of the caller on its way
+        """
+        try:
+            returned.start_transaction(self.reset_transaction)
+            self._add_free(returned)
+            return
+
+        except Exception:
+            logger.warning("Session %s of connection %s could not be reset, replacing it",
+                           returned.session, self.connection, exc_info=True)
+
+        try:
+            self._add_free(self._open_session())
+
+        except Exception:
+            logger.warning("Session %s of connection %s could not be replaced, it is replaced on a later lease",
+                           returned.session, self.connection, exc_info=True)
+            self._add_free(returned)
+
+    def _add_free(self, returned: window.Window) -> None:
+        with self._lock:
+            self._free.append(returned)
+
+    @staticmethod
+    def _is_alive(checked: window.Window) -> bool:
+        """
+        checks that session still answers
+        """
+        try:
+            checked._session_handle.Id
+            return True
+
+        except Exception:
+            return False
@@ -0,0 +1,95 @@
+import gc
+from typing import Any, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from pysapscript import pysapscript
+from pysapscript import window
+
+
+class SessionWorker:
+    """
+    A dedicated thread that owns one SAP session
+
+    COM handles are bound to the apartment of the thread that created them,
+    so the window is attached inside the worker and every call for the session runs there.
+    """
+
+    def __init__(self, sapscript: "pysapscript.Sapscript", connection: int, session: int) -> None:
+        """
+        Args:
+            sapscript (Sapscript): sapscript object the worker copies its settings from
+            connection (int): connection number
+            session (int): session number
+        """
+        self.connection = connection
+        self.session = session
+        self.sapscript = sapscript._copy_for_thread()
+        self.window: window.Window | None = None
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=f"pysapscript-{connection}-{session}",
+            initializer=self.sapscript.backend.thread_init,
+        )
+
+    def __repr__(self) -> str:
+        return f"SessionWorker(connection={self.connection}, session={self.session})"
+
+    def __str__(self) -> str:
+        return f"SessionWorker(connection={self.connection}, session={self.session})"
+
+    def attach(self) -> "Future[window.Window]":
+        """
+        Attaches the window inside the worker thread, only the first call attaches
+
+        Returns:
+            Future[Window]: future resolved with the attached window
+        """
+        return self._executor.submit(self._attach)
+
+    def submit(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Runs function in the worker thread
+
+        Args:
+            function (Callable): function to run, usually a bound method of the window
+            *args: positional arguments of the function
+            **kwargs: keyword arguments of the function
+
+        Returns:
+            Future: future resolved with the result of the function
+        """
+        return self._executor.submit(function, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Releases backend resources of the worker thread (COM) and stops it
+
+        Window and handles of the worker are dropped in the worker thread before the backend is closed there,
+        objects returned earlier by the worker must not be used afterwards.
+
+        Args:
+            wait (bool): waits for pending calls to finish if True
+        """
+        self._executor.submit(self._close)
+        self._executor.shutdown(wait=wait)
+
+    def _attach(self) -> "window.Window":
+        """
+        attaches window, runs in the worker thread
+        """
+        if self.window is None:
+            self.window = self.sapscript.attach_window(self.connection, self.session)
+
+        return self.window
+
+    def _close(self) -> None:
+        """
+        releases handles held by the worker, then the backend - runs in the worker thread
+        """
+        self.window = None
+        self.sapscript._application = None
+        gc.collect()
+
+        self.sapscript.backend.thread_close()
+
@@ -1,12 +1,16 @@
-from typing import Self, Any, Literal
-from typing import overload
+from __future__ import annotations
 
-import win32com.client
-from win32com.universal import com_error
-import polars as pl
-import pandas
+from typing import Self, Any, Literal, TYPE_CHECKING
+from typing import overload
 
+from pysapscript import instrumentation
+from pysapscript import recording
 from pysapscript.types_ import exceptions
+from pysapscript.backends import Handle, scripting_errors
+
+if TYPE_CHECKING:
+    import polars as pl
+    import pandas
 
 
 class ShellTable:
@@ -16,7 +20,7 @@ class ShellTable:
 
     def __init__(
         self, 
-        session_handle: win32com.client.CDispatch, 
+        session_handle: Handle, 
         element: str, 
         load_table: bool = True,
     ) -> None:
@@ -24,7 +28,7 @@ class ShellTable:
         Usually table contains a table of data, but it can also be a non-data shell table, that holds toolbar
 
         Args:
-            session_handle (win32com.client.CDispatch): SAP session handle
+            session_handle (Handle): SAP session handle
             element (str): SAP table element
             load_table (bool): loads table if True, default True
 
@@ -38,6 +42,8 @@ class ShellTable:
         if load_table:
             self.data = self._read_shell_table()
         else:
+            import polars as pl
+
             self.data = pl.DataFrame()
 
         shape = self._read_shape()
@@ -77,6 +83,24 @@ class ShellTable:
     def __iter__(self) -> "ShellTableRowIterator":
         return ShellTableRowIterator(self.data)
     
+    def instrument(self, sink: instrumentation.Sink | None) -> None:
+        """
+        Reports every COM call of this table, None turns reporting off
+
+        Args:
+            sink (Callable[[ComCallEvent], None] | None): receives events, e.g. InMemoryAggregator
+        """
+        self._session_handle = instrumentation.instrument(self._session_handle, "session", sink)
+
+    def record(self, recorder: recording.Recorder | None) -> None:
+        """
+        Records every COM call of this table as session, None turns recording off
+
+        Args:
+            recorder (Recorder | None): writes calls to its file
+        """
+        self._session_handle = recording.record(self._session_handle, "session", recorder)
+
     def _read_shape(self) -> tuple[int, int]:
         """
         Reads shape of the shell table
@@ -115,6 +139,8 @@ class ShellTable:
             table = main_window.read_shell_table("wnd[0]/usr/shellContent/shell")
             ```
         """
+        import polars as pl
+
         try:
             shell = self._session_handle.findById(self.table_element)
 
@@ -159,10 +185,22 @@ class ShellTable:
 
         Returns:
             pandas.DataFrame: table data
+
+        Raises:
+            ImportError: pandas or pyarrow is not installed, install pysapscript[pandas]
         """
         if self.data_present is False:
             raise ValueError("Data was not found in shell table")
 
+        try:
+            import pandas  # noqa: F401
+            import pyarrow  # noqa: F401
+
+        except ImportError as ex:
+            raise ImportError(
+                f"to_pandas_dataframe needs pandas and pyarrow, {ex.name} is missing, install pysapscript[pandas]"
+            ) from ex
+
         return self.data.to_pandas()
 
     def to_dict(self) -> dict[str, Any]:
@@ -254,7 +292,7 @@ class ShellTable:
                 shell.currentCellRow = row_position
                 shell.SelectedRows = row_position
 
-            except com_error:
+            except scripting_errors():
                 """no more rows for this step"""
                 break
 
@@ -266,7 +304,7 @@ class ShellTable:
                 shell.currentCellRow = row_position
                 shell.SelectedRows = row_position
 
-            except com_error:
+            except scripting_errors():
                 """no more rows for this step"""
                 break
 
@@ -1,52 +1,87 @@
-from dataclasses import dataclass
+from __future__ import annotations
 
-import win32com.client
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Literal, TYPE_CHECKING
 
+from pysapscript import instrumentation
+from pysapscript import recording
+from pysapscript import tree_loader
 from pysapscript.types_ import exceptions
+from pysapscript.backends.base import Handle
+
+if TYPE_CHECKING:
+    import polars as pl
 
 
 @dataclass
 class Node:
-    _shell_tree: win32com.client.CDispatch
+    """
+    Node of a ShellTree, attributes not loaded (see ShellTree attributes) are None
+
+    items holds texts of item columns by column name for column and list trees, empty for simple trees,
+    None unless "items" is in ShellTree attributes
+    """
+    _shell_tree: Handle
     key: str
-    label: str
-    is_expanded: bool
-    is_disabled: bool
-    is_folder: bool
-    children_count: int
+    label: str | None
+    is_expanded: bool | None
+    is_disabled: bool | None
+    is_folder: bool | None
+    children_count: int | None
+
+    _tree: "ShellTree | None" = field(default=None, compare=False, repr=False)
+    items: dict[str, str] | None = None
 
     def get_children(self) -> "list[Node]":
         """
         Get all children of the node.
-        This method retrieves all child nodes of the current node if it is a folder.
+        Children are looked up in the parent/child index of the tree, loaded once for all nodes.
 
         Returns:
             list[Node]: A list of Node objects representing the children of the current node.
+
+        Raises:
+            ActionException: If the node is not a folder.
         """
-        if not self.is_folder:
+        if self.is_folder is False:
             raise exceptions.ActionException(
                 f"node with key: {self.key}, label: {self.label} has no children"
             )
 
-        nodes = self._shell_tree.GetAllNodeKeys()
-        correct_dir = False
-        children = []
+        return self._get_tree().get_children(self)
 
-        for key in nodes:
-            node = ShellTree._parse_node_from_list_of_nodes(self._shell_tree, key)
+    def get_parent(self) -> "Node | None":
+        """
+        Get the parent of the node.
 
-            if node.is_folder and key != self.key:
-                correct_dir = False
-                continue
+        Returns:
+            Node | None: The parent Node, None for a top level node.
+        """
+        return self._get_tree().get_parent(self)
 
-            if node.is_folder and key == self.key:
-                correct_dir = True
-                continue
-            
-            if correct_dir:
-                children.append(node)
+    def get_descendants(self) -> "list[Node]":
+        """
+        Get all nodes below the node, in tree order.
 
-        return children
+        Returns:
+            list[Node]: children, their children and so on
+        """
+        return self._get_tree().get_descendants(self)
+
+    def get_depth(self) -> int:
+        """
+        Get the level of the node, 0 for top level nodes.
+
+        Returns:
+            int: number of ancestors of the node
+        """
+        return self._get_tree().get_depth(self)
+
+    def _get_tree(self) -> "ShellTree":
+        if self._tree is None:
+            raise exceptions.ActionException(f"node with key: {self.key} does not belong to a ShellTree")
+
+        return self._tree
 
     def select(self) -> None:
         """
@@ -63,17 +98,21 @@ class Node:
     def expand(self) -> None:
         """
         Expand this node if it is a folder.
+        Children of the node are read now if the tree is lazy and did not read them yet.
 
         Raises:
             ActionException: If the node is not a folder.
         """
-        if not self.is_folder:
+        if self.is_folder is False:
             raise exceptions.ActionException(
                 f"node with key: {self.key}, label: {self.label} is not a folder"
             )
 
         self._shell_tree.ExpandNode(self.key)
 
+        if self._tree is not None and self._tree.lazy:
+            self._tree.get_children(self)
+
     def collapse(self) -> None:
         """
         Collapse this node if it is a folder.
@@ -81,7 +120,7 @@ class Node:
         Raises:
             ActionException: If the node is not a folder.
         """
-        if not self.is_folder:
+        if self.is_folder is False:
             raise exceptions.ActionException(
                 f"node with key: {self.key}, label: {self.label} is not a folder"
             )
@@ -101,20 +140,56 @@ class ShellTree:
     A class representing a shell table
     """
 
-    def __init__(self, session_handle: win32com.client.CDispatch, element: str) -> None:
+    def __init__(
+        self,
+        session_handle: Handle,
+        element: str,
+        attributes: Iterable[str] | None = None,
+        lazy: bool = False,
+    ) -> None:
         """
         Usually table contains a list that can be selected and clicked
 
+        Nodes are read in bulk, one pass of a tree method over all keys at a time,
+        calls made are in load_stats
+
+        A lazy tree reads only top level nodes, children of a folder are read the first time
+        they are needed - get_children(), expand(), path lookup or descendants.
+        Folder with children not sent by SAP yet is expanded to get them.
+        Lookups and lists of a lazy tree cover nodes read so far.
+
         Args:
-            session_handle (win32com.client.CDispatch): SAP session handle
+            session_handle (Handle): SAP session handle
             element (str): SAP table element
+            attributes (Iterable[str] | None): node attributes to read - label, is_expanded, is_disabled,
+                is_folder, children_count, items - all but items if None, attributes not read are None in nodes
+            lazy (bool): read top level nodes only, deeper levels on demand
 
         Raises:
             ActionException: error reading tree data
         """
         self.tree_element = element
         self._session_handle = session_handle
-        self._nodes = self._read_shell_tree()
+        self.attributes = tuple(attributes) if attributes is not None else tree_loader.DEFAULT_NODE_ATTRIBUTES
+        self.lazy = lazy
+        self._shell = session_handle.findById(element)
+        self._loader = tree_loader.TreeLoader(self._shell)
+        self.load_stats = self._loader.stats
+
+        self._nodes: list[Node] = []
+        self._by_key: dict[str, Node] = {}
+        self._by_label: dict[str, list[Node]] = {}
+        self._folders: list[Node] = []
+        self._not_folders: list[Node] = []
+        self._roots: list[Node] = []
+        self._parents: dict[str, Node | None] | None = None
+        self._children: dict[str, list[Node]] = {}
+
+        if lazy:
+            self._parents = {}
+            self._add_level(None, self._read_nodes(self._loader.top_keys()))
+        else:
+            self._index(self._read_nodes(self._loader.all_keys()))
 
     def __repr__(self) -> str:
         return repr(self._nodes)
@@ -158,54 +233,223 @@ class ShellTree:
     def __len__(self) -> int:
         return len(self._nodes)
 
-    @staticmethod
-    def _parse_node_from_list_of_nodes(
-        shell: win32com.client.CDispatch,
-        key: str,
-    ) -> Node:
+    def instrument(self, sink: instrumentation.Sink | None) -> None:
         """
-        Parse a node from the list of nodes in the shell tree.
+        Reports every COM call of this tree and its nodes, None turns reporting off
 
         Args:
-            shell (win32com.client.CDispatch): The shell tree object.
-            key (str): The key of the node to parse.
+            sink (Callable[[ComCallEvent], None] | None): receives events, e.g. InMemoryAggregator
+        """
+        self._session_handle = instrumentation.instrument(self._session_handle, "session", sink)
+        self._shell = self._loader.shell = instrumentation.instrument(self._shell, self.tree_element, sink)
+
+        for node in self._nodes:
+            node._shell_tree = instrumentation.instrument(node._shell_tree, self.tree_element, sink)
+
+    def record(self, recorder: recording.Recorder | None) -> None:
+        """
+        Records every COM call of this tree and its nodes, None turns recording off
+
+        The session is recorded as session, nodes as the tree element
+
+        Args:
+            recorder (Recorder | None): writes calls to its file
+        """
+        self._session_handle = recording.record(self._session_handle, "session", recorder)
+        self._shell = self._loader.shell = recording.record(self._shell, self.tree_element, recorder)
+
+        for node in self._nodes:
+            node._shell_tree = recording.record(node._shell_tree, self.tree_element, recorder)
+
+    def _read_nodes(self, keys: list[str]) -> list[Node]:
+        """
+        Reads attributes of nodes in bulk and returns Node objects in order of keys
+        """
+        values = self._loader.load(keys, self.attributes)
+        columns = [values.get(name, [None] * len(keys)) for name in tree_loader.DEFAULT_NODE_ATTRIBUTES]
+        items = values.get("items", [None] * len(keys))
+
+        return [
+            Node(self._shell, key, *attributes, _tree=self, items=node_items)
+            for key, node_items, *attributes in zip(keys, items, *columns)
+        ]
+
+    def _index(self, nodes: list[Node]) -> None:
+        """
+        Adds nodes to the tree, indexes them by key and label, splits folders and other nodes
+        """
+        self._nodes.extend(nodes)
+
+        for node in nodes:
+            self._by_key.setdefault(node.key, node)
+            if node.label is not None:
+                self._by_label.setdefault(node.label, []).append(node)
+
+            (self._folders if node.is_folder else self._not_folders).append(node)
+
+    def _add_level(self, parent: Node | None, nodes: list[Node]) -> None:
+        """
+        Adds children of parent read by a lazy tree, top level nodes if parent is None
+        """
+        self._index(nodes)
+
+        for node in nodes:
+            self._parents[node.key] = parent
+
+        if parent is None:
+            self._roots.extend(nodes)
+        else:
+            self._children[parent.key] = nodes
+
+    def _read_children(self, node: Node) -> list[Node]:
+        """
+        Reads children of a node, a folder with children not sent yet is expanded first
+        """
+        keys = self._loader.sub_keys(node.key)
+
+        if keys is None and self._is_expandable(node):
+            self._loader.call("ExpandNode", node.key)
+            if node.is_expanded is not None:
+                node.is_expanded = True
+
+            keys = self._loader.sub_keys(node.key)
+
+        return self._read_nodes(keys or [])
+
+    def _require_attribute(self, attribute: str, needed_by: str) -> None:
+        """
+        raises when nodes were read without attribute that needed_by depends on
+        """
+        if attribute not in self.attributes:
+            raise exceptions.ActionException(
+                f"{attribute} of tree {self.tree_element} is not loaded, {needed_by} needs it, see attributes"
+            )
+
+    def _tree_order(self) -> list[Node]:
+        """
+        nodes read so far, depth first, parents before their children
+        """
+        self._load_hierarchy()
+        ordered: list[Node] = []
+        stack = self._roots[::-1]
+
+        while stack:
+            node = stack.pop()
+            ordered.append(node)
+            stack.extend(self._children.get(node.key, [])[::-1])
+
+        return ordered
+
+    def _is_expandable(self, node: Node) -> bool:
+        if node.is_folder is not None:
+            return node.is_folder
+
+        return bool(self._loader.call("IsFolderExpandable", node.key))
+
+    def _load_hierarchy(self) -> dict[str, Node | None]:
+        """
+        Builds parent and children index of all nodes on first use, one pass over the tree,
+        GetSubNodesCol for folders when is_folder is loaded, GetParent for every node otherwise.
+        A lazy tree builds its index level by level as it reads nodes.
+        """
+        if self._parents is not None:
+            return self._parents
+
+        keys = [n.key for n in self._nodes]
+        folders = [n.is_folder for n in self._nodes] if "is_folder" in self.attributes else None
+        parent_keys = self._loader.parents(keys, folders)
+
+        self._parents = {}
+        self._children = {}
+
+        for node, parent_key in zip(self._nodes, parent_keys):
+            parent = self._by_key.get(parent_key)
+            self._parents[node.key] = parent
+            if parent is None:
+                self._roots.append(node)
+            else:
+                self._children.setdefault(parent.key, []).append(node)
+
+        return self._parents
+
+    def _child_list(self, node: Node) -> list[Node]:
+        """
+        children of node from the index, a lazy tree reads and keeps them on first use
+        """
+        self._load_hierarchy()
+
+        if self.lazy and node.key not in self._children:
+            self._add_level(node, self._read_children(node))
+
+        return self._children.get(node.key, [])
+
+    def get_children(self, node: Node) -> list[Node]:
+        """
+        Get direct children of a node, the parent/child index is loaded on first call.
+
+        Args:
+            node (Node): node of this tree
 
         Returns:
-            Node: A Node object containing the parsed information.
+            list[Node]: children in tree order, empty list for a leaf
         """
-        label = shell.GetNodeTextByKey(key)
-        expandable = shell.IsFolderExpandable(key)
-        expanded = shell.IsFolderExpanded(key)
-        disabled = shell.GetIsDisabled(key, "Text")
-        folder = expanded or expandable
-        children_count = shell.GetNodeChildrenCount(key) if folder else 0
+        return list(self._child_list(node))
 
-        return Node(
-            _shell_tree=shell, 
-            key=key, 
-            label=label, 
-            is_expanded=expanded, 
-            is_disabled=disabled,
-            is_folder=folder,
-            children_count=children_count,
-        )
+    def get_parent(self, node: Node) -> Node | None:
+        """
+        Get the parent of a node, the parent/child index is loaded on first call.
+
+        Args:
+            node (Node): node of this tree
 
-    def _read_shell_tree(self) -> list[Node]:
+        Returns:
+            Node | None: parent node, None for a top level node
+
+        Raises:
+            ActionException: node is not in this tree
+        """
+        parents = self._load_hierarchy()
+        if node.key not in parents:
+            raise exceptions.ActionException(f"node with key: {node.key} not found in tree {self.tree_element}")
+
+        return parents[node.key]
+
+    def get_descendants(self, node: Node) -> list[Node]:
         """
-        Read the shell tree and return a list of Node objects.
+        Get all nodes below a node in tree order.
+
+        Args:
+            node (Node): node of this tree
 
         Returns:
-            list[Node]: A list of Node objects representing the shell tree.
+            list[Node]: children, their children and so on
         """
-        content = []
+        descendants = []
+        stack = list(reversed(self._child_list(node)))
+        while stack:
+            child = stack.pop()
+            descendants.append(child)
+            stack.extend(reversed(self._child_list(child)))
 
-        shell = self._session_handle.findById(self.tree_element)
-        nodes = shell.GetAllNodeKeys()
+        return descendants
 
-        for key in nodes:
-            content.append(self._parse_node_from_list_of_nodes(shell, key))
-        
-        return content
+    def get_depth(self, node: Node) -> int:
+        """
+        Get the level of a node, 0 for top level nodes.
+
+        Args:
+            node (Node): node of this tree
+
+        Returns:
+            int: number of ancestors of the node
+        """
+        depth = 0
+        parent = self.get_parent(node)
+        while parent is not None:
+            depth += 1
+            parent = self._parents[parent.key]
+
+        return depth
 
     def get_node_by_key(self, key: str) -> Node | None:
         """
@@ -217,15 +461,11 @@ class ShellTree:
         Returns:
             Node | None: The Node object if found, otherwise None.
         """
-        key_match = [n for n in self._nodes if n.key == key]
-        if not key_match:
-            return None
-        
-        return key_match[0]
+        return self._by_key.get(key)
 
     def get_node_by_label(self, label: str) -> Node | None:
         """
-        Get a node by its label.
+        Get a node by its label, the first one in tree order if more nodes share it.
 
         Args:
             label (str): The label of the node to retrieve. Example: "Hodnota výberu 2"
@@ -233,12 +473,214 @@ class ShellTree:
         Returns:
             Node | None: The Node object if found, otherwise None.
         """
-        label_match = [n for n in self._nodes if n.label == label]
+        label_match = self._by_label.get(label)
         if not label_match:
             return None
-        
+
         return label_match[0]
-    
+
+    def get_nodes_by_label(self, label: str) -> list[Node]:
+        """
+        Get all nodes with a label.
+
+        Args:
+            label (str): The label of nodes to retrieve
+
+        Returns:
+            list[Node]: nodes in tree order, empty list if none matches
+        """
+        return list(self._by_label.get(label, []))
+
+    def get_node_by_path(self, path: str, separator: str = "/") -> Node | None:
+        """
+        Get a node by labels of its ancestors and itself, starting from a top level node.
+        When more siblings share a label, the first one leading to the rest of the path wins.
+
+        Args:
+            path (str): labels joined by separator. Example: "Root/Purchasing/Orders"
+            separator (str): separator of labels in path
+
+        Returns:
+            Node | None: The Node object if found, otherwise None.
+
+        Raises:
+            ActionException: labels were not loaded, see attributes
+
+        Example:
+            ```
+            orders = tree.get_node_by_path("Root/Purchasing/Orders")
+            ```
+        """
+        self._require_attribute("label", "path lookup")
+
+        labels = path.split(separator)
+        self._load_hierarchy()
+        nodes = self._roots
+
+        for label in labels[:-1]:
+            nodes = [child for n in nodes if n.label == label for child in self._child_list(n)]
+
+        return next((n for n in nodes if n.label == labels[-1]), None)
+
+    def find_nodes(self, pattern: str | None = None, prefix: str | None = None) -> list[Node]:
+        """
+        Get nodes whose label matches a regular expression and/or starts with a prefix.
+        Labels are searched at once as a polars Series.
+
+        Args:
+            pattern (str | None): regular expression searched anywhere in label, Rust regex syntax
+            prefix (str | None): literal start of label
+
+        Returns:
+            list[Node]: matching nodes in tree order, nodes without label never match
+
+        Raises:
+            ValueError: neither pattern nor prefix given
+
+        Example:
+            ```
+            orders = tree.find_nodes(pattern=r"^Order \\d+$")
+            ```
+        """
+        if pattern is None and prefix is None:
+            raise ValueError("Pattern or prefix is required")
+
+        mask = self._match_labels(pattern, prefix)
+
+        return [self._nodes[i] for i in mask.arg_true()]
+
+    def _match_labels(self, pattern: str | None, prefix: str | None) -> "pl.Series":
+        import polars as pl
+
+        labels = pl.Series([n.label for n in self._nodes], dtype=pl.String)
+        mask = pl.Series([True] * len(labels), dtype=pl.Boolean)
+
+        if pattern is not None:
+            mask &= labels.str.contains(pattern)
+        if prefix is not None:
+            mask &= labels.str.starts_with(prefix)
+
+        return mask.fill_null(False)
+
+    def walk(self, max_depth: int | None = None) -> Iterator[Node]:
+        """
+        Yields nodes depth first, parents before their children.
+
+        Lazy tree reads each folder's children when the walk reaches it and adds them to the tree,
+        so walked nodes support get_parent(), get_node_by_key() and the other lookups,
+        max_depth limits how much of a large tree is read.
+
+        Args:
+            max_depth (int | None): deepest level to walk, 0 for top level nodes only, None for all levels
+
+        Yields:
+            Node: nodes in tree order
+
+        Example:
+            ```
+            for node in tree.walk(max_depth=1):
+                print(node.key, node.label)
+            ```
+        """
+        self._load_hierarchy()
+        stack = [iter(self._roots)]
+
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                continue
+
+            yield node
+
+            if max_depth is None or len(stack) <= max_depth:
+                stack.append(iter(self._walk_children(node)))
+
+    def _walk_children(self, node: Node) -> list[Node]:
+        if self.lazy and node.key not in self._children and node.is_folder is False:
+            return []
+
+        return self._child_list(node)
+
+    def get_columns(self, column_names: Literal["name", "title"] = "name") -> list[str]:
+        """
+        Get item columns of the tree.
+        Columns of a column tree, items of a list tree are named by their position - "1", "2" ...
+
+        Args:
+            column_names (Literal["name", "title"]): technical column names, or column titles of a column tree
+
+        Returns:
+            list[str]: columns in tree order, empty for a simple tree
+        """
+        if self._loader.tree_type() == tree_loader.LIST_TREE:
+            count = max((len(n.items) for n in self._nodes if n.items), default=0)
+            return [str(position) for position in range(1, count + 1)]
+
+        names = self._loader.column_names()
+        if column_names == "title":
+            return [self._loader.call("GetColumnTitleFromName", name) for name in names]
+
+        return list(names)
+
+    def to_polars(self, separator: str = "/", column_names: Literal["name", "title"] = "name") -> "pl.DataFrame":
+        """
+        Export nodes read so far into a flat DataFrame, one row per node in tree order,
+        parents before their children, also for a lazy tree that read them in another order.
+        Columns are key, parent_key, depth, path, label and one String column per item column,
+        item columns are None unless items is in attributes.
+
+        Args:
+            separator (str): joins labels of ancestors and the node into path
+            column_names (Literal["name", "title"]): item columns named by technical name or title
+
+        Returns:
+            polars.DataFrame: tree as a table, parent_key is None for top level nodes
+
+        Example:
+            ```
+            tree = main_window.read_shell_tree("wnd[0]/shellcont/shellcont/shell")
+            df = tree.to_polars()
+            df.filter(pl.col("depth") == 1).select("path", "STATUS")
+            ```
+        """
+        import polars as pl
+
+        parents = self._load_hierarchy()
+        names = self.get_columns("name")
+        titles = self.get_columns(column_names) if names else []
+
+        depths: dict[str, int] = {}
+        paths: dict[str, str] = {}
+        data: dict[str, list] = {name: [] for name in ("key", "parent_key", "depth", "path", "label")}
+        item_columns: list[list[str | None]] = [[] for _ in names]
+
+        for node in self._tree_order():
+            parent = parents.get(node.key)
+            label = node.label if node.label is not None else ""
+
+            depths[node.key] = depths[parent.key] + 1 if parent is not None else 0
+            paths[node.key] = f"{paths[parent.key]}{separator}{label}" if parent is not None else label
+
+            data["key"].append(node.key)
+            data["parent_key"].append(parent.key if parent is not None else None)
+            data["depth"].append(depths[node.key])
+            data["path"].append(paths[node.key])
+            data["label"].append(node.label)
+
+            for column, name in zip(item_columns, names):
+                column.append(node.items.get(name) if node.items is not None else None)
+
+        schema: dict[str, pl.DataType] = {
+            "key": pl.String(), "parent_key": pl.String(), "depth": pl.Int32(), "path": pl.String(), "label": pl.String(),
+        }
+        for position, (title, column) in enumerate(zip(titles, item_columns)):
+            title = title if title not in data else f"{title}_{position}"
+            data[title] = column
+            schema[title] = pl.String()
+
+        return pl.DataFrame(data, schema=schema)
+
     def get_nodes(self) -> list[Node]:
         """
         Get all nodes in the shell tree.
@@ -247,15 +689,20 @@ class ShellTree:
             list[Node]: A list of Node objects representing all nodes in the shell tree.
         """
         return self._nodes
-    
+
     def get_node_folders(self) -> list[Node]:
         """
         Get all folder nodes in the shell tree.
 
         Returns:
             list[Node]: A list of Node objects that are folders.
+
+        Raises:
+            ActionException: is_folder was not loaded, see attributes
         """
-        return [n for n in self._nodes if n.is_folder]
+        self._require_attribute("is_folder", "folder list")
+
+        return list(self._folders)
 
     def get_node_not_folders(self) -> list[Node]:
         """
@@ -263,13 +710,21 @@ class ShellTree:
         
         Returns:
             list[Node]: A list of Node objects that are not folders.
+
+        Raises:
+            ActionException: is_folder was not loaded, see attributes
         """
-        return [n for n in self._nodes if not n.is_folder]
+        self._require_attribute("is_folder", "folder list")
+
+        return list(self._not_folders)
 
     def select_all(self) -> None:
         """
         Select all nodes in the shell tree.
         This method iterates through all nodes that are not folders and selects them.
+
+        Raises:
+            ActionException: is_folder was not loaded, see attributes
         """
         for node in self.get_node_not_folders():
             node.select()
@@ -284,7 +739,11 @@ class ShellTree:
     def expand_all(self) -> None:
         """
         Expand all folder nodes in the shell tree.
-        This method iterates through all folder nodes and expands them.
+        This method iterates through all folder nodes and expands them,
+        a lazy tree expands the folders read so far and reads their children, not the whole tree.
+
+        Raises:
+            ActionException: is_folder was not loaded, see attributes
         """
         for folder in self.get_node_folders():
             folder.expand()
@@ -293,6 +752,9 @@ class ShellTree:
         """
          Collapse all folder nodes in the shell tree.
          This method iterates through all folder nodes and collapses them.
+
+         Raises:
+             ActionException: is_folder was not loaded, see attributes
          """
         for folder in self.get_node_folders():
             folder.collapse()
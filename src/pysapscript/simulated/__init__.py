@@ -0,0 +1,41 @@
+"""
+In-process simulated SAP GUI scripting engine for tests and benchmarks
+
+Inject it with `Sapscript(sap_gui_auto=SimulatedSapGui())`, no SAP or Windows is needed.
+"""
+
+from .engine import (
+    SimulatedSapGui,
+    SimulatedApplication,
+    SimulatedConnection,
+    SimulatedSession,
+    SimulatedSessionInfo,
+    SimulatedHandle,
+    SESSION_MANAGER,
+)
+from .components import (
+    SimulatedCollection,
+    SimulatedComponent,
+    SimulatedContainer,
+    SimulatedUserArea,
+    SimulatedScrollbar,
+    SimulatedLabel,
+    SimulatedTextField,
+    SimulatedCTextField,
+    SimulatedPasswordField,
+    SimulatedOkCodeField,
+    SimulatedCheckBox,
+    SimulatedRadioButton,
+    SimulatedComboBox,
+    SimulatedButton,
+    SimulatedTab,
+    SimulatedMenu,
+    SimulatedStatusbar,
+    SimulatedHtmlViewer,
+    SimulatedWindow,
+    SimulatedModalWindow,
+)
+from .grid import SimulatedGridView
+from .table_control import SimulatedTableControl
+from .list_output import SimulatedListOutput
+from .tree import SimulatedTree, SIMPLE_TREE, LIST_TREE, COLUMN_TREE
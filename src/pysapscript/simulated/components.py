@@ -0,0 +1,624 @@
+from typing import Any, Callable, Iterator, TYPE_CHECKING
+
+from pysapscript.types_.exceptions import ScriptingError
+
+if TYPE_CHECKING:
+    from pysapscript.simulated.engine import SimulatedSession
+
+
+class SimulatedCollection:
+    """
+    GuiCollection - Count, Length, call by index, ElementAt, iteration
+    """
+
+    def __init__(self, items: list[Any]) -> None:
+        self._items = items
+
+    def __repr__(self) -> str:
+        return f"SimulatedCollection({self._items!r})"
+
+    def __call__(self, index: int) -> Any:
+        return self.ElementAt(index)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._items))
+
+    @property
+    def Count(self) -> int:
+        return len(self._items)
+
+    @property
+    def Length(self) -> int:
+        return len(self._items)
+
+    def ElementAt(self, index: int) -> Any:
+        if not 0 <= index < len(self._items):
+            raise ScriptingError(f"Index {index} out of range of collection with {len(self._items)} items")
+
+        return self._items[index]
+
+    def Item(self, index: int) -> Any:
+        return self.ElementAt(index)
+
+
+class SimulatedObject:
+    """
+    Base of simulated scripting objects, attribute names are case insensitive like in COM
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        canonical = _canonical_name(self, name)
+        if canonical is None or canonical == name:
+            raise AttributeError(f"{type(self).__name__} has no property or method {name}")
+
+        return getattr(self, canonical)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not name.startswith("_"):
+            name = _canonical_name(self, name) or name
+
+        object.__setattr__(self, name, value)
+
+
+class SimulatedComponent(SimulatedObject):
+    """
+    GuiComponent placed in the element tree of a session
+    """
+
+    type_name = "GuiComponent"
+    container = False
+
+    def __init__(self, name: str, text: str = "", tooltip: str = "", changeable: bool = False) -> None:
+        """
+        Args:
+            name (str): ID part of the element, e.g. "ctxtDATABROWSE-TABLENAME" or "btn[0]"
+            text (str): text of the element
+            tooltip (str): tooltip of the element
+            changeable (bool): element accepts input if True
+        """
+        self._id_part = name
+        self._parent: SimulatedComponent | None = None
+        self._children: list[SimulatedComponent] = []
+        self._text = text
+        self.Tooltip = tooltip
+        self.Changeable = changeable
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.Id})"
+
+    @property
+    def Id(self) -> str:
+        prefix = self._parent.Id if self._parent is not None else ""
+
+        return f"{prefix}/{self._id_part}"
+
+    @property
+    def Name(self) -> str:
+        """
+        technical name - ID part without the type prefix and index
+        """
+        name = self._id_part.split("[", 1)[0]
+
+        for prefix in _TYPE_PREFIXES:
+            if name.startswith(prefix) and len(name) > len(prefix):
+                return name[len(prefix):]
+
+        return name
+
+    @property
+    def Type(self) -> str:
+        return self.type_name
+
+    @property
+    def ContainerType(self) -> bool:
+        return self.container
+
+    @property
+    def Parent(self) -> "SimulatedComponent | None":
+        return self._parent
+
+    @property
+    def Children(self) -> SimulatedCollection:
+        if not self.container:
+            raise AttributeError(f"{self.type_name} has no property Children")
+
+        return SimulatedCollection(self._children)
+
+    @property
+    def Text(self) -> str:
+        return self._text
+
+    @Text.setter
+    def Text(self, value: str) -> None:
+        if not self.Changeable:
+            raise ScriptingError(f"Element {self.Id} is not changeable")
+
+        self._text = str(value)
+
+    @property
+    def session(self) -> "SimulatedSession":
+        """
+        session the element belongs to, not part of the scripting API
+        """
+        element: SimulatedComponent | None = self
+
+        while element is not None:
+            if element.Type == "GuiSession":
+                return element  # type: ignore[return-value]
+
+            element = element._parent
+
+        raise ScriptingError(f"Element {self._id_part} is not placed in a session")
+
+    def add(self, element: "SimulatedComponent") -> "SimulatedComponent":
+        """
+        Places element into this container, replaces element with the same ID part
+
+        Args:
+            element (SimulatedComponent): element to place
+
+        Returns:
+            SimulatedComponent: placed element
+        """
+        if not self.container:
+            raise ScriptingError(f"{self.type_name} is not a container")
+
+        self._children = [c for c in self._children if c._id_part != element._id_part]
+        self._children.append(element)
+        element._parent = self
+
+        return element
+
+    def clear(self) -> None:
+        """
+        Removes all children of this container
+        """
+        for child in self._children:
+            child._parent = None
+
+        self._children = []
+
+    def child(self, id_part: str) -> "SimulatedComponent | None":
+        """
+        Gets child by ID part
+        """
+        for child in self._children:
+            if child._id_part == id_part:
+                return child
+
+        return None
+
+    def findById(self, element_id: str) -> "SimulatedComponent":
+        element: SimulatedComponent | None = self
+        parts = element_id.strip("/").split("/")
+
+        if element_id.startswith("/"):
+            while element._parent is not None:
+                element = element._parent
+
+            if parts[0] != element._id_part:
+                raise ScriptingError(f"The control could not be found by id. ({element_id})")
+
+            parts = parts[1:]
+
+        for part in parts:
+            element = element.child(part) if element is not None else None
+            if element is None:
+                raise ScriptingError(f"The control could not be found by id. ({element_id})")
+
+        return element  # type: ignore[return-value]
+
+    def FindById(self, element_id: str) -> "SimulatedComponent":
+        return self.findById(element_id)
+
+    def SetFocus(self) -> None:
+        self.session._focused = self
+
+    def Visualize(self, on: bool = True) -> bool:
+        return True
+
+    def walk(self) -> Iterator["SimulatedComponent"]:
+        """
+        Iterates over all elements below this one, not part of the scripting API
+        """
+        for child in self._children:
+            yield child
+            yield from child.walk()
+
+
+class SimulatedContainer(SimulatedComponent):
+    type_name = "GuiSimpleContainer"
+    container = True
+
+
+class SimulatedUserArea(SimulatedContainer):
+    type_name = "GuiUserArea"
+
+    def __init__(self, name: str = "usr") -> None:
+        super().__init__(name)
+        self.VerticalScrollbar = SimulatedScrollbar()
+        self.HorizontalScrollbar = SimulatedScrollbar()
+
+    def clear(self) -> None:
+        super().clear()
+        self.VerticalScrollbar = SimulatedScrollbar()
+        self.HorizontalScrollbar = SimulatedScrollbar()
+
+
+class SimulatedScrollbar(SimulatedObject):
+    """
+    GuiScrollbar, position changes run on_scroll of the owner
+    """
+
+    def __init__(self, maximum: int = 0, page_size: int = 0) -> None:
+        self._position = 0
+        self.Minimum = 0
+        self.Maximum = maximum
+        self.PageSize = page_size
+        self._on_scroll: Callable[[int], None] | None = None
+
+    @property
+    def Position(self) -> int:
+        return self._position
+
+    @Position.setter
+    def Position(self, value: int) -> None:
+        if not self.Minimum <= value <= self.Maximum:
+            raise ScriptingError(f"Scrollbar position {value} out of range {self.Minimum}-{self.Maximum}")
+
+        self._position = value
+        if self._on_scroll is not None:
+            self._on_scroll(value)
+
+
+class SimulatedLabel(SimulatedComponent):
+    type_name = "GuiLabel"
+
+    def __init__(self, name: str, text: str = "", tooltip: str = "", char_left: int = 0, char_top: int = 0) -> None:
+        super().__init__(name, text=text, tooltip=tooltip)
+        self.CharLeft = char_left
+        self.CharTop = char_top
+        self.CharWidth = len(text)
+        self.CharHeight = 1
+
+
+class SimulatedTextField(SimulatedComponent):
+    type_name = "GuiTextField"
+
+    def __init__(
+        self,
+        name: str,
+        text: str = "",
+        label: str | None = None,
+        tooltip: str = "",
+        changeable: bool = True,
+        max_length: int = 132,
+    ) -> None:
+        """
+        Args:
+            name (str): ID part, e.g. "txtMAX_SEL"
+            text (str): text of the field
+            label (str | None): text of the label on the left
+            tooltip (str): tooltip
+            changeable (bool): field accepts input if True
+            max_length (int): longest accepted text
+        """
+        super().__init__(name, text=text, tooltip=tooltip, changeable=changeable)
+        self.MaxLength = max_length
+        self.LeftLabel = SimulatedLabel(f"lbl{self.Name}", label) if label is not None else None
+
+    @property
+    def Text(self) -> str:
+        return self._text
+
+    @Text.setter
+    def Text(self, value: str) -> None:
+        if not self.Changeable:
+            raise ScriptingError(f"Element {self.Id} is not changeable")
+
+        if len(str(value)) > self.MaxLength:
+            raise ScriptingError(f"Text longer than {self.MaxLength} characters for {self.Id}")
+
+        self._text = str(value)
+
+
+class SimulatedCTextField(SimulatedTextField):
+    type_name = "GuiCTextField"
+
+
+class SimulatedPasswordField(SimulatedTextField):
+    type_name = "GuiPasswordField"
+
+
+class SimulatedOkCodeField(SimulatedTextField):
+    type_name = "GuiOkCodeField"
+
+    def __init__(self, name: str = "okcd") -> None:
+        super().__init__(name)
+
+
+class SimulatedCheckBox(SimulatedComponent):
+    type_name = "GuiCheckBox"
+
+    def __init__(self, name: str, text: str = "", selected: bool = False, tooltip: str = "", changeable: bool = True) -> None:
+        super().__init__(name, text=text, tooltip=tooltip, changeable=changeable)
+        self._selected = selected
+
+    @property
+    def Selected(self) -> bool:
+        return self._selected
+
+    @Selected.setter
+    def Selected(self, value: bool) -> None:
+        if not self.Changeable:
+            raise ScriptingError(f"Element {self.Id} is not changeable")
+
+        self._selected = bool(value)
+
+
+class SimulatedRadioButton(SimulatedComponent):
+    """
+    GuiRadioButton, selecting unselects radio buttons of the same container
+    """
+
+    type_name = "GuiRadioButton"
+
+    def __init__(self, name: str, text: str = "", selected: bool = False, tooltip: str = "", changeable: bool = True) -> None:
+        super().__init__(name, text=text, tooltip=tooltip, changeable=changeable)
+        self._selected = selected
+
+    @property
+    def Selected(self) -> bool:
+        return self._selected
+
+    def select(self) -> None:
+        if not self.Changeable:
+            raise ScriptingError(f"Element {self.Id} is not changeable")
+
+        if self._parent is not None:
+            for sibling in self._parent._children:
+                if isinstance(sibling, SimulatedRadioButton):
+                    sibling._selected = False
+
+        self._selected = True
+
+
+class SimulatedComboBoxEntry(SimulatedObject):
+    def __init__(self, key: str, value: str, pos: int) -> None:
+        self.Key = key
+        self.Value = value
+        self.Pos = pos
+
+
+class SimulatedComboBox(SimulatedComponent):
+    type_name = "GuiComboBox"
+
+    def __init__(self, name: str, entries: dict[str, str], key: str | None = None, label: str | None = None,
+                 tooltip: str = "", changeable: bool = True) -> None:
+        """
+        Args:
+            name (str): ID part, e.g. "cmbG_LISTBOX"
+            entries (dict[str, str]): key and text of entries
+            key (str | None): key of selected entry, first entry if None
+            label (str | None): text of the label on the left
+            tooltip (str): tooltip
+            changeable (bool): selection can be changed if True
+        """
+        super().__init__(name, tooltip=tooltip, changeable=changeable)
+        self._entries = [SimulatedComboBoxEntry(k, v, i + 1) for i, (k, v) in enumerate(entries.items())]
+        self._key = key if key is not None else (self._entries[0].Key if self._entries else "")
+        self.LeftLabel = SimulatedLabel(f"lbl{self.Name}", label) if label is not None else None
+
+    @property
+    def Entries(self) -> SimulatedCollection:
+        return SimulatedCollection(self._entries)
+
+    @property
+    def Key(self) -> str:
+        return self._key
+
+    @Key.setter
+    def Key(self, value: str) -> None:
+        if not self.Changeable:
+            raise ScriptingError(f"Element {self.Id} is not changeable")
+
+        if all(entry.Key != value for entry in self._entries):
+            raise ScriptingError(f"Key {value} is not an entry of {self.Id}")
+
+        self._key = value
+
+    @property
+    def Value(self) -> str:
+        return next((e.Value for e in self._entries if e.Key == self._key), "")
+
+    @property
+    def Text(self) -> str:
+        return self.Value
+
+
+class SimulatedButton(SimulatedComponent):
+    """
+    GuiButton, pressing runs on_press with the session
+    """
+
+    type_name = "GuiButton"
+
+    def __init__(self, name: str, text: str = "", tooltip: str = "",
+                 on_press: "Callable[[SimulatedSession], None] | None" = None) -> None:
+        super().__init__(name, text=text, tooltip=tooltip, changeable=True)
+        self._on_press = on_press
+        self.pressed = 0
+
+    def press(self) -> None:
+        self.pressed += 1
+
+        if self._on_press is not None:
+            self._on_press(self.session)
+
+
+class SimulatedTab(SimulatedContainer):
+    type_name = "GuiTab"
+
+    def __init__(self, name: str, text: str = "") -> None:
+        super().__init__(name, text=text)
+
+    @property
+    def Selected(self) -> bool:
+        return self._parent is not None and getattr(self._parent, "_selected_tab", None) is self
+
+    def select(self) -> None:
+        if self._parent is not None:
+            self._parent._selected_tab = self
+
+
+class SimulatedMenu(SimulatedContainer):
+    """
+    GuiMenu, selecting runs on_select with the session
+    """
+
+    type_name = "GuiMenu"
+
+    def __init__(self, name: str, text: str = "",
+                 on_select: "Callable[[SimulatedSession], None] | None" = None) -> None:
+        super().__init__(name, text=text)
+        self._on_select = on_select
+
+    def select(self) -> None:
+        if self._on_select is not None:
+            self._on_select(self.session)
+
+
+class SimulatedStatusPane(SimulatedComponent):
+    type_name = "GuiStatusPane"
+
+    @property
+    def Text(self) -> str:
+        return self._parent.Text if self._parent is not None else ""
+
+
+class SimulatedStatusbar(SimulatedContainer):
+    type_name = "GuiStatusbar"
+
+    def __init__(self, name: str = "sbar") -> None:
+        super().__init__(name)
+        self.MessageType = ""
+        self.MessageId = ""
+        self.MessageNumber = ""
+        self.MessageParameter = ""
+        self.add(SimulatedStatusPane("pane[0]"))
+
+    def set_message(self, message_type: str, text: str, message_id: str = "",
+                    number: str = "", parameters: tuple[str, ...] = ()) -> None:
+        """
+        Shows message, not part of the scripting API
+        """
+        self.MessageType = message_type
+        self.MessageId = message_id
+        self.MessageNumber = number
+        self.MessageParameter = parameters[0] if parameters else ""
+        self._text = text
+
+    @property
+    def Text(self) -> str:
+        return self._text
+
+
+class SimulatedHtmlViewer(SimulatedComponent):
+    type_name = "GuiShell"
+
+    def __init__(self, name: str, html: str = "") -> None:
+        super().__init__(name)
+        self.SubType = "HTMLViewer"
+        document_element = SimulatedObject()
+        object.__setattr__(document_element, "innerHTML", html)
+        document = SimulatedObject()
+        object.__setattr__(document, "documentElement", document_element)
+        self.BrowserHandle = SimulatedObject()
+        object.__setattr__(self.BrowserHandle, "Document", document)
+
+
+class SimulatedWindow(SimulatedContainer):
+    """
+    GuiMainWindow or GuiModalWindow
+    """
+
+    type_name = "GuiMainWindow"
+
+    def __init__(self, name: str, text: str = "") -> None:
+        super().__init__(name, text=text)
+        self.Iconic = False
+        self.Maximized = False
+        self.message_boxes: list[tuple[str, str]] = []
+
+    def maximize(self) -> None:
+        self.Maximized = True
+
+    def restore(self) -> None:
+        self.Maximized = False
+
+    def iconify(self) -> None:
+        self.Iconic = True
+
+    def close(self) -> None:
+        self.session._close_window(self)
+
+    def sendVKey(self, value: int) -> None:
+        self.session._send_v_key(self, value)
+
+    def SendVKey(self, value: int) -> None:
+        self.sendVKey(value)
+
+    def IsVKeyAllowed(self, value: int) -> bool:
+        return 0 <= value <= 99
+
+    def TabForward(self) -> None:
+        pass
+
+    def TabBackward(self) -> None:
+        pass
+
+    def ShowMessageBox(self, title: str, text: str, icon: int = 0, buttons: int = 0) -> int:
+        self.message_boxes.append((title, text))
+        return 0
+
+
+class SimulatedModalWindow(SimulatedWindow):
+    type_name = "GuiModalWindow"
+
+
+# ID prefixes stripped from the technical name, longest first
+_TYPE_PREFIXES = (
+    "shellcont", "ctxt", "cntl", "tabs", "tabp", "tabx", "chk", "rad", "cmb", "txt", "pwd", "lbl",
+    "btn", "sub", "tbl", "ssub", "usr",
+)
+
+_CANONICAL_NAMES: dict[type, dict[str, str]] = {}
+
+
+def _canonical_name(instance: object, name: str) -> str | None:
+    """
+    finds attribute of the instance that differs from name only in case
+    """
+    cls = type(instance)
+    names = _CANONICAL_NAMES.get(cls)
+
+    if names is None:
+        names = {n.lower(): n for n in dir(cls) if not n.startswith("_")}
+        _CANONICAL_NAMES[cls] = names
+
+    lower = name.lower()
+    canonical = names.get(lower)
+    if canonical is not None:
+        return canonical
+
+    for attribute in getattr(instance, "__dict__", {}):
+        if attribute.lower() == lower:
+            return attribute
+
+    return None
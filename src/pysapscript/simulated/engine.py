@@ -0,0 +1,521 @@
+import threading
+import time
+from typing import Any, Callable
+
+from pysapscript.simulated.components import (
+    SimulatedObject,
+    SimulatedComponent,
+    SimulatedContainer,
+    SimulatedCollection,
+    SimulatedWindow,
+    SimulatedModalWindow,
+    SimulatedUserArea,
+    SimulatedOkCodeField,
+    SimulatedTextField,
+    SimulatedButton,
+    SimulatedStatusbar,
+)
+from pysapscript.utils.handle_proxy import HandleProxy
+from pysapscript.types_.exceptions import ScriptingError
+
+
+Builder = Callable[["SimulatedSession"], None]
+
+# transaction shown after logon and after /n
+SESSION_MANAGER = "SESSION_MANAGER"
+
+# virtual keys handled by the engine itself
+_V_KEY_ENTER = 0
+_V_KEYS_LEAVE = (3, 12, 15)
+
+
+class SimulatedSessionInfo(SimulatedObject):
+    """
+    GuiSessionInfo
+    """
+
+    def __init__(self, system: str, client: str, user: str, language: str, session_number: int) -> None:
+        self.SystemName = system
+        self.Client = client
+        self.User = user
+        self.Language = language
+        self.SessionNumber = session_number
+        self.Transaction = SESSION_MANAGER
+        self.Program = "SAPLSMTR_NAVIGATION"
+        self.ScreenNumber = 100
+
+
+class SimulatedSession(SimulatedContainer):
+    """
+    GuiSession with main window wnd[0], popups are the following windows
+    """
+
+    type_name = "GuiSession"
+
+    def __init__(self, number: int, info: SimulatedSessionInfo) -> None:
+        super().__init__(f"ses[{number}]")
+        self.Info = info
+        self.Busy = False
+        self.v_key_handlers: dict[int, Builder] = {}
+        self.on_enter: Builder | None = None
+        self._focused: SimulatedComponent | None = None
+        self._build_main_window()
+
+    @property
+    def Id(self) -> str:
+        if self._parent is None:
+            raise ScriptingError("The session has been closed")
+
+        return super().Id
+
+    @property
+    def main_window(self) -> SimulatedWindow:
+        """
+        wnd[0], not part of the scripting API
+        """
+        return self._children[0]  # type: ignore[return-value]
+
+    @property
+    def usr(self) -> SimulatedContainer:
+        """
+        user area of the main window, not part of the scripting API
+        """
+        return self.main_window.findById("usr")  # type: ignore[return-value]
+
+    @property
+    def statusbar(self) -> SimulatedStatusbar:
+        """
+        status bar of the main window, not part of the scripting API
+        """
+        return self.main_window.findById("sbar")  # type: ignore[return-value]
+
+    @property
+    def ActiveWindow(self) -> SimulatedWindow:
+        return self._children[-1]  # type: ignore[return-value]
+
+    def place(self, element_id: str, element: SimulatedComponent) -> SimulatedComponent:
+        """
+        Places element to ID relative to session, missing containers on the way are created
+
+        Args:
+            element_id (str): ID of the element, e.g. "wnd[0]/usr/cntlGRID1/shellcont/shell"
+            element (SimulatedComponent): element, its ID part must match the last part of the ID
+
+        Returns:
+            SimulatedComponent: placed element
+
+        Example:
+            ```
+            session.place("wnd[0]/usr/ctxtP_BUKRS", SimulatedCTextField("ctxtP_BUKRS", label="Company Code"))
+            ```
+        """
+        *parents, last = element_id.strip("/").split("/")
+        if last != element._id_part:
+            raise ScriptingError(f"ID {element_id} does not end with {element._id_part}")
+
+        container: SimulatedComponent = self
+        for part in parents:
+            child = container.child(part)
+            if child is None:
+                child = container.add(SimulatedContainer(part))
+
+            container = child
+
+        return container.add(element)
+
+    def set_status(
+        self,
+        message_type: str,
+        text: str,
+        message_id: str = "",
+        number: str = "",
+        parameters: tuple[str, ...] = (),
+    ) -> None:
+        """
+        Shows message in the status bar, not part of the scripting API
+
+        Args:
+            message_type (str): S, W, E, A or I
+            text (str): message text
+            message_id (str): message class
+            number (str): message number
+            parameters (tuple[str, ...]): message parameters
+        """
+        self.statusbar.set_message(message_type, text, message_id, number, parameters)
+
+    def open_popup(
+        self,
+        title: str,
+        text: str = "",
+        buttons: dict[str, Builder | None] | None = None,
+    ) -> SimulatedModalWindow:
+        """
+        Opens popup over the active window, not part of the scripting API
+
+        Lines of text are shown as usr/txtMESSTXT1, usr/txtMESSTXT2...
+        Buttons are placed to usr, tbar[0]/btn[0] closes the popup.
+
+        Args:
+            title (str): popup title
+            text (str): popup text
+            buttons (dict[str, Callable[[SimulatedSession], None] | None] | None): ID part and action
+                of buttons, the popup closes after the action, e.g. {"btnSPOP-OPTION1": None}
+
+        Returns:
+            SimulatedModalWindow: opened popup
+        """
+        popup = SimulatedModalWindow(f"wnd[{len(self._children)}]", text=title)
+        self.add(popup)
+
+        usr = popup.add(SimulatedUserArea())
+        for i, line in enumerate(text.splitlines(), start=1):
+            usr.add(SimulatedTextField(f"txtMESSTXT{i}", text=line, changeable=False))
+
+        for name, action in (buttons or {}).items():
+            usr.add(SimulatedButton(name, on_press=self._closing(popup, action)))
+
+        toolbar = popup.add(SimulatedContainer("tbar[0]"))
+        toolbar.add(SimulatedButton("btn[0]", on_press=self._closing(popup, None)))
+
+        return popup
+
+    def register_v_key(self, key: int, handler: Builder) -> None:
+        """
+        Runs handler when virtual key is sent to the main window of the current screen,
+        not part of the scripting API
+
+        Args:
+            key (int): virtual key, e.g. 82 for page down
+            handler (Callable[[SimulatedSession], None]): action
+        """
+        self.v_key_handlers[key] = handler
+
+    def StartTransaction(self, code: str) -> None:
+        self._start(code.strip().upper())
+
+    def EndTransaction(self) -> None:
+        self._start("")
+
+    def SendCommand(self, command: str) -> None:
+        command = command.strip()
+
+        if command.lower().startswith("/o"):
+            self.createSession()
+            self._connection.Children(self._connection.Children.Count - 1).StartTransaction(command[2:])
+            return
+
+        if command.lower().startswith("/n"):
+            command = command[2:]
+        elif not command:
+            return
+
+        self._start(command.upper())
+
+    def createSession(self) -> None:
+        self._connection.open_session()
+
+    def LockSessionUI(self) -> None:
+        pass
+
+    def UnlockSessionUI(self) -> None:
+        pass
+
+    @property
+    def _connection(self) -> "SimulatedConnection":
+        return self._parent  # type: ignore[return-value]
+
+    def _build_main_window(self) -> None:
+        window = self.add(SimulatedWindow("wnd[0]", text="SAP Easy Access"))
+        window.add(SimulatedContainer("mbar"))
+
+        toolbar = window.add(SimulatedContainer("tbar[0]"))
+        toolbar.add(SimulatedOkCodeField())
+        toolbar.add(SimulatedButton("btn[0]", tooltip="Enter", on_press=lambda s: s._send_v_key(s.main_window, 0)))
+        for number, tooltip in ((3, "Back"), (11, "Save"), (12, "Cancel"), (13, "Save"), (15, "Exit")):
+            toolbar.add(
+                SimulatedButton(f"btn[{number}]", tooltip=tooltip, on_press=lambda s, n=number: s._send_v_key(s.main_window, n))
+            )
+
+        window.add(SimulatedContainer("titl"))
+        window.add(SimulatedContainer("tbar[1]"))
+        window.add(SimulatedUserArea())
+        window.add(SimulatedStatusbar())
+
+    def _start(self, code: str) -> None:
+        """
+        leaves current screen and runs builder of transaction, empty code returns to session manager
+        """
+        builder = None
+        if code:
+            builder = self._connection.transactions.get(code)
+            if builder is None:
+                self.set_status("E", f"Transaction {code} does not exist", "00", "343", (code,))
+                return
+
+        while len(self._children) > 1:
+            self._children.pop()._parent = None
+
+        self.usr.clear()
+        self.findById("wnd[0]/tbar[1]").clear()
+        self.v_key_handlers = {}
+        self.on_enter = None
+        self.set_status("", "")
+
+        self.Info.Transaction = code or SESSION_MANAGER
+        self.Info.Program = f"SAPL{code}" if code else "SAPLSMTR_NAVIGATION"
+        self.Info.ScreenNumber = 1000 if code else 100
+        self.main_window._text = self._connection.titles.get(code, code) if code else "SAP Easy Access"
+
+        if builder is not None:
+            builder(self)
+
+    def _send_v_key(self, window: SimulatedWindow, key: int) -> None:
+        if window is not self.main_window:
+            if key == _V_KEY_ENTER and window.child("tbar[0]") is not None:
+                window.findById("tbar[0]/btn[0]").press()
+            else:
+                self._close_window(window)
+            return
+
+        if key == _V_KEY_ENTER:
+            okcd = window.findById("tbar[0]/okcd")
+            command, okcd._text = okcd._text, ""
+
+            if command:
+                self.SendCommand(command)
+            elif self.on_enter is not None:
+                self.on_enter(self)
+            return
+
+        handler = self.v_key_handlers.get(key)
+        if handler is not None:
+            handler(self)
+        elif key in _V_KEYS_LEAVE:
+            self._start("")
+
+    def _close_window(self, window: SimulatedWindow) -> None:
+        if window is self.main_window:
+            self._connection.CloseSession(self.Id)
+            return
+
+        if window in self._children:
+            self._children.remove(window)
+            window._parent = None
+
+    def _closing(self, popup: SimulatedWindow, action: Builder | None) -> Builder:
+        """
+        action that closes popup after running
+        """
+        def close(session: SimulatedSession) -> None:
+            session._close_window(popup)
+
+            if action is not None:
+                action(session)
+
+        return close
+
+
+class SimulatedConnection(SimulatedContainer):
+    """
+    GuiConnection, transactions registered on it are available in all its sessions
+    """
+
+    type_name = "GuiConnection"
+
+    def __init__(self, number: int, system: str, client: str, user: str, language: str) -> None:
+        super().__init__(f"con[{number}]")
+        self.Description = system
+        self.transactions: dict[str, Builder] = {}
+        self.titles: dict[str, str] = {}
+        self._system = system
+        self._client = client
+        self._user = user
+        self._language = language
+
+    @property
+    def Sessions(self) -> SimulatedCollection:
+        return self.Children
+
+    def register_transaction(self, code: str, builder: Builder, title: str | None = None) -> None:
+        """
+        Registers screen of transaction, not part of the scripting API
+
+        Args:
+            code (str): transaction code, e.g. "SE16"
+            builder (Callable[[SimulatedSession], None]): places elements of the screen to the session
+            title (str | None): window title, transaction code if None
+
+        Example:
+            ```
+            def se16(session: SimulatedSession) -> None:
+                session.place("wnd[0]/usr/ctxtDATABROWSE-TABLENAME", SimulatedCTextField("ctxtDATABROWSE-TABLENAME"))
+
+            connection.register_transaction("SE16", se16, title="Data Browser: Initial Screen")
+            ```
+        """
+        self.transactions[code.upper()] = builder
+        if title is not None:
+            self.titles[code.upper()] = title
+
+    def open_session(self) -> SimulatedSession:
+        """
+        Opens new session in session manager, not part of the scripting API
+
+        Returns:
+            SimulatedSession: opened session
+        """
+        if len(self._children) >= 6:
+            raise ScriptingError("Maximum number of sessions reached")
+
+        used = {child._id_part for child in self._children}
+        number = next(n for n in range(len(used) + 1) if f"ses[{n}]" not in used)
+
+        info = SimulatedSessionInfo(self._system, self._client, self._user, self._language, number + 1)
+        session = SimulatedSession(number, info)
+        self.add(session)
+
+        return session
+
+    def CloseSession(self, session_id: str) -> None:
+        session = self.findById(session_id)
+        self._children.remove(session)
+        session._parent = None
+
+    def CloseConnection(self) -> None:
+        if self._parent is not None:
+            self._parent._children.remove(self)
+            self._parent = None
+
+
+class SimulatedApplication(SimulatedContainer):
+    """
+    GuiApplication - the scripting engine
+    """
+
+    type_name = "GuiApplication"
+
+    def __init__(self) -> None:
+        super().__init__("app")
+        self.MajorVersion = 8
+        self.MinorVersion = 0
+
+    @property
+    def Connections(self) -> SimulatedCollection:
+        return self.Children
+
+    def open_connection(
+        self,
+        system: str = "SQ4",
+        client: str = "012",
+        user: str = "ROBOT",
+        language: str = "EN",
+    ) -> SimulatedConnection:
+        """
+        Opens connection with one logged on session, not part of the scripting API
+
+        Args:
+            system (str): system ID
+            client (str): client
+            user (str): user name
+            language (str): logon language
+
+        Returns:
+            SimulatedConnection: opened connection
+        """
+        connection = SimulatedConnection(len(self._children), system, client, user, language)
+        self.add(connection)
+        connection.open_session()
+
+        return connection
+
+    def OpenConnection(self, description: str, sync: bool = True) -> SimulatedConnection:
+        return self.open_connection(description)
+
+
+class SimulatedSapGui:
+    """
+    In-process stand-in of the SAP GUI scripting engine, runs anywhere without SAP or Windows
+
+    Every operation done through GetScriptingEngine is counted and delayed by latency,
+    so tests and benchmarks see the number of round trips a real SAP GUI would get.
+
+    Example:
+        ```
+        sap_gui = SimulatedSapGui(latency=0.001)
+        connection = sap_gui.application.open_connection("SQ4", "012")
+        connection.register_transaction("SE16", build_se16)
+
+        pss = pysapscript.Sapscript(sap_gui_auto=sap_gui)
+        main_window = pss.attach_window(0, 0)
+        main_window.start_transaction("SE16")
+        print(sap_gui.call_count)
+        ```
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """
+        Args:
+            latency (float): seconds added to every operation
+        """
+        self.application = SimulatedApplication()
+        self.latency = latency
+        self.calls: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"SimulatedSapGui(latency={self.latency}, calls={self.call_count})"
+
+    def __str__(self) -> str:
+        return f"SimulatedSapGui(latency={self.latency}, calls={self.call_count})"
+
+    @property
+    def GetScriptingEngine(self) -> "SimulatedHandle":
+        return SimulatedHandle(self.application, "app", self)
+
+    @property
+    def call_count(self) -> int:
+        """
+        Number of operations done since creation or last reset_calls()
+        """
+        with self._lock:
+            return sum(self.calls.values())
+
+    def reset_calls(self) -> None:
+        """
+        Resets counted operations
+        """
+        with self._lock:
+            self.calls.clear()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+
+class SimulatedHandle(HandleProxy):
+    """
+    Handle of a simulated object as seen by pysapscript, counts operations on the engine
+    """
+
+    __slots__ = ("_sap_gui",)
+
+    def __init__(self, handle: Any, element: str, sap_gui: SimulatedSapGui) -> None:
+        super().__init__(handle, element)
+        object.__setattr__(self, "_sap_gui", sap_gui)
+
+    def _spawn(self, handle: Any, element: str) -> "SimulatedHandle":
+        return SimulatedHandle(handle, element, self._sap_gui)
+
+    def _on_operation(
+        self,
+        kind: str,
+        name: str,
+        args: tuple,
+        result: Any,
+        error: Exception | None,
+        duration: float,
+    ) -> None:
+        self._sap_gui._count(name)
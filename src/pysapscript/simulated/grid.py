@@ -0,0 +1,190 @@
+from typing import Any, Callable, TYPE_CHECKING
+
+from pysapscript.simulated.components import SimulatedComponent, SimulatedCollection
+from pysapscript.types_.exceptions import ScriptingError
+
+if TYPE_CHECKING:
+    from pysapscript.simulated.engine import SimulatedSession
+
+
+class SimulatedGridView(SimulatedComponent):
+    """
+    GuiGridView (ALV shell table)
+
+    Like in SAP only rows scrolled into view are loaded, cells of other rows read as empty strings.
+    Rows are loaded by setting currentCellRow or firstVisibleRow.
+    """
+
+    type_name = "GuiShell"
+
+    def __init__(
+        self,
+        name: str,
+        columns: list[str],
+        rows: list[list[str]] | list[dict[str, str]],
+        visible_rows: int = 20,
+        column_titles: dict[str, str] | None = None,
+        on_button: "Callable[[SimulatedSession, str], None] | None" = None,
+    ) -> None:
+        """
+        Args:
+            name (str): ID part, usually "shell"
+            columns (list[str]): technical column names in display order
+            rows (list[list[str]] | list[dict[str, str]]): cell values, by position or by column
+            visible_rows (int): number of rows loaded by one scroll
+            column_titles (dict[str, str] | None): titles of columns, technical name if missing
+            on_button (Callable[[SimulatedSession, str], None] | None): called with pressed toolbar button,
+                selected context menu item or clicked cell column
+        """
+        super().__init__(name)
+        self.SubType = "GridView"
+        self._columns = list(columns)
+        self._rows = [
+            [str(row.get(c, "")) for c in self._columns] if isinstance(row, dict) else [str(v) for v in row]
+            for row in rows
+        ]
+        self._column_index = {column: i for i, column in enumerate(self._columns)}
+        self._column_titles = column_titles or {}
+        self._visible_rows = visible_rows
+        self._loaded = set(range(min(visible_rows, len(self._rows))))
+        self._current_row = -1
+        self._first_visible_row = 0
+        self._selected_rows: list[int] = []
+        self._checkboxes: dict[tuple[int, str], bool] = {}
+        self._on_button = on_button
+        self.CurrentCellColumn = self._columns[0] if self._columns else ""
+        self.actions: list[str] = []
+
+    @property
+    def RowCount(self) -> int:
+        return len(self._rows)
+
+    @property
+    def ColumnCount(self) -> int:
+        return len(self._columns)
+
+    @property
+    def ColumnOrder(self) -> SimulatedCollection:
+        return SimulatedCollection(list(self._columns))
+
+    @property
+    def VisibleRowCount(self) -> int:
+        return self._visible_rows
+
+    @property
+    def loaded_rows(self) -> int:
+        """
+        number of loaded rows, not part of the scripting API
+        """
+        return len(self._loaded)
+
+    def GetCellValue(self, row: int, column: str) -> str:
+        self._check_row(row)
+
+        if column not in self._column_index:
+            raise ScriptingError(f"Column {column} does not exist in {self.Id}")
+
+        if row not in self._loaded:
+            return ""
+
+        return self._rows[row][self._column_index[column]]
+
+    def GetColumnTitles(self, column: str) -> SimulatedCollection:
+        return SimulatedCollection([self._column_titles.get(column, column)])
+
+    def GetDisplayedColumnTitle(self, column: str) -> str:
+        return self._column_titles.get(column, column)
+
+    @property
+    def CurrentCellRow(self) -> int:
+        return self._current_row
+
+    @CurrentCellRow.setter
+    def CurrentCellRow(self, row: int) -> None:
+        self._check_row(row)
+        self._current_row = row
+        self._load(row)
+
+    @property
+    def FirstVisibleRow(self) -> int:
+        return self._first_visible_row
+
+    @FirstVisibleRow.setter
+    def FirstVisibleRow(self, row: int) -> None:
+        self._check_row(row)
+        self._first_visible_row = row
+        self._load(row)
+
+    @property
+    def SelectedRows(self) -> str:
+        return ",".join(str(row) for row in self._selected_rows)
+
+    @SelectedRows.setter
+    def SelectedRows(self, value: Any) -> None:
+        selected = []
+
+        for part in str(value).split(","):
+            if not part.strip():
+                continue
+
+            first, _, last = part.partition("-")
+            for row in range(int(first), int(last or first) + 1):
+                self._check_row(row)
+                selected.append(row)
+
+        self._selected_rows = selected
+
+    def selectAll(self) -> None:
+        self._selected_rows = list(range(len(self._rows)))
+
+    def clearSelection(self) -> None:
+        self._selected_rows = []
+
+    def setCurrentCell(self, row: int, column: str) -> None:
+        self.CurrentCellRow = row
+        self.CurrentCellColumn = column
+
+    def clickCurrentCell(self) -> None:
+        self._action(f"click:{self.CurrentCellColumn}")
+
+    def doubleClickCurrentCell(self) -> None:
+        self._action(f"doubleclick:{self.CurrentCellColumn}")
+
+    def pressButton(self, button: str) -> None:
+        self._action(button)
+
+    def pressToolbarButton(self, button: str) -> None:
+        self._action(button)
+
+    def contextMenu(self) -> None:
+        self.actions.append("contextmenu")
+
+    def selectContextMenuItem(self, function_code: str) -> None:
+        self._action(function_code)
+
+    def selectContextMenuItemByText(self, text: str) -> None:
+        self._action(text)
+
+    def changeCheckbox(self, row: int, column: str, value: bool) -> None:
+        self._check_row(row)
+        self._checkboxes[(row, column)] = bool(value)
+
+    def GetCellCheckBoxChecked(self, row: int, column: str) -> bool:
+        self._check_row(row)
+        return self._checkboxes.get((row, column), False)
+
+    def _check_row(self, row: int) -> None:
+        if not 0 <= row < len(self._rows):
+            raise ScriptingError(f"Row {row} out of range of {self.Id} with {len(self._rows)} rows")
+
+    def _load(self, row: int) -> None:
+        """
+        loads rows visible when row is scrolled into view
+        """
+        self._loaded.update(range(row, min(row + self._visible_rows, len(self._rows))))
+
+    def _action(self, name: str) -> None:
+        self.actions.append(name)
+
+        if self._on_button is not None:
+            self._on_button(self.session, name)
@@ -0,0 +1,72 @@
+import re
+from typing import TYPE_CHECKING
+
+from pysapscript.simulated.components import SimulatedLabel
+
+if TYPE_CHECKING:
+    from pysapscript.simulated.engine import SimulatedSession
+
+# virtual keys of list navigation
+_V_KEY_FIRST_PAGE = 80
+_V_KEY_PAGE_UP = 81
+_V_KEY_PAGE_DOWN = 82
+_V_KEY_LAST_PAGE = 83
+
+# text chunks of a list line are separated by two or more spaces
+_CHUNK = re.compile(r"\S+(?: \S+)*")
+
+
+class SimulatedListOutput:
+    """
+    Classic ABAP list in the user area of the main window, one GuiLabel lbl[column,row] per text chunk
+
+    Like in SAP only lines of the current page exist, pages are changed by
+    usr.VerticalScrollbar.Position or virtual keys 80-83 (first page, page up, page down, last page).
+    """
+
+    def __init__(self, lines: list[str], page_size: int = 20) -> None:
+        """
+        Args:
+            lines (list[str]): lines of the list, chunks separated by two or more spaces become labels
+            page_size (int): number of lines shown at once
+        """
+        self.lines = list(lines)
+        self.page_size = page_size
+        self._session: "SimulatedSession | None" = None
+
+    def __repr__(self) -> str:
+        return f"SimulatedListOutput(lines={len(self.lines)}, page_size={self.page_size})"
+
+    def show(self, session: "SimulatedSession") -> None:
+        """
+        Shows the list in the session from its first page, usually called by a transaction builder
+
+        Args:
+            session (SimulatedSession): session to show the list in
+        """
+        self._session = session
+        scrollbar = session.usr.VerticalScrollbar
+        scrollbar.Maximum = max(0, len(self.lines) - self.page_size)
+        scrollbar.PageSize = self.page_size
+        scrollbar._position = 0
+        scrollbar._on_scroll = self._render
+
+        session.register_v_key(_V_KEY_FIRST_PAGE, lambda _: self._scroll(0))
+        session.register_v_key(_V_KEY_PAGE_UP, lambda _: self._scroll(scrollbar.Position - self.page_size))
+        session.register_v_key(_V_KEY_PAGE_DOWN, lambda _: self._scroll(scrollbar.Position + self.page_size))
+        session.register_v_key(_V_KEY_LAST_PAGE, lambda _: self._scroll(scrollbar.Maximum))
+        self._render(0)
+
+    def _scroll(self, position: int) -> None:
+        scrollbar = self._session.usr.VerticalScrollbar
+        scrollbar.Position = min(max(position, 0), scrollbar.Maximum)
+
+    def _render(self, position: int) -> None:
+        usr = self._session.usr
+        for label in [child for child in usr._children if isinstance(child, SimulatedLabel)]:
+            usr._children.remove(label)
+            label._parent = None
+
+        for row, line in enumerate(self.lines[position:position + self.page_size]):
+            for chunk in _CHUNK.finditer(line):
+                usr.add(SimulatedLabel(f"lbl[{chunk.start()},{row}]", chunk.group(), char_left=chunk.start(), char_top=row))
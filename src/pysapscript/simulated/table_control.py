@@ -0,0 +1,146 @@
+from typing import Any
+
+from pysapscript.simulated.components import (
+    SimulatedObject,
+    SimulatedComponent,
+    SimulatedCollection,
+    SimulatedScrollbar,
+    SimulatedTextField,
+    SimulatedCTextField,
+    SimulatedCheckBox,
+)
+from pysapscript.types_.exceptions import ScriptingError
+
+
+class SimulatedTableColumn(SimulatedObject):
+    def __init__(self, title: str, tooltip: str = "") -> None:
+        self.Title = title
+        self.Tooltip = tooltip
+
+
+class SimulatedTableControl(SimulatedComponent):
+    """
+    GuiTableControl (classic dynpro step-loop table)
+
+    Like in SAP only visible rows exist as cells, the table is scrolled by VerticalScrollbar.Position.
+    Values of the visible cells are kept when scrolled away, as SAP does in PAI.
+    """
+
+    type_name = "GuiTableControl"
+    container = True
+
+    def __init__(
+        self,
+        name: str,
+        columns: list[str],
+        rows: list[list[Any]],
+        visible_rows: int = 10,
+        column_titles: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Args:
+            name (str): ID part, e.g. "tblSAPMV45ATCTRL_U_ERF_AUFTRAG"
+            columns (list[str]): ID parts of column cells, type by prefix - "txt", "ctxt" or "chk", e.g. "txtVBAP-POSNR"
+            rows (list[list[Any]]): cell values by position, bool for checkbox columns, "" for empty input rows
+            visible_rows (int): number of rows shown at once
+            column_titles (dict[str, str] | None): titles of columns by ID part, technical name if missing
+        """
+        super().__init__(name)
+        self._columns = list(columns)
+        self._rows = [list(row) for row in rows]
+        self._visible_rows = visible_rows
+        self._column_titles = column_titles or {}
+        self._first_row = 0
+
+        self.VerticalScrollbar = SimulatedScrollbar(
+            maximum=max(0, len(self._rows) - visible_rows), page_size=visible_rows
+        )
+        self.VerticalScrollbar._on_scroll = self._scroll
+        self._render()
+
+    @property
+    def RowCount(self) -> int:
+        return len(self._rows)
+
+    @property
+    def VisibleRowCount(self) -> int:
+        return self._visible_rows
+
+    @property
+    def Columns(self) -> SimulatedCollection:
+        return SimulatedCollection([
+            SimulatedTableColumn(self._column_titles.get(column, _technical_name(column)))
+            for column in self._columns
+        ])
+
+    @property
+    def Rows(self) -> SimulatedCollection:
+        return SimulatedCollection([
+            SimulatedCollection(self._children[r * len(self._columns):(r + 1) * len(self._columns)])
+            for r in range(len(self._children) // max(1, len(self._columns)))
+        ])
+
+    @property
+    def rows(self) -> list[list[Any]]:
+        """
+        cell values including input in the visible cells, not part of the scripting API
+        """
+        self._commit()
+
+        return [list(row) for row in self._rows]
+
+    def GetCell(self, row: int, column: int) -> SimulatedComponent:
+        if not 0 <= column < len(self._columns):
+            raise ScriptingError(f"Column {column} does not exist in {self.Id}")
+
+        cell = self.child(f"{self._columns[column]}[{column},{row}]")
+        if cell is None:
+            raise ScriptingError(f"Row {row} is not visible in {self.Id}")
+
+        return cell
+
+    def _scroll(self, position: int) -> None:
+        self._commit()
+        self._first_row = position
+        self._render()
+
+    def _commit(self) -> None:
+        """
+        stores values of visible cells into rows
+        """
+        for cell in self._children:
+            column, row = cell._cell
+            if isinstance(cell, SimulatedCheckBox):
+                self._rows[row][column] = cell.Selected
+            else:
+                self._rows[row][column] = cell.Text
+
+    def _render(self) -> None:
+        """
+        creates cells of visible rows
+        """
+        self.clear()
+        last_row = min(self._first_row + self._visible_rows, len(self._rows))
+
+        for row in range(self._first_row, last_row):
+            for column, id_part in enumerate(self._columns):
+                value = self._rows[row][column]
+                name = f"{id_part}[{column},{row - self._first_row}]"
+
+                if id_part.startswith("chk"):
+                    cell: SimulatedComponent = SimulatedCheckBox(name, selected=bool(value))
+                elif id_part.startswith("ctxt"):
+                    cell = SimulatedCTextField(name, text=str(value))
+                else:
+                    cell = SimulatedTextField(name, text=str(value))
+
+                cell._cell = (column, row)
+                self.add(cell)
+
+
+def _technical_name(id_part: str) -> str:
+    for prefix in ("ctxt", "txt", "chk"):
+        if id_part.startswith(prefix):
+            return id_part[len(prefix):]
+
+    return id_part
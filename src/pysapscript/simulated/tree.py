@@ -0,0 +1,319 @@
+from dataclasses import dataclass, field
+from typing import Callable, TYPE_CHECKING
+
+from pysapscript.simulated.components import SimulatedComponent, SimulatedCollection
+from pysapscript.types_.exceptions import ScriptingError
+
+if TYPE_CHECKING:
+    from pysapscript.simulated.engine import SimulatedSession
+
+
+SIMPLE_TREE = 0
+LIST_TREE = 1
+COLUMN_TREE = 2
+
+
+@dataclass
+class _TreeNode:
+    key: str
+    text: str
+    parent: "_TreeNode | None"
+    folder: bool
+    expanded: bool
+    disabled: bool
+    items: dict[str, str]
+    children: "list[_TreeNode]" = field(default_factory=list)
+    loaded: bool = True
+
+
+class SimulatedTree(SimulatedComponent):
+    """
+    GuiTree (shell tree) - simple, list or column tree
+    """
+
+    type_name = "GuiShell"
+
+    def __init__(
+        self,
+        name: str,
+        tree_type: int = SIMPLE_TREE,
+        columns: dict[str, str] | None = None,
+        on_double_click: "Callable[[SimulatedSession, str], None] | None" = None,
+        load_on_expand: bool = False,
+    ) -> None:
+        """
+        Args:
+            name (str): ID part, usually "shell"
+            tree_type (int): SIMPLE_TREE, LIST_TREE or COLUMN_TREE
+            columns (dict[str, str] | None): names and titles of item columns of a column tree
+            on_double_click (Callable[[SimulatedSession, str], None] | None): called with key of double clicked node
+            load_on_expand (bool): children of a folder are sent to the frontend when it is expanded
+                for the first time, like trees of large hierarchies - until then they do not exist for scripting
+        """
+        super().__init__(name)
+        self.SubType = "Tree"
+        self._tree_type = tree_type
+        self._columns = dict(columns or {})
+        self._nodes: dict[str, _TreeNode] = {}
+        self._roots: list[_TreeNode] = []
+        self._selected: list[str] = []
+        self._on_double_click = on_double_click
+        self._load_on_expand = load_on_expand
+
+    def add_node(
+        self,
+        key: str,
+        text: str,
+        parent: str | None = None,
+        folder: bool = False,
+        expanded: bool = False,
+        disabled: bool = False,
+        items: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Adds node as the last child of parent, not part of the scripting API
+
+        Args:
+            key (str): node key, e.g. "          1"
+            text (str): node text
+            parent (str | None): key of parent node, top level node if None
+            folder (bool): node can have children if True, set for parents automatically
+            expanded (bool): folder is expanded if True
+            disabled (bool): node is disabled if True
+            items (dict[str, str] | None): texts of item columns by column name,
+                of a list tree by item name - "1", "2" ... in order
+        """
+        if key in self._nodes:
+            raise ScriptingError(f"Node {key} already exists in {self.Id}")
+
+        parent_node = self._nodes.get(parent) if parent is not None else None
+        if parent is not None and parent_node is None:
+            raise ScriptingError(f"Node {parent} does not exist in {self.Id}")
+
+        node = _TreeNode(key, text, parent_node, folder, expanded, disabled, dict(items or {}))
+        node.loaded = expanded or not self._load_on_expand
+        self._nodes[key] = node
+
+        if parent_node is None:
+            self._roots.append(node)
+        else:
+            parent_node.folder = True
+            parent_node.children.append(node)
+
+    def GetTreeType(self) -> int:
+        return self._tree_type
+
+    def GetAllNodeKeys(self) -> SimulatedCollection:
+        return SimulatedCollection([node.key for node in self._walk(self._roots)])
+
+    def GetNextNodeKey(self, key: str) -> str:
+        node = self._get(key)
+        siblings = self._siblings(node)
+        position = siblings.index(node) + 1
+
+        return siblings[position].key if position < len(siblings) else ""
+
+    def GetPreviousNodeKey(self, key: str) -> str:
+        node = self._get(key)
+        siblings = self._siblings(node)
+        position = siblings.index(node) - 1
+
+        return siblings[position].key if position >= 0 else ""
+
+    def GetNodesCol(self) -> SimulatedCollection:
+        return SimulatedCollection([node.key for node in self._roots])
+
+    def GetNodeTextByKey(self, key: str) -> str:
+        return self._get(key).text
+
+    def GetNodeKeyByPath(self, path: str) -> str:
+        nodes = self._roots
+        node = None
+
+        for position in path.split("\\"):
+            if not position.isdigit() or not 1 <= int(position) <= len(nodes):
+                raise ScriptingError(f"Node path {path} does not exist in {self.Id}")
+
+            node = nodes[int(position) - 1]
+            nodes = node.children if node.loaded else []
+
+        if node is None:
+            raise ScriptingError(f"Node path {path} does not exist in {self.Id}")
+
+        return node.key
+
+    def GetNodePathByKey(self, key: str) -> str:
+        node: _TreeNode | None = self._get(key)
+        path = []
+
+        while node is not None:
+            path.append(str(self._siblings(node).index(node) + 1))
+            node = node.parent
+
+        return "\\".join(reversed(path))
+
+    def GetParent(self, key: str) -> str:
+        parent = self._get(key).parent
+
+        return parent.key if parent is not None else ""
+
+    def GetSubNodesCol(self, key: str) -> SimulatedCollection | None:
+        node = self._get(key)
+
+        return SimulatedCollection([c.key for c in node.children]) if node.children and node.loaded else None
+
+    def GetNodeChildrenCount(self, key: str) -> int:
+        node = self._get(key)
+
+        return len(node.children) if node.loaded else 0
+
+    def GetHierarchyLevel(self, key: str) -> int:
+        node = self._get(key)
+        level = 0
+
+        while node.parent is not None:
+            node = node.parent
+            level += 1
+
+        return level
+
+    def IsFolder(self, key: str) -> bool:
+        return self._get(key).folder
+
+    def IsFolderExpandable(self, key: str) -> bool:
+        return self._get(key).folder
+
+    def IsFolderExpanded(self, key: str) -> bool:
+        node = self._get(key)
+
+        return node.folder and node.expanded
+
+    def GetIsDisabled(self, key: str, item: str = "") -> bool:
+        return self._get(key).disabled
+
+    def ExpandNode(self, key: str) -> None:
+        node = self._get(key)
+
+        if not node.folder:
+            raise ScriptingError(f"Node {key} of {self.Id} is not a folder")
+
+        node.expanded = True
+        node.loaded = True
+
+    def CollapseNode(self, key: str) -> None:
+        node = self._get(key)
+
+        if not node.folder:
+            raise ScriptingError(f"Node {key} of {self.Id} is not a folder")
+
+        node.expanded = False
+
+    def SelectNode(self, key: str) -> None:
+        self._get(key)
+
+        if key not in self._selected:
+            self._selected.append(key)
+
+    def UnselectNode(self, key: str) -> None:
+        self._get(key)
+
+        if key in self._selected:
+            self._selected.remove(key)
+
+    def UnselectAll(self) -> None:
+        self._selected = []
+
+    def GetSelectedNodes(self) -> SimulatedCollection:
+        return SimulatedCollection(list(self._selected))
+
+    @property
+    def SelectedNode(self) -> str:
+        return self._selected[-1] if self._selected else ""
+
+    def DoubleClickNode(self, key: str) -> None:
+        self._get(key)
+
+        if self._on_double_click is not None:
+            self._on_double_click(self.session, key)
+
+    def GetColumnNames(self) -> SimulatedCollection:
+        self._check_column_tree()
+
+        return SimulatedCollection(list(self._columns))
+
+    def GetColumnTitles(self) -> SimulatedCollection:
+        self._check_column_tree()
+
+        return SimulatedCollection(list(self._columns.values()))
+
+    def GetColumnTitleFromName(self, column: str) -> str:
+        self._check_column_tree()
+
+        if column not in self._columns:
+            raise ScriptingError(f"Column {column} does not exist in {self.Id}")
+
+        return self._columns[column]
+
+    def GetItemText(self, key: str, column: str) -> str:
+        if self._tree_type == LIST_TREE:
+            items = self._get(key).items
+            if column not in items:
+                raise ScriptingError(f"Item {column} of node {key} does not exist in {self.Id}")
+
+            return items[column]
+
+        self._check_column_tree()
+
+        if column not in self._columns:
+            raise ScriptingError(f"Column {column} does not exist in {self.Id}")
+
+        return self._get(key).items.get(column, "")
+
+    def GetListTreeNodeItemCount(self, key: str) -> int:
+        if self._tree_type != LIST_TREE:
+            raise ScriptingError(f"{self.Id} is not a list tree")
+
+        return len(self._get(key).items)
+
+    def _get(self, key: str) -> _TreeNode:
+        node = self._nodes.get(key)
+        if node is None or not self._is_sent(node):
+            raise ScriptingError(f"Node {key} does not exist in {self.Id}")
+
+        return node
+
+    def _siblings(self, node: _TreeNode) -> list[_TreeNode]:
+        return node.parent.children if node.parent is not None else self._roots
+
+    @staticmethod
+    def _is_sent(node: _TreeNode) -> bool:
+        """
+        node exists in the frontend when all its ancestors have their children loaded
+        """
+        parent = node.parent
+        while parent is not None:
+            if not parent.loaded:
+                return False
+            parent = parent.parent
+
+        return True
+
+    def _check_column_tree(self) -> None:
+        if self._tree_type != COLUMN_TREE:
+            raise ScriptingError(f"{self.Id} is not a column tree")
+
+    @staticmethod
+    def _walk(nodes: list[_TreeNode]) -> list[_TreeNode]:
+        """
+        nodes in display order, parents before their children
+        """
+        ordered = []
+        stack = list(reversed(nodes))
+
+        while stack:
+            node = stack.pop()
+            ordered.append(node)
+            if node.loaded:
+                stack.extend(reversed(node.children))
+
+        return ordered
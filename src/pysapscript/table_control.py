@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from typing import Any, Literal, TYPE_CHECKING
+
+from pysapscript.backends.base import Handle
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+def read_table_control(
+    session_handle: Handle,
+    element: str,
+    column_names: Literal["name", "title"] = "name",
+) -> pl.DataFrame:
+    """
+    Reads all rows of a GuiTableControl page by page
+
+    Only visible rows of a table control exist, the table is scrolled by its vertical scrollbar
+    and found again after each scroll. Type of a column is read once from its first cell,
+    checkboxes are read as bool, dropdowns as key, other cells as text.
+
+    Args:
+        session_handle (Handle): SAP session handle
+        element (str): table control element ID
+        column_names (Literal["name", "title"]): technical field names, or column titles
+
+    Returns:
+        polars.DataFrame: one row per table row, empty for a table without rows
+    """
+    import polars as pl
+
+    table = session_handle.findById(element)
+    row_count = table.RowCount
+    visible_rows = table.VisibleRowCount
+    if row_count == 0:
+        return pl.DataFrame()
+
+    names, types = _read_columns(table, column_names)
+    data: dict[str, list[Any]] = {name: [] for name in names}
+
+    position = 0
+    while position < row_count:
+        table, top = _scroll_to(session_handle, element, table, position)
+        last = min(visible_rows, row_count - top)
+
+        for row in range(position - top, last):
+            for column, name in enumerate(names):
+                data[name].append(_read_cell(table.GetCell(row, column), types[column]))
+
+        position = top + last
+
+    return pl.DataFrame(data, strict=False)
+
+
+def write_table_control(
+    session_handle: Handle,
+    element: str,
+    rows: list[dict[str, Any]],
+    start_row: int = 0,
+) -> None:
+    """
+    Fills rows of a GuiTableControl page by page
+
+    Cells are addressed by technical field name, None values are skipped.
+    Checkboxes take bool, dropdowns take key, other cells take text.
+
+    Args:
+        session_handle (Handle): SAP session handle
+        element (str): table control element ID
+        rows (list[dict[str, Any]]): values by field name, one dictionary per row
+        start_row (int): table row the first dictionary is written to
+
+    Raises:
+        ValueError: unknown field name or rows do not fit into the table
+    """
+    table = session_handle.findById(element)
+    row_count = table.RowCount
+    visible_rows = table.VisibleRowCount
+
+    if start_row < 0 or start_row + len(rows) > row_count:
+        raise ValueError(
+            f"Rows {start_row}-{start_row + len(rows) - 1} do not fit into table {element} with {row_count} rows"
+        )
+
+    names, types = _read_columns(table, "name")
+    column_index = {name: column for column, name in enumerate(names)}
+
+    unknown = {name for row in rows for name in row} - column_index.keys()
+    if unknown:
+        raise ValueError(f"Fields {', '.join(sorted(unknown))} not found in table {element}, available: {', '.join(names)}")
+
+    position = start_row
+    end = start_row + len(rows)
+    while position < end:
+        table, top = _scroll_to(session_handle, element, table, position)
+        last = min(top + visible_rows, end)
+
+        for row in range(position, last):
+            for name, value in rows[row - start_row].items():
+                if value is None:
+                    continue
+
+                column = column_index[name]
+                _write_cell(table.GetCell(row - top, column), types[column], value)
+
+        position = last
+
+
+def _read_columns(table: Handle, column_names: Literal["name", "title"]) -> tuple[list[str], list[str]]:
+    """
+    reads column names and cell types from the first visible row
+    """
+    columns = table.Columns
+    names, types = [], []
+
+    for column in range(columns.Count):
+        cell = table.GetCell(0, column)
+        name = columns(column).Title if column_names == "title" else cell.Name
+
+        names.append(name if name not in names else f"{name}_{column}")
+        types.append(cell.Type)
+
+    return names, types
+
+
+def _scroll_to(session_handle: Handle, element: str, table: Handle, row: int) -> tuple[Handle, int]:
+    """
+    scrolls row into view, as close to the top as the scrollbar allows - returns table found again and top row
+    """
+    scrollbar = table.VerticalScrollbar
+    top = min(row, scrollbar.Maximum)
+
+    if scrollbar.Position != top:
+        scrollbar.Position = top
+        table = session_handle.findById(element)
+
+    return table, top
+
+
+def _read_cell(cell: Handle, cell_type: str) -> Any:
+    if cell_type == "GuiCheckBox":
+        return bool(cell.Selected)
+    elif cell_type == "GuiComboBox":
+        return cell.Key
+
+    return cell.Text
+
+
+def _write_cell(cell: Handle, cell_type: str, value: Any) -> None:
+    if cell_type == "GuiCheckBox":
+        cell.Selected = bool(value)
+    elif cell_type == "GuiComboBox":
+        cell.Key = value
+    else:
+        cell.Text = value
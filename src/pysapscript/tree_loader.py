@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from pysapscript.backends.base import Handle
+
+
+# node attributes the loader reads, in the order of Node fields
+NODE_ATTRIBUTES = ("label", "is_expanded", "is_disabled", "is_folder", "children_count", "items")
+
+# attributes read when none are given, items cost one call per node and column and are read only on request
+DEFAULT_NODE_ATTRIBUTES = ("label", "is_expanded", "is_disabled", "is_folder", "children_count")
+
+# values of GetTreeType
+SIMPLE_TREE = 0
+LIST_TREE = 1
+COLUMN_TREE = 2
+
+
+@dataclass
+class TreeLoadStats:
+    """
+    COM calls made by TreeLoader, by tree method
+    """
+    nodes: int = 0
+    calls: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    @property
+    def calls_per_node(self) -> float:
+        return self.total_calls / self.nodes if self.nodes else 0.0
+
+
+class TreeLoader:
+    """
+    Reads attributes of many tree nodes in passes - one tree method for all keys at a time
+
+    Only requested attributes are read, an attribute another one depends on is read once
+    and reused, e.g. IsFolderExpanded serves both is_expanded and is_folder,
+    IsFolderExpandable is asked only for nodes that are not expanded
+    and GetNodeChildrenCount only for folders.
+    Items are read one column at a time, tree type and column names are read once.
+    Calls are counted in stats.
+    """
+
+    def __init__(self, shell: Handle) -> None:
+        """
+        Args:
+            shell (Handle): tree element handle
+        """
+        self.shell = shell
+        self.stats = TreeLoadStats()
+        self._tree_type: int | None = None
+        self._column_names: list[str] | None = None
+
+    def __repr__(self) -> str:
+        return f"TreeLoader(nodes={self.stats.nodes}, calls={self.stats.total_calls})"
+
+    def __str__(self) -> str:
+        return f"TreeLoader(nodes={self.stats.nodes}, calls={self.stats.total_calls})"
+
+    def all_keys(self) -> list[str]:
+        """
+        Keys of all loaded nodes, parents before their children
+
+        Returns:
+            list[str]: node keys
+        """
+        return list(self.call("GetAllNodeKeys"))
+
+    def tree_type(self) -> int:
+        """
+        Type of the tree, read once
+
+        Returns:
+            int: SIMPLE_TREE, LIST_TREE or COLUMN_TREE
+        """
+        if self._tree_type is None:
+            self._tree_type = int(self.call("GetTreeType"))
+
+        return self._tree_type
+
+    def column_names(self) -> list[str]:
+        """
+        Names of item columns of a column tree, read once
+
+        Returns:
+            list[str]: column names, empty for other tree types
+        """
+        if self._column_names is None:
+            is_column_tree = self.tree_type() == COLUMN_TREE
+            self._column_names = [str(name) for name in self.call("GetColumnNames")] if is_column_tree else []
+
+        return self._column_names
+
+    def top_keys(self) -> list[str]:
+        """
+        Keys of top level nodes only, the first one by its path, others as its next siblings
+
+        Returns:
+            list[str]: node keys in tree order, empty for an empty tree
+        """
+        try:
+            key = self.call("GetNodeKeyByPath", "1")
+        except Exception:
+            return []
+
+        keys = []
+        while key:
+            keys.append(key)
+            key = self.call("GetNextNodeKey", key)
+
+        return keys
+
+    def sub_keys(self, key: str) -> list[str] | None:
+        """
+        Keys of children of a node
+
+        Args:
+            key (str): node key
+
+        Returns:
+            list[str] | None: children keys, None when the tree has not sent any children
+        """
+        children = self.call("GetSubNodesCol", key)
+
+        return list(children) if children is not None else None
+
+    def load(self, keys: list[str], attributes: Iterable[str] = NODE_ATTRIBUTES) -> dict[str, list[Any]]:
+        """
+        Reads attributes of nodes, one pass per tree method
+
+        Args:
+            keys (list[str]): node keys
+            attributes (Iterable[str]): attributes to read, see NODE_ATTRIBUTES
+
+        Returns:
+            dict[str, list[Any]]: values of each requested attribute in order of keys
+
+        Raises:
+            ValueError: unknown attribute
+        """
+        wanted = set(attributes)
+        unknown = wanted - set(NODE_ATTRIBUTES)
+        if unknown:
+            raise ValueError(f"Unknown node attributes {', '.join(sorted(unknown))}, available: {', '.join(NODE_ATTRIBUTES)}")
+
+        self.stats.nodes += len(keys)
+        values: dict[str, list[Any]] = {}
+
+        if "label" in wanted:
+            values["label"] = self.each("GetNodeTextByKey", keys)
+
+        if "is_disabled" in wanted:
+            values["is_disabled"] = self.each("GetIsDisabled", keys, "Text")
+
+        if wanted & {"is_expanded", "is_folder", "children_count"}:
+            expanded, folders = self._folders(keys, "is_expanded" in wanted)
+
+            if "is_expanded" in wanted:
+                values["is_expanded"] = expanded
+
+            if "is_folder" in wanted:
+                values["is_folder"] = folders
+
+            if "children_count" in wanted:
+                folder_keys = [key for key, folder in zip(keys, folders) if folder]
+                counts = dict(zip(folder_keys, self.each("GetNodeChildrenCount", folder_keys)))
+                values["children_count"] = [counts.get(key, 0) for key in keys]
+
+        if "items" in wanted:
+            values["items"] = self._items(keys)
+
+        return values
+
+    def parents(self, keys: list[str], folders: list[bool | None] | None = None) -> list[str]:
+        """
+        Reads parent key of every node, empty string for top level nodes
+
+        With folder flags known children of folders are read by GetSubNodesCol, one call per folder,
+        otherwise GetParent is called for every key.
+        Only keys in keys are returned as children, nodes the tree did not send are left out.
+
+        Args:
+            keys (list[str]): node keys
+            folders (list[bool | None] | None): folder flag of each key, e.g. loaded is_folder
+
+        Returns:
+            list[str]: parent key of each key in order of keys
+        """
+        if folders is None or None in folders:
+            return [str(parent) for parent in self.each("GetParent", keys)]
+
+        known = set(keys)
+        parent_of: dict[str, str] = {}
+        folder_keys = [key for key, folder in zip(keys, folders) if folder]
+
+        for folder_key, children in zip(folder_keys, self.each("GetSubNodesCol", folder_keys)):
+            if children is None:
+                continue
+
+            for child in children:
+                if child in known:
+                    parent_of[child] = folder_key
+
+        return [parent_of.get(key, "") for key in keys]
+
+    def each(self, method: str, keys: list[str], *args: Any) -> list[Any]:
+        """
+        Calls tree method for every key, the method is looked up once
+
+        Args:
+            method (str): tree method taking node key first, e.g. GetNodeTextByKey
+            keys (list[str]): node keys
+            *args: arguments after the key
+
+        Returns:
+            list[Any]: results in order of keys
+        """
+        if not keys:
+            return []
+
+        function: Callable[..., Any] = getattr(self.shell, method)
+        self._count(method, len(keys))
+
+        return [function(key, *args) for key in keys]
+
+    def call(self, method: str, *args: Any) -> Any:
+        """
+        Calls tree method once
+
+        Args:
+            method (str): tree method
+            *args: its arguments
+
+        Returns:
+            Any: result of the method
+        """
+        self._count(method, 1)
+
+        return getattr(self.shell, method)(*args)
+
+    def _folders(self, keys: list[str], with_expanded: bool) -> tuple[list[bool | None], list[bool]]:
+        """
+        reads expanded state and folder flag, a folder is expanded or expandable -
+        each method is asked only for keys the other one did not decide
+        """
+        if with_expanded:
+            expanded = self.each("IsFolderExpanded", keys)
+            undecided = [key for key, e in zip(keys, expanded) if not e]
+            expandable = dict(zip(undecided, self.each("IsFolderExpandable", undecided)))
+
+            return expanded, [bool(e or expandable.get(key)) for key, e in zip(keys, expanded)]
+
+        expandable_list = self.each("IsFolderExpandable", keys)
+        undecided = [key for key, x in zip(keys, expandable_list) if not x]
+        expanded_by_key = dict(zip(undecided, self.each("IsFolderExpanded", undecided)))
+
+        return [None] * len(keys), [bool(x or expanded_by_key.get(key)) for key, x in zip(keys, expandable_list)]
+
+    def _items(self, keys: list[str]) -> list[dict[str, str]]:
+        """
+        reads item texts by column name - columns of a column tree,
+        items of a list tree named by their position from 1, nothing for a simple tree
+        """
+        items: list[dict[str, str]] = [{} for _ in keys]
+        tree_type = self.tree_type()
+
+        if tree_type == COLUMN_TREE:
+            for column in self.column_names():
+                for item, text in zip(items, self.each("GetItemText", keys, column)):
+                    item[column] = text
+
+        elif tree_type == LIST_TREE:
+            counts = self.each("GetListTreeNodeItemCount", keys)
+            for position in range(1, max(counts, default=0) + 1):
+                having = [i for i, count in enumerate(counts) if count >= position]
+                texts = self.each("GetItemText", [keys[i] for i in having], str(position))
+                for i, text in zip(having, texts):
+                    items[i][str(position)] = text
+
+        return items
+
+    def _count(self, method: str, calls: int) -> None:
+        self.stats.calls[method] = self.stats.calls.get(method, 0) + calls
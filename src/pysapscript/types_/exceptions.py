@@ -14,3 +14,23 @@ class ActionException(Exception):
 
 class ActionNotAllowedException(Exception):
     """Action not allowed - e.g. sending VKey to a non-editable field"""
+
+
+class SessionPoolExhaustedException(Exception):
+    """All sessions of the pool are leased"""
+
+
+class StatusDidNotAppearException(Exception):
+    """Expected status bar message didn't show up within time window"""
+
+
+class ScriptingError(Exception):
+    """Error raised by a scripting engine other than SAP GUI COM - e.g. element not found in simulated engine"""
+
+
+class ReplayException(Exception):
+    """Replayed operation does not match the recording"""
+
+
+class RemoteException(Exception):
+    """Error of the remote worker connection, or error raised in the server that has no local type"""
@@ -1,4 +1,6 @@
 from enum import Enum
+from dataclasses import dataclass
+from typing import Any
 
 
 class NavigateAction(Enum):
@@ -11,3 +13,30 @@ class NavigateAction(Enum):
     end = "end"
     cancel = "cancel"
     save = "save"
+
+
+@dataclass
+class FieldResult:
+    """
+    Result of one field of Window.write_many() and Window.read_many()
+    """
+
+    element: str
+    ok: bool
+    value: Any = None
+    error: str | None = None
+
+
+@dataclass
+class StatusMessage:
+    """
+    Message in the status bar, read by Window.read_status()
+
+    type is S (success), E (error), W (warning), I (info), A (abort) or empty when no message is shown
+    """
+
+    type: str
+    id: str
+    number: str
+    parameters: tuple[str, ...]
+    text: str
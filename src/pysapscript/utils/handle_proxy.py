@@ -0,0 +1,151 @@
+import inspect
+from time import perf_counter
+from typing import Any, Iterator
+
+
+# values returned as they are, everything else is a handle and gets wrapped
+_PLAIN_TYPES = (str, int, float, bool, bytes, tuple, list, dict, type(None))
+
+
+class HandleProxy:
+    """
+    Stands in for a COM handle and reports every operation done on it
+
+    Property reads, property sets, method calls, collection calls, len and iteration
+    are passed to the handle and reported to _on_operation. Handles returned by the
+    operations are wrapped by the same kind of proxy, so the whole object graph is covered.
+    """
+
+    __slots__ = ("_handle", "_element")
+
+    def __init__(self, handle: Any, element: str) -> None:
+        """
+        Args:
+            handle (Any): wrapped handle
+            element (str): element ID the handle belongs to, reported with operations
+        """
+        object.__setattr__(self, "_handle", handle)
+        object.__setattr__(self, "_element", element)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._element})"
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}({self._element})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HandleProxy):
+            return self._handle == other._handle
+
+        return self._handle == other
+
+    def __hash__(self) -> int:
+        return hash(self._handle)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+
+        started = perf_counter()
+        try:
+            value = getattr(self._handle, name)
+
+        except Exception as ex:
+            self._on_operation("get", name, (), None, ex, perf_counter() - started)
+            raise
+
+        if inspect.ismethod(value) or inspect.isfunction(value) or inspect.isbuiltin(value):
+            return self._method(name, value)
+
+        self._on_operation("get", name, (), value, None, perf_counter() - started)
+
+        return self._wrap(value, self._child_element("get", name, ()))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        started = perf_counter()
+        try:
+            setattr(self._handle, name, value)
+
+        except Exception as ex:
+            self._on_operation("set", name, (value,), None, ex, perf_counter() - started)
+            raise
+
+        self._on_operation("set", name, (value,), None, None, perf_counter() - started)
+
+    def __call__(self, *args: Any) -> Any:
+        return self._method("__call__", self._handle)(*args)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._method("__getitem__", self._handle.__getitem__)(key)
+
+    def __len__(self) -> int:
+        return self._method("__len__", lambda: len(self._handle))()
+
+    def __iter__(self) -> Iterator[Any]:
+        items = self._method("__iter__", lambda: list(self._handle))()
+
+        return iter(items)
+
+    def _method(self, name: str, function: Any) -> Any:
+        """
+        wraps method of the handle so that its calls are reported
+        """
+        def method(*args: Any) -> Any:
+            started = perf_counter()
+            try:
+                result = function(*args)
+
+            except Exception as ex:
+                self._on_operation("call", name, args, None, ex, perf_counter() - started)
+                raise
+
+            self._on_operation("call", name, args, result, None, perf_counter() - started)
+
+            if name == "__iter__":
+                return [self._wrap(item, self._child_element("call", name, (i,))) for i, item in enumerate(result)]
+
+            return self._wrap(result, self._child_element("call", name, args))
+
+        return method
+
+    def _child_element(self, kind: str, name: str, args: tuple) -> str:
+        """
+        element of a handle returned by operation - ID searched by findById, otherwise element of this handle
+        """
+        if name.lower() == "findbyid" and args:
+            return str(args[0])
+
+        return self._element
+
+    def _wrap(self, value: Any, element: str) -> Any:
+        """
+        wraps returned handle by the same kind of proxy, plain values are returned as they are
+
+        proxies of another kind are wrapped too, so proxies can be stacked - e.g. instrumented recording
+        """
+        if isinstance(value, _PLAIN_TYPES) or type(value) is type(self):
+            return value
+
+        return self._spawn(value, element)
+
+    def _spawn(self, handle: Any, element: str) -> "HandleProxy":
+        """
+        creates proxy for a returned handle, subclasses pass their own settings
+        """
+        return type(self)(handle, element)
+
+    def _on_operation(
+        self,
+        kind: str,
+        name: str,
+        args: tuple,
+        result: Any,
+        error: Exception | None,
+        duration: float,
+    ) -> None:
+        """
+        called after every operation - kind is get, set or call
+        """
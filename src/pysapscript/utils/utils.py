@@ -1,8 +1,6 @@
 import os
 import time
 
-from win32gui import FindWindow, GetWindowText
-
 from pysapscript.types_.exceptions import WindowDidNotAppearException
 
 
@@ -28,6 +26,7 @@ def wait_for_window_title(title: str, timeout_loops: int = 30):
     Raises:
         WindowDidNotAppearException: Expected window did not appear
     """
+    from win32gui import FindWindow, GetWindowText
 
     for _ in range(0, timeout_loops):
 
@@ -1,26 +1,64 @@
-from typing import Literal
-from time import sleep
+from __future__ import annotations
 
-import win32com.client
+from typing import Any, Callable, Iterable, Iterator, Literal, TYPE_CHECKING
+from time import sleep, monotonic
 
+from pysapscript import screen
+from pysapscript import popups
+from pysapscript import instrumentation
+from pysapscript import recording
+from pysapscript import table_control
+from pysapscript import list_output
 from pysapscript.types_ import exceptions
-from pysapscript.types_.types import NavigateAction
+from pysapscript.types_.types import NavigateAction, FieldResult, StatusMessage
 from pysapscript.shell_table import ShellTable
 from pysapscript.shell_tree import ShellTree
 
+from pysapscript.backends.base import Handle
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+# element type by prefix of the last part of element ID, e.g. wnd[0]/usr/chkPA_CHCK
+_ELEMENT_TYPE_PREFIXES = {
+    "ctxt": "GuiCTextField",
+    "txt": "GuiTextField",
+    "pwd": "GuiPasswordField",
+    "chk": "GuiCheckBox",
+    "rad": "GuiRadioButton",
+    "cmb": "GuiComboBox",
+}
+
 
 class Window:
     def __init__(
         self,
         connection: int,
-        connection_handle: win32com.client.CDispatch,
+        connection_handle: Handle,
         session: int,
-        session_handle: win32com.client.CDispatch,
+        session_handle: Handle,
+        popup_handlers: list[popups.PopupHandler] | None = None,
     ) -> None:
+        """
+        Args:
+            connection (int): connection number
+            connection_handle (Handle): SAP connection handle
+            session (int): session number
+            session_handle (Handle): SAP session handle
+            popup_handlers (list[PopupHandler] | None): handlers shared with Sapscript, checked after window's own
+        """
         self.connection = connection
         self._connection_handle = connection_handle
         self.session = session
         self._session_handle = session_handle
+        self._screen_cache: dict[str, screen.ScreenSnapshot] = {}
+        self._screen_index: dict[str, screen.ScreenIndex] = {}
+        self._dropdown_entries: dict[str, screen.DropdownEntries] = {}
+        self.popup_handlers: list[popups.PopupHandler] = []
+        self.popup_log: list[popups.HandledPopup] = []
+        self._shared_popup_handlers = popup_handlers if popup_handlers is not None else []
+        self._handling_popups = False
 
     def __repr__(self) -> str:
         return f"Window(connection={self.connection}, session={self.session})"
@@ -37,6 +75,42 @@ class Window:
     def __hash__(self) -> int:
         return hash(f"{self._connection_handle}{self._session_handle}")
 
+    def instrument(self, sink: instrumentation.Sink | None) -> None:
+        """
+        Reports every COM call of this window and of tables and trees read from now on,
+        None turns reporting off
+
+        Args:
+            sink (Callable[[ComCallEvent], None] | None): receives events, e.g. InMemoryAggregator
+
+        Example:
+            ```
+            aggregator = InMemoryAggregator()
+            main_window.instrument(aggregator)
+            main_window.start_transaction("SE16")
+            print(aggregator.stats(by="element"))
+            ```
+        """
+        self._connection_handle = instrumentation.instrument(
+            self._connection_handle, f"con[{self.connection}]", sink
+        )
+        self._session_handle = instrumentation.instrument(
+            self._session_handle, f"ses[{self.session}]", sink
+        )
+
+    def record(self, recorder: recording.Recorder | None) -> None:
+        """
+        Records every COM call of this window and of tables and trees read from now on,
+        None turns recording off
+
+        Handles are recorded as con[n] and ses[n], replay starts from ReplaySapGui.handle("ses[n]")
+
+        Args:
+            recorder (Recorder | None): writes calls to its file
+        """
+        self._connection_handle = recording.record(self._connection_handle, f"con[{self.connection}]", recorder)
+        self._session_handle = recording.record(self._session_handle, f"ses[{self.session}]", recorder)
+
     def maximize(self) -> None:
         """
         Maximizes this sap window
@@ -84,6 +158,7 @@ class Window:
             raise exceptions.ActionException("Wrong navigation action!")
 
         self._session_handle.findById(el).press()
+        self._after_action(check_popups=True)
 
     def start_transaction(self, transaction: str) -> None:
         """
@@ -109,6 +184,100 @@ class Window:
         """
         return self.read("wnd[0]/sbar/pane[0]")
 
+    def read_status(self) -> StatusMessage:
+        """
+        Reads status bar message with its type, message class, number and parameters
+
+        Returns:
+            StatusMessage: status bar message, type is empty if no message is shown
+
+        Raises:
+            ActionException: error reading status bar
+
+        Example:
+            ```
+            status = main_window.read_status()
+            if status.type == "E":
+                raise RuntimeError(status.text)
+            ```
+        """
+        try:
+            sbar = self._session_handle.findById("wnd[0]/sbar")
+
+            return StatusMessage(
+                type=sbar.MessageType,
+                id=sbar.MessageId.strip(),
+                number=sbar.MessageNumber,
+                parameters=self._read_message_parameters(sbar),
+                text=sbar.Text,
+            )
+
+        except Exception as e:
+            raise exceptions.ActionException(f"Error reading status bar: {e}")
+
+    def wait_for_status(
+        self,
+        predicate: Callable[[StatusMessage], bool],
+        timeout: float = 30,
+        interval: float = 0.05,
+        max_interval: float = 1,
+    ) -> StatusMessage:
+        """
+        Polls status bar until a message matching predicate appears
+
+        Polling starts at interval seconds and doubles up to max_interval
+
+        Args:
+            predicate (Callable[[StatusMessage], bool]): returns True for the awaited message
+            timeout (float): seconds to wait, default 30
+            interval (float): first polling interval in seconds, default 0.05
+            max_interval (float): longest polling interval in seconds, default 1
+
+        Returns:
+            StatusMessage: first matching message
+
+        Raises:
+            StatusDidNotAppearException: no matching message appeared within timeout
+            ActionException: error reading status bar
+
+        Example:
+            ```
+            status = main_window.wait_for_status(lambda s: s.type in ("S", "E"), timeout=60)
+            document = status.parameters[0]
+            ```
+        """
+        deadline = monotonic() + timeout
+
+        while True:
+            status = self.read_status()
+            if predicate(status):
+                return status
+
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise exceptions.StatusDidNotAppearException(
+                    f"Expected status did not appear within {timeout} seconds, last status: {status.text}"
+                )
+
+            sleep(min(interval, remaining))
+            interval = min(interval * 2, max_interval)
+
+    @staticmethod
+    def _read_message_parameters(sbar: Handle) -> tuple[str, ...]:
+        """
+        reads message parameters, SAP returns single string or a collection
+        """
+        try:
+            parameters = sbar.MessageParameter
+
+        except Exception:
+            return ()
+
+        if isinstance(parameters, str):
+            return (parameters,) if parameters else ()
+
+        return tuple(str(p) for p in parameters if p)
+
     def press(self, element: str) -> None:
         """
         Presses element
@@ -117,7 +286,7 @@ class Window:
             element (str): element to press
 
         Raises:
-            ActionException: error clicking element
+            ActionException: error clicking element or handling popups opened by it
 
         Example:
             ```
@@ -130,6 +299,8 @@ class Window:
         except Exception as ex:
             raise exceptions.ActionException(f"Error clicking element {element}: {ex}")
 
+        self._after_action(check_popups=True)
+
     def select(self, element: str) -> None:
         """
         Selects element or menu item
@@ -147,6 +318,7 @@ class Window:
         """
         try:
             self._session_handle.findById(element).select()
+            self._after_action()
 
         except Exception as ex:
             raise exceptions.ActionException(f"Error clicking element {element}: {ex}")
@@ -193,6 +365,7 @@ class Window:
         """
         try:
             self._session_handle.findById(element).selected = selected
+            self._after_action()
 
         except Exception as ex:
             raise exceptions.ActionException(f"Error clicking element {element}: {ex}")
@@ -201,17 +374,20 @@ class Window:
         """
         Sets value of a dropdown menu
 
+        Text is looked up in entries cached by read_dropdown_entries(),
+        exact text first, then ignoring case and surrounding spaces
+
         Args:
-            element (str): checkbox element
+            element (str): dropdown element
             value (str): key or text based on value_type
             value_type (Literal): key (internal name) or text (label)
 
         Raises:
-            NotImplementedError: invalid value type
+            ActionException: error setting the dropdown, text not found or invalid value type
 
         Example:
             ```
-            main_window.set_dropdown("wnd[0]/usr/chkPA_CHCK", "Excel File", "text")
+            main_window.set_dropdown("wnd[0]/usr/cmbPA_FORMAT", "Excel File", "text")
             ```
         """
         try:
@@ -219,27 +395,58 @@ class Window:
                 case "key":
                     self._session_handle.findById(element).Key = value
                 case "text":
-                    dd_el = self._session_handle.findById(element)
-                    available = []
-
-                    for i in range(0, dd_el.Entries.Count - 1):
-                        if dd_el.Entries(i).Value not in value:
-                            available.append(dd_el.Entries(i).Value)
-                            continue
-                            
-                        dd_el.Key = dd_el.Entries(i).Key
-                        break
-
-                    else:
+                    entries = self.read_dropdown_entries(element)
+                    key = entries.key_of(value)
+
+                    if key is None:
                         raise ValueError(
-                            f"Value {value} not found in the dropdown element {element}, avilable elements: {", ".join(available)}"
+                            f"Value {value} not found in the dropdown element {element}, avilable elements: {", ".join(entries.texts())}"
                         )
+
+                    self._session_handle.findById(element).Key = key
                 case _:
-                    raise NotImplementedError
+                    raise NotImplementedError(f"Invalid value type {value_type}")
+
+            self._after_action()
 
         except Exception as ex:
             raise exceptions.ActionException(f"Error clicking element {element}: {ex}")
 
+    def read_dropdown_entries(self, element: str, refresh: bool = False) -> screen.DropdownEntries:
+        """
+        Reads all entries of a dropdown at once, cached for the element until the screen fingerprint changes
+
+        Args:
+            element (str): dropdown element
+            refresh (bool): reads the entries again even for unchanged screen if True
+
+        Returns:
+            DropdownEntries: text by key in entries, lookup of key by text with key_of()
+
+        Raises:
+            ActionException: error reading the dropdown
+
+        Example:
+            ```
+            entries = main_window.read_dropdown_entries("wnd[0]/usr/cmbPA_FORMAT")
+            invalid = [text for text in wanted_formats if text not in entries]
+            ```
+        """
+        try:
+            entries = self._dropdown_entries.get(element)
+
+            if (
+                refresh
+                or entries is None
+                or entries.fingerprint != screen.read_fingerprint(self._session_handle)
+            ):
+                entries = screen.read_dropdown_entries(self._session_handle, element)
+                self._dropdown_entries[element] = entries
+
+            return entries
+
+        except Exception as e:
+            raise exceptions.ActionException(f"Error reading dropdown {element}: {e}")
 
     def write(self, element: str, text: str) -> None:
         """
@@ -259,12 +466,125 @@ class Window:
         """
         try:
             self._session_handle.findById(element).text = text
+            self._after_action()
 
         except Exception as ex:
             raise exceptions.ActionException(
                 f"Error writing to element {element}: {ex}"
             )
 
+    def write_many(self, values: dict[str, Any]) -> dict[str, FieldResult]:
+        """
+        Sets values of many fields, does not stop on the first error
+
+        Every field costs the same COM calls as write() - findById and the value,
+        the gain is one result per field instead of an exception and one screen cache reset at the end.
+
+        Type of a field is taken from its ID prefix (txt, ctxt, pwd, chk, rad, cmb),
+        checkboxes take bool, radio buttons are selected by True, dropdowns take key, other fields take text
+
+        Args:
+            values (dict[str, Any]): element and value to set
+
+        Returns:
+            dict[str, FieldResult]: result of every element
+
+        Example:
+            ```
+            results = main_window.write_many({
+                "wnd[0]/usr/ctxtS_BUKRS-LOW": "1000",
+                "wnd[0]/usr/chkP_TEST": True,
+                "wnd[0]/usr/radP_ALL": True,
+                "wnd[0]/usr/cmbP_FORMAT": "02",
+            })
+            failed = [r for r in results.values() if not r.ok]
+            ```
+        """
+        results = {}
+
+        for element, value in values.items():
+            try:
+                handle = self._session_handle.findById(element)
+                element_type = self._element_type(element, handle)
+
+                if element_type == "GuiCheckBox":
+                    handle.selected = bool(value)
+                elif element_type == "GuiRadioButton":
+                    if value:
+                        handle.select()
+                elif element_type == "GuiComboBox":
+                    handle.Key = value
+                else:
+                    handle.text = value
+
+                results[element] = FieldResult(element=element, ok=True, value=value)
+
+            except Exception as ex:
+                results[element] = FieldResult(
+                    element=element, ok=False, value=value, error=f"Error writing to element {element}: {ex}"
+                )
+
+        self._after_action()
+
+        return results
+
+    def read_many(self, elements: list[str]) -> dict[str, FieldResult]:
+        """
+        Reads values of many fields, does not stop on the first error
+
+        Every field costs the same COM calls as read() - findById and the value,
+        the gain is one result per field instead of an exception.
+
+        Checkboxes and radio buttons are read as bool selected state, dropdowns as key, other fields as text
+
+        Args:
+            elements (list[str]): elements to read
+
+        Returns:
+            dict[str, FieldResult]: result of every element, value holds read value
+
+        Example:
+            ```
+            results = main_window.read_many(["wnd[0]/usr/ctxtS_BUKRS-LOW", "wnd[0]/usr/chkP_TEST"])
+            company_code = results["wnd[0]/usr/ctxtS_BUKRS-LOW"].value
+            ```
+        """
+        results = {}
+
+        for element in elements:
+            try:
+                handle = self._session_handle.findById(element)
+                element_type = self._element_type(element, handle)
+
+                if element_type in ("GuiCheckBox", "GuiRadioButton"):
+                    value = handle.selected
+                elif element_type == "GuiComboBox":
+                    value = handle.Key
+                else:
+                    value = handle.text
+
+                results[element] = FieldResult(element=element, ok=True, value=value)
+
+            except Exception as ex:
+                results[element] = FieldResult(
+                    element=element, ok=False, error=f"Error reading element {element}: {ex}"
+                )
+
+        return results
+
+    @staticmethod
+    def _element_type(element: str, handle: Handle) -> str:
+        """
+        gets element type from ID prefix, asks SAP only for unknown prefixes
+        """
+        name = element.rsplit("/", 1)[-1]
+
+        for prefix, element_type in _ELEMENT_TYPE_PREFIXES.items():
+            if name.startswith(prefix):
+                return element_type
+
+        return handle.Type
+
     def read(self, element: str) -> str:
         """
         Reads text property
@@ -353,6 +673,7 @@ class Window:
                 self._session_handle.findById("wnd[0]").TabForward()
 
             sleep(0.2)
+            self._after_action()
 
         except Exception as e:
             raise exceptions.ActionException(f"Error tabbing forwards on element {focus_element}: {e}")
@@ -415,7 +736,9 @@ class Window:
             raise exceptions.ActionException(
                 f"Error visualizing element {element}: {e}"
             )
-    
+
+        self._after_action(check_popups=True)
+
     def show_msgbox(self, title: str, message: str) -> None:
         """
         Shows a message box with the specified title and message.
@@ -464,6 +787,201 @@ class Window:
         except Exception as e:
             raise exceptions.ActionException(f"Error reading element {element}: {e}")
 
+    def read_screen(
+        self,
+        root: str = "wnd[0]/usr",
+        as_dict: bool = False,
+        use_cache: bool = True,
+    ) -> pl.DataFrame | dict[str, dict[str, Any]]:
+        """
+        Reads every element under root in a single traversal - id, type, name, text, changeable and selected state
+
+        Result is cached by screen fingerprint (transaction, program, screen number, window title),
+        the cache is dropped by actions of this window (write, press, navigate, ...)
+
+        Args:
+            root (str): element to start from, default "wnd[0]/usr"
+            as_dict (bool): returns dictionary by element ID instead of DataFrame if True
+            use_cache (bool): returns cached result for unchanged screen if True
+
+        Returns:
+            polars.DataFrame | dict[str, dict[str, Any]]: one row per element, or element properties by element ID
+
+        Raises:
+            ActionException: error reading screen
+
+        Example:
+            ```
+            fields = main_window.read_screen()
+            changeable = fields.filter(pl.col("changeable"))
+            ```
+        """
+        try:
+            snapshot = self._screen_cache.get(root)
+
+            if (
+                not use_cache
+                or snapshot is None
+                or snapshot.fingerprint != screen.read_fingerprint(self._session_handle)
+            ):
+                snapshot = screen.read_screen(self._session_handle, root)
+                self._screen_cache[root] = snapshot
+
+        except Exception as e:
+            raise exceptions.ActionException(f"Error reading screen {root}: {e}")
+
+        if as_dict:
+            return snapshot.to_dict()
+
+        return snapshot.to_polars_dataframe()
+
+    def find(
+        self,
+        name: str | None = None,
+        label: str | None = None,
+        type: str | None = None,
+        tooltip: str | None = None,
+        root: str = "wnd[0]/usr",
+    ) -> screen.ScreenElement | None:
+        """
+        Finds first element of the current screen matching all given criteria
+
+        Elements are looked up in an index built in one traversal of the screen,
+        the index is rebuilt when the screen fingerprint changes or after an action of this window
+
+        Args:
+            name (str | None): technical name, e.g. DATABROWSE-TABLENAME
+            label (str | None): text of the label or of the element itself, case insensitive
+            type (str | None): element type, e.g. GuiCTextField
+            tooltip (str | None): tooltip text, case insensitive
+            root (str): element to index, default "wnd[0]/usr"
+
+        Returns:
+            ScreenElement | None: found element, None if not found
+
+        Raises:
+            ActionException: error reading screen
+
+        Example:
+            ```
+            field = main_window.find(label="Table Name", type="GuiCTextField")
+            main_window.write(field.id, "LFA1")
+            ```
+        """
+        found = self.find_all(name=name, label=label, type=type, tooltip=tooltip, root=root)
+
+        return found[0] if found else None
+
+    def find_all(
+        self,
+        name: str | None = None,
+        label: str | None = None,
+        type: str | None = None,
+        tooltip: str | None = None,
+        root: str = "wnd[0]/usr",
+    ) -> list[screen.ScreenElement]:
+        """
+        Finds all elements of the current screen matching all given criteria, see find()
+
+        Returns:
+            list[ScreenElement]: found elements
+
+        Raises:
+            ActionException: error reading screen
+        """
+        return self.screen_index(root).find_all(name=name, label=label, type=type, tooltip=tooltip)
+
+    def screen_index(self, root: str = "wnd[0]/usr", refresh: bool = False) -> screen.ScreenIndex:
+        """
+        Gets index of elements of the current screen, rebuilt when the screen fingerprint changes
+        or after an action of this window (write, press, navigate, ...)
+
+        Args:
+            root (str): element to index, default "wnd[0]/usr"
+            refresh (bool): rebuilds the index even for unchanged screen if True
+
+        Returns:
+            ScreenIndex: index of the screen
+
+        Raises:
+            ActionException: error reading screen
+        """
+        try:
+            index = self._screen_index.get(root)
+
+            if (
+                refresh
+                or index is None
+                or index.fingerprint != screen.read_fingerprint(self._session_handle)
+            ):
+                index = screen.ScreenIndex(screen.read_screen(self._session_handle, root))
+                self._screen_index[root] = index
+
+            return index
+
+        except Exception as e:
+            raise exceptions.ActionException(f"Error reading screen {root}: {e}")
+
+    def add_popup_handler(self, handler: popups.PopupHandler) -> None:
+        """
+        Registers popup handler, handlers are checked after press, navigate and send_v_key
+
+        Handlers of the window are checked before handlers registered on Sapscript,
+        handled popups are recorded in popup_log
+
+        Args:
+            handler (PopupHandler): popup handler
+
+        Example:
+            ```
+            main_window.add_popup_handler(
+                PopupHandler(title="Information", press="tbar[0]/btn[0]", capture=True)
+            )
+            ```
+        """
+        self.popup_handlers.append(handler)
+
+    def handle_popups(self) -> list[popups.HandledPopup]:
+        """
+        Handles opened popups by registered handlers
+
+        Actions of handlers may use the window, popups opened meanwhile are handled
+        by the running call - handle_popups() called from a handler action returns no popups.
+
+        Returns:
+            list[HandledPopup]: handled popups, also added to popup_log
+
+        Raises:
+            ActionException: error reading popup windows
+        """
+        handlers = self.popup_handlers + self._shared_popup_handlers
+        if not handlers or self._handling_popups:
+            return []
+
+        self._handling_popups = True
+        try:
+            handled = popups.handle_popups(self, handlers)
+
+        except Exception as e:
+            raise exceptions.ActionException(f"Error handling popups: {e}")
+
+        finally:
+            self._handling_popups = False
+
+        self.popup_log.extend(handled)
+
+        return handled
+
+    def _after_action(self, check_popups: bool = False) -> None:
+        """
+        runs after every action that can change the screen
+        """
+        self._screen_cache.clear()
+        self._screen_index.clear()
+
+        if check_popups and (self.popup_handlers or self._shared_popup_handlers):
+            self.handle_popups()
+
     def read_shell_table(self, element: str, load_table: bool = True) -> ShellTable:
         """
         Read the table of the specified ShellTable element.
@@ -485,11 +1003,160 @@ class Window:
         """
         return ShellTable(self._session_handle, element, load_table)
 
-    def read_shell_tree(self, element: str) -> ShellTree:
+    def read_table_control(
+        self,
+        element: str,
+        column_names: Literal["name", "title"] = "name",
+    ) -> pl.DataFrame:
+        """
+        Reads all rows of a classic table control (GuiTableControl), scrolling it page by page
+
+        Checkboxes are read as bool, dropdowns as key, other cells as text
+
+        Args:
+            element (str): table control element
+            column_names (Literal["name", "title"]): technical field names (VBAP-MATNR), or column titles
+
+        Returns:
+            polars.DataFrame: one row per table row
+
+        Raises:
+            ActionException: error reading the table
+
+        Example:
+            ```
+            items = main_window.read_table_control("wnd[0]/usr/tblSAPMV45ATCTRL_U_ERF_AUFTRAG")
+            materials = items["RV45A-MABNR"].to_list()
+            ```
+        """
+        try:
+            frame = table_control.read_table_control(self._session_handle, element, column_names)
+
+        except Exception as e:
+            raise exceptions.ActionException(f"Error reading table control {element}: {e}")
+
+        finally:
+            self._after_action()
+
+        return frame
+
+    def write_table_control(
+        self,
+        element: str,
+        rows: list[dict[str, Any]] | pl.DataFrame,
+        start_row: int = 0,
+    ) -> None:
+        """
+        Fills rows of a classic table control (GuiTableControl), scrolling it page by page
+
+        Cells are addressed by technical field name, None values are skipped,
+        checkboxes take bool, dropdowns take key, other cells take text
+
+        Args:
+            element (str): table control element
+            rows (list[dict[str, Any]] | polars.DataFrame): values by field name, one per row
+            start_row (int): table row the first row is written to
+
+        Raises:
+            ActionException: error writing the table, unknown field or rows do not fit
+
+        Example:
+            ```
+            main_window.write_table_control(
+                "wnd[0]/usr/tblSAPMV45ATCTRL_U_ERF_AUFTRAG",
+                [{"RV45A-MABNR": "M-01", "RV45A-KWMENG": "10"}, {"RV45A-MABNR": "M-02", "RV45A-KWMENG": "5"}],
+            )
+            ```
+        """
+        if not isinstance(rows, list):
+            rows = rows.to_dicts()
+
+        try:
+            table_control.write_table_control(self._session_handle, element, rows, start_row)
+
+        except Exception as e:
+            raise exceptions.ActionException(f"Error writing table control {element}: {e}")
+
+        finally:
+            self._after_action()
+
+    def read_list_output(self, root: str = "wnd[0]/usr", header: int | None = 0) -> pl.DataFrame:
+        """
+        Reads a classic ABAP list (report output made of labels) page by page into a DataFrame
+
+        Every page is read in one traversal of the user area, columns are reconstructed
+        from character positions of the header labels. Separator lines and headers repeated
+        on later pages are skipped.
+
+        Args:
+            root (str): user area with the list, default "wnd[0]/usr"
+            header (int | None): index of the header line among non separator lines, lines before it are skipped,
+                None for lists without header - columns are named col_<left>
+
+        Returns:
+            polars.DataFrame: one row per list line, all columns are strings
+
+        Raises:
+            ActionException: error reading the list
+
+        Example:
+            ```
+            main_window.start_transaction("ZREPORT")
+            main_window.send_v_key(value=8)
+            frame = main_window.read_list_output(header=1)  # title line above the header
+            ```
+        """
+        try:
+            return list_output.read_list_output(self._session_handle, root, header)
+
+        except Exception as e:
+            raise exceptions.ActionException(f"Error reading list {root}: {e}")
+
+        finally:
+            self._after_action()
+
+    def iter_list_output(self, root: str = "wnd[0]/usr", header: int | None = 0) -> Iterator[dict[str, str | None]]:
+        """
+        Reads a classic ABAP list page by page like read_list_output(), rows are yielded as pages are read
+
+        Args:
+            root (str): user area with the list, default "wnd[0]/usr"
+            header (int | None): index of the header line among non separator lines, None for lists without header
+
+        Yields:
+            dict[str, str | None]: text by column name, None for empty cells
+
+        Raises:
+            ActionException: error reading the list
+
+        Example:
+            ```
+            for row in main_window.iter_list_output():
+                print(row["Material"])
+            ```
+        """
+        try:
+            yield from list_output.iter_list_rows(self._session_handle, root, header)
+
+        except Exception as e:
+            raise exceptions.ActionException(f"Error reading list {root}: {e}")
+
+        finally:
+            self._after_action()
+
+    def read_shell_tree(
+        self,
+        element: str,
+        attributes: Iterable[str] | None = None,
+        lazy: bool = False,
+    ) -> ShellTree:
         """
         Read the tree of the specified ShellTree element.
         Args:
             element (str): The identifier of the element to read.
+            attributes (Iterable[str] | None): node attributes to read, all but items if None - e.g. ["label"] reads
+                one COM call per node, attributes not read are None
+            lazy (bool): read top level nodes only, children of a folder when they are first needed
 
         Returns:
             ShellTree: The ShellTree object with the tree data and methods to manage it.
@@ -506,6 +1173,9 @@ class Window:
             for node in node_folders:
                 node.expand()
             tree.collapse_all()
+
+            menu = main_window.read_shell_tree("wnd[0]/shellcont/shellcont/shell", lazy=True)
+            menu.get_node_by_path("Office/Workplace").double_click()
             ```
         """
-        return ShellTree(self._session_handle, element)
+        return ShellTree(self._session_handle, element, attributes, lazy)
@@ -0,0 +1,117 @@
+import asyncio
+import threading
+
+import pysapscript
+from pysapscript.backends import SimulatedBackend
+from pysapscript.session_worker import SessionWorker
+from pysapscript.simulated import SimulatedSapGui, SimulatedTextField, SimulatedListOutput, SimulatedTree
+
+
+FIELD = "wnd[0]/usr/txtNAME"
+TREE = "wnd[0]/usr/cntlMENU/shellcont/shell"
+
+
+class ThreadCheckingBackend(SimulatedBackend):
+    def __init__(self, sap_gui: SimulatedSapGui) -> None:
+        super().__init__(sap_gui)
+        self.events: list[str] = []
+
+    def thread_close(self) -> None:
+        self.events.append(f"close {threading.current_thread().name}")
+
+
+def build_screen(session) -> None:
+    session.place(FIELD, SimulatedTextField("txtNAME"))
+
+
+def make_sap_gui(sessions: int) -> SimulatedSapGui:
+    sap_gui = SimulatedSapGui()
+    connection = sap_gui.application.open_connection()
+    connection.register_transaction("ZNAME", build_screen)
+    for _ in range(sessions - 1):
+        connection.open_session()
+
+    return sap_gui
+
+
+def test_async_windows_run_in_their_workers() -> None:
+    sap_gui = make_sap_gui(2)
+
+    async def run() -> list[str]:
+        async with pysapscript.AsyncSapscript(backend=SimulatedBackend(sap_gui)) as sapscript:
+            windows = [await sapscript.attach_window(0, s) for s in range(2)]
+            await asyncio.gather(*(w.start_transaction("ZNAME") for w in windows))
+            await asyncio.gather(*(w.write(FIELD, f"session {i}") for i, w in enumerate(windows)))
+
+            return list(await asyncio.gather(*(w.read(FIELD) for w in windows)))
+
+    assert asyncio.run(run()) == ["session 0", "session 1"]
+
+
+def test_worker_releases_window_before_closing_backend() -> None:
+    backend = ThreadCheckingBackend(make_sap_gui(1))
+    worker = SessionWorker(pysapscript.Sapscript(backend=backend), 0, 0)
+    worker.attach().result(timeout=5)
+
+    def close_with_window_released() -> None:
+        backend.events.append(f"window {worker.window}")
+        ThreadCheckingBackend.thread_close(backend)
+
+    backend.thread_close = close_with_window_released
+    worker.shutdown()
+
+    assert backend.events == ["window None", "close pysapscript-0-0_0"]
+
+
+def test_quit_reuses_attached_worker(monkeypatch) -> None:
+    sap_gui = make_sap_gui(1)
+    threads: list[str] = []
+    monkeypatch.setattr(pysapscript.Sapscript, "quit", lambda self: threads.append(threading.current_thread().name))
+
+    async def run() -> None:
+        async with pysapscript.AsyncSapscript(backend=SimulatedBackend(sap_gui)) as sapscript:
+            await sapscript.attach_window(0, 0)
+            await sapscript.quit()
+
+    asyncio.run(run())
+
+    assert threads == ["pysapscript-0-0_0"]
+
+
+def test_generator_steps_run_in_worker() -> None:
+    sap_gui = make_sap_gui(1)
+    lines = ["Material    Plant"] + [f"M-{i:04}      1000" for i in range(30)]
+    SimulatedListOutput(lines, page_size=10).show(sap_gui.application.Children(0).Children(0))
+    threads: set[str] = set()
+
+    async def run() -> list[str]:
+        async with pysapscript.AsyncSapscript(backend=SimulatedBackend(sap_gui)) as sapscript:
+            sapscript.sapscript.instrument(lambda _: threads.add(threading.current_thread().name))
+            window = await sapscript.attach_window(0, 0)
+
+            return [row["Material"] async for row in await window.iter_list_output()]
+
+    rows = asyncio.run(run())
+
+    assert rows[0] == "M-0000" and len(rows) == 30
+    assert threads == {"pysapscript-0-0_0"}
+
+
+def test_lazy_walk_runs_in_worker() -> None:
+    sap_gui = make_sap_gui(1)
+    session = sap_gui.application.Children(0).Children(0)
+    tree = session.place(TREE, SimulatedTree("shell", load_on_expand=True))
+    tree.add_node("A", "Office", folder=True)
+    tree.add_node("A1", "Inbox", parent="A")
+    threads: set[str] = set()
+
+    async def run() -> list[str]:
+        async with pysapscript.AsyncSapscript(backend=SimulatedBackend(sap_gui)) as sapscript:
+            sapscript.sapscript.instrument(lambda _: threads.add(threading.current_thread().name))
+            window = await sapscript.attach_window(0, 0)
+            menu = await window.read_shell_tree(TREE, lazy=True)
+
+            return [node.label async for node in await menu.walk()]
+
+    assert asyncio.run(run()) == ["Office", "Inbox"]
+    assert threads == {"pysapscript-0-0_0"}
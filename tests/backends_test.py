@@ -0,0 +1,63 @@
+import threading
+
+import pysapscript
+from pysapscript.backends import Backend, Handle, SimulatedBackend, scripting_errors
+from pysapscript.session_worker import SessionWorker
+from pysapscript.simulated import SimulatedSapGui
+from pysapscript.types_ import exceptions
+
+
+class CountingBackend(SimulatedBackend):
+    def __init__(self, sap_gui: SimulatedSapGui) -> None:
+        super().__init__(sap_gui)
+        self.threads: list[str] = []
+
+    def thread_init(self) -> None:
+        self.threads.append(f"init {threading.current_thread().name}")
+
+    def thread_close(self) -> None:
+        self.threads.append(f"close {threading.current_thread().name}")
+
+
+def test_sapscript_uses_backend() -> None:
+    sap_gui = SimulatedSapGui()
+    sap_gui.application.open_connection("SQ4", "012")
+    pss = pysapscript.Sapscript(backend=SimulatedBackend(sap_gui))
+
+    assert pss.list_sessions() == [(0, 0)]
+    assert sap_gui.call_count > 0
+
+
+def test_worker_thread_runs_backend_hooks() -> None:
+    sap_gui = SimulatedSapGui()
+    sap_gui.application.open_connection()
+    backend = CountingBackend(sap_gui)
+
+    worker = SessionWorker(pysapscript.Sapscript(backend=backend), 0, 0)
+    worker.attach().result(timeout=5)
+    worker.shutdown()
+
+    assert backend.threads == ["init pysapscript-0-0_0", "close pysapscript-0-0_0"]
+
+
+def test_custom_backend() -> None:
+    class EngineBackend(Backend):
+        def __init__(self, engine: Handle) -> None:
+            self.engine = engine
+
+        def connect(self) -> Handle:
+            return self.engine
+
+        @property
+        def errors(self) -> tuple[type[Exception], ...]:
+            return (exceptions.ScriptingError,)
+
+    sap_gui = SimulatedSapGui()
+    sap_gui.application.open_connection()
+    main_window = pysapscript.Sapscript(backend=EngineBackend(sap_gui.application)).attach_window(0, 0)
+
+    assert main_window.read_status().text == ""
+
+
+def test_scripting_errors_are_backend_neutral() -> None:
+    assert exceptions.ScriptingError in scripting_errors()
@@ -0,0 +1,73 @@
+import threading
+
+import polars as pl
+import pytest
+
+import pysapscript
+from pysapscript.fan_out import fan_out
+from pysapscript.simulated import SimulatedSapGui
+from pysapscript.types_ import exceptions
+
+
+@pytest.fixture
+def sapscript() -> pysapscript.Sapscript:
+    sap_gui = SimulatedSapGui()
+    sap_gui.application.open_connection("SQ4", "012")
+    sap_gui.application.open_connection("SQ8", "100")
+    sap_gui.application.open_connection("SQ4", "200")
+
+    return pysapscript.Sapscript(sap_gui_auto=sap_gui)
+
+
+def read_session(window: pysapscript.Window) -> pl.DataFrame:
+    return pl.DataFrame({"connection": [window.connection], "thread": [threading.current_thread().name]})
+
+
+def test_results_follow_target_order(sapscript: pysapscript.Sapscript) -> None:
+    result = fan_out(sapscript, [(2, 0), "SQ8", "SQ4/012"], read_session)
+
+    assert result.errors == {}
+    assert result.sources == ["SQ4/200", "SQ8/100", "SQ4/012"]
+    assert result.data["connection"].to_list() == [2, 1, 0]
+    assert result.data["source"].to_list() == result.sources
+    assert result.data["thread"].n_unique() == 3
+
+
+def test_errors_are_collected_by_target(sapscript: pysapscript.Sapscript) -> None:
+    def read_or_fail(window: pysapscript.Window) -> pl.DataFrame:
+        if window.connection == 1:
+            raise exceptions.ActionException("no authorization")
+
+        if window.connection == 2:
+            return pl.DataFrame({"connection": [window.connection], "extra": ["x"]})
+
+        return read_session(window)
+
+    result = fan_out(sapscript, ["SQ4", "SQ8", "SQ9", (2, 0), (5, 0)], read_or_fail)
+
+    assert result.sources == ["SQ4/012", "SQ4/200"]
+    assert set(result.errors) == {"SQ8", "SQ9", "5/0"}
+    assert isinstance(result.errors["SQ8"], exceptions.ActionException)
+    assert isinstance(result.errors["SQ9"], exceptions.AttachException)
+    assert isinstance(result.errors["5/0"], exceptions.AttachException)
+    assert result.data.columns == ["connection", "thread", "source", "extra"]
+    assert result.data["extra"].to_list() == [None, "x"]
+
+
+def test_duplicate_targets_are_refused(sapscript: pysapscript.Sapscript) -> None:
+    with pytest.raises(ValueError, match="SQ8, 0/0"):
+        fan_out(sapscript, ["SQ8", (0, 0), "SQ4", "SQ8", (0, 0)], read_session)
+
+
+def test_incompatible_columns_are_reported(sapscript: pysapscript.Sapscript) -> None:
+    def read_list(window: pysapscript.Window) -> pl.DataFrame:
+        if window.connection == 1:
+            return pl.DataFrame({"value": [[1, 2]]})
+
+        return pl.DataFrame({"value": [window.connection]})
+
+    result = fan_out(sapscript, ["SQ4/012", "SQ8", (2, 0)], read_list)
+
+    assert result.sources == ["SQ4/012", "SQ4/200"]
+    assert isinstance(result.errors["SQ8"], pl.exceptions.SchemaError)
+    assert result.data["value"].to_list() == [0, 2]
@@ -0,0 +1,126 @@
+import time
+
+import pytest
+
+import pysapscript
+from pysapscript.instrumentation import ComCallEvent, InMemoryAggregator, InstrumentedHandle, instrument
+from pysapscript.simulated import SimulatedSapGui, SimulatedSession, SimulatedCTextField
+from pysapscript.types_ import exceptions
+
+
+FIELD = "wnd[0]/usr/ctxtDATABROWSE-TABLENAME"
+
+
+class SlowHandle:
+    name = "slow"
+
+    def wait(self, seconds: float) -> str:
+        time.sleep(seconds)
+        return "waited"
+
+    def child(self) -> "SlowHandle":
+        return SlowHandle()
+
+
+def build_se16(session: SimulatedSession) -> None:
+    session.place(FIELD, SimulatedCTextField("ctxtDATABROWSE-TABLENAME", label="Table Name"))
+
+
+@pytest.fixture
+def sap_gui() -> SimulatedSapGui:
+    sap_gui = SimulatedSapGui()
+    sap_gui.application.open_connection().register_transaction("SE16", build_se16)
+
+    return sap_gui
+
+
+@pytest.fixture
+def main_window(sap_gui: SimulatedSapGui) -> pysapscript.Window:
+    main_window = pysapscript.Sapscript(sap_gui_auto=sap_gui).attach_window(0, 0)
+    main_window.start_transaction("SE16")
+
+    return main_window
+
+
+def test_flow_operations_are_counted(sap_gui: SimulatedSapGui, main_window: pysapscript.Window) -> None:
+    events: list[ComCallEvent] = []
+    main_window.instrument(events.append)
+    sap_gui.reset_calls()
+
+    main_window.write(FIELD, "MARA")
+    assert main_window.read(FIELD) == "MARA"
+
+    assert [(e.element, e.operation, e.kind) for e in events] == [
+        (FIELD, "findById", "call"),
+        (FIELD, "text", "set"),
+        (FIELD, "findById", "call"),
+        (FIELD, "text", "get"),
+    ]
+    assert all(e.ok and e.duration >= 0 for e in events)
+    assert sap_gui.calls == {"findById": 2, "text": 2}
+
+
+def test_aggregator_stats_and_errors(main_window: pysapscript.Window) -> None:
+    aggregator = InMemoryAggregator()
+    main_window.instrument(aggregator)
+
+    for _ in range(3):
+        main_window.read(FIELD)
+
+    with pytest.raises(exceptions.ActionException):
+        main_window.read("wnd[0]/usr/txtMISSING")
+
+    assert aggregator.count == 7
+    assert aggregator.counts() == {"findById": 4, "text": 3}
+
+    by_element = {stats.key: stats for stats in aggregator.stats(by="element")}
+    assert by_element[f"{FIELD} text"].count == 3
+    assert by_element["wnd[0]/usr/txtMISSING findById"].errors == 1
+
+    find = next(stats for stats in aggregator.stats() if stats.key == "findById")
+    assert (find.count, find.errors) == (4, 1)
+    assert find.total == pytest.approx(find.mean * 4)
+
+    aggregator.reset()
+    assert aggregator.count == 0
+
+
+def test_instrumentation_off(main_window: pysapscript.Window) -> None:
+    aggregator = InMemoryAggregator()
+    main_window.instrument(aggregator)
+    main_window.read(FIELD)
+    main_window.instrument(None)
+    main_window.read(FIELD)
+
+    assert aggregator.count == 2
+    assert not isinstance(main_window._session_handle, InstrumentedHandle)
+
+
+def test_percentiles_are_nearest_rank() -> None:
+    aggregator = InMemoryAggregator()
+    for duration in range(1, 101):
+        aggregator(ComCallEvent("wnd[0]", "press", "call", duration / 100, ok=True))
+
+    stats = aggregator.stats()[0]
+    assert (stats.count, stats.p50, stats.p95, stats.p99) == (100, 0.5, 0.95, 0.99)
+    assert stats.mean == pytest.approx(0.505)
+
+
+def test_duration_covers_the_call() -> None:
+    events: list[ComCallEvent] = []
+    handle = instrument(SlowHandle(), "slow", events.append)
+
+    assert handle.wait(0.05) == "waited"
+    assert events[-1].operation == "wait"
+    assert 0.05 <= events[-1].duration < 1
+
+
+def test_returned_handles_are_wrapped() -> None:
+    events: list[ComCallEvent] = []
+    handle = instrument(SlowHandle(), "slow", events.append)
+
+    child = handle.child()
+    assert isinstance(child, InstrumentedHandle)
+    assert child.name == "slow"
+    assert type(instrument(child, "slow", None)) is SlowHandle
+    assert [(e.operation, e.kind) for e in events] == [("child", "call"), ("name", "get")]
@@ -0,0 +1,98 @@
+import time
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+import pysapscript
+from pysapscript.job_queue import JobQueue, MemoryJobQueue, QueueWorker, SQLiteJobQueue
+from pysapscript.simulated import SimulatedSapGui
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def queue(request: pytest.FixtureRequest, tmp_path: Path) -> JobQueue:
+    if request.param == "memory":
+        return MemoryJobQueue()
+
+    return SQLiteJobQueue(tmp_path / "jobs.sqlite")
+
+
+@pytest.fixture
+def main_window() -> pysapscript.Window:
+    sap_gui = SimulatedSapGui()
+    sap_gui.application.open_connection()
+
+    return pysapscript.Sapscript(sap_gui_auto=sap_gui).attach_window(0, 0)
+
+
+def test_claim_by_priority(queue: JobQueue) -> None:
+    later = queue.put("read", {"n": 1})
+    first = queue.put("read", {"n": 2}, priority=-1)
+
+    assert queue.claim("a").id == first
+    assert queue.claim("b").id == later
+    assert queue.claim("c") is None
+    assert queue.counts() == {"running": 2}
+
+
+def test_complete_and_fail(queue: JobQueue) -> None:
+    done = queue.put("read")
+    retried = queue.put("read", max_attempts=2)
+
+    assert queue.claim("a").id == done
+    assert not queue.complete(done, "other", 1)
+    assert queue.complete(done, "a", {"rows": 3})
+    assert queue.get(done).result == {"rows": 3}
+
+    assert queue.claim("a").id == retried
+    queue.fail(retried, "a", "first")
+    assert queue.get(retried).status == "queued"
+
+    assert queue.claim("a").id == retried
+    queue.fail(retried, "a", "second")
+    assert queue.get(retried).status == "failed"
+    assert queue.get(retried).error == "second"
+
+
+def test_expired_lease_is_queued_again(queue: JobQueue) -> None:
+    job_id = queue.put("read", max_attempts=2)
+
+    queue.claim("crashed", lease_seconds=0.01)
+    time.sleep(0.02)
+
+    claimed = queue.claim("b")
+    assert claimed.id == job_id
+    assert claimed.attempts == 2
+    assert not queue.complete(job_id, "crashed")
+
+    time.sleep(0.02)
+    queue.heartbeat(job_id, "b", lease_seconds=0.01)
+    time.sleep(0.02)
+    assert queue.requeue_expired() == 0
+    assert queue.get(job_id).status == "failed"
+
+
+def test_worker_fails_job_with_unserializable_result(queue: JobQueue, main_window: pysapscript.Window) -> None:
+    queue.put("frame")
+    queue.put("missing")
+    worker = QueueWorker(queue, main_window, {"frame": lambda _: pl.DataFrame({"a": [1]})}, worker_id="w")
+
+    assert worker.run(stop_when_empty=True) == 2
+    assert queue.counts() == {"failed": 2}
+    assert queue.get(1).error.startswith("TypeError")
+
+
+def test_worker_renews_lease_of_long_job(queue: JobQueue, main_window: pysapscript.Window) -> None:
+    job_id = queue.put("slow")
+    claimed_meanwhile = []
+
+    def slow(_: pysapscript.Window) -> str:
+        time.sleep(0.3)
+        claimed_meanwhile.append(queue.claim("other"))
+        return "done"
+
+    worker = QueueWorker(queue, main_window, {"slow": slow}, worker_id="w", lease_seconds=0.15)
+
+    assert worker.run_once().status == "done"
+    assert claimed_meanwhile == [None]
+    assert queue.get(job_id).attempts == 1
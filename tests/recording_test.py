@@ -0,0 +1,80 @@
+from pathlib import Path
+
+import pytest
+
+import pysapscript
+from pysapscript.recording import Recorder, ReplaySapGui
+from pysapscript.types_ import exceptions
+from pysapscript.simulated import SimulatedSapGui, SimulatedSession, SimulatedCTextField, SimulatedGridView
+
+
+GRID = "wnd[0]/usr/cntlGRID1/shellcont/shell"
+FIELD = "wnd[0]/usr/ctxtDATABROWSE-TABLENAME"
+
+
+def build_se16(session: SimulatedSession) -> None:
+    session.place(FIELD, SimulatedCTextField("ctxtDATABROWSE-TABLENAME", label="Table Name"))
+    session.place(GRID, SimulatedGridView("shell", ["MATNR", "MTART"], [[f"M{i}", "FERT"] for i in range(45)]))
+
+
+def run(pss: pysapscript.Sapscript) -> tuple[str, list[dict]]:
+    main_window = pss.attach_window(0, 0)
+    main_window.start_transaction("SE16")
+    main_window.write(FIELD, "MARA")
+
+    return main_window.read(FIELD), main_window.read_shell_table(GRID).to_dicts()
+
+
+@pytest.fixture
+def recording(tmp_path: Path) -> tuple[Path, tuple[str, list[dict]]]:
+    sap_gui = SimulatedSapGui()
+    sap_gui.application.open_connection().register_transaction("SE16", build_se16)
+    path = tmp_path / "run.jsonl.gz"
+
+    pss = pysapscript.Sapscript(sap_gui_auto=sap_gui)
+    with Recorder(path) as recorder:
+        pss.record(recorder)
+        result = run(pss)
+
+    return path, result
+
+
+def test_strict_replay_returns_recorded_results(recording: tuple[Path, tuple[str, list[dict]]]) -> None:
+    path, recorded = recording
+    replay = ReplaySapGui(path, strict=True)
+
+    assert run(pysapscript.Sapscript(sap_gui_auto=replay)) == recorded
+    assert replay.pending == 0
+
+
+def test_strict_replay_detects_other_calls(recording: tuple[Path, tuple[str, list[dict]]]) -> None:
+    path, _ = recording
+    main_window = pysapscript.Sapscript(sap_gui_auto=ReplaySapGui(path, strict=True)).attach_window(0, 0)
+
+    with pytest.raises(exceptions.ActionException, match="Expected"):
+        main_window.read(FIELD)
+
+
+def test_keyed_replay_serves_repeated_calls(recording: tuple[Path, tuple[str, list[dict]]]) -> None:
+    path, recorded = recording
+    main_window = pysapscript.Sapscript(sap_gui_auto=ReplaySapGui(path)).attach_window(0, 0)
+
+    assert main_window.read(FIELD) == "MARA"
+    assert main_window.read(FIELD) == "MARA"
+    assert main_window.read_shell_table(GRID).to_dicts() == recorded[1]
+
+
+def test_recorded_errors_are_replayed(tmp_path: Path) -> None:
+    sap_gui = SimulatedSapGui()
+    sap_gui.application.open_connection()
+    path = tmp_path / "errors.jsonl.gz"
+
+    with Recorder(path) as recorder:
+        main_window = pysapscript.Sapscript(sap_gui_auto=sap_gui).attach_window(0, 0)
+        main_window.record(recorder)
+        with pytest.raises(exceptions.ActionException):
+            main_window.read("wnd[0]/usr/txtMISSING")
+
+    session = ReplaySapGui(path).handle("ses[0]")
+    with pytest.raises(exceptions.ScriptingError):
+        session.findById("wnd[0]/usr/txtMISSING")
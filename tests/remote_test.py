@@ -0,0 +1,166 @@
+import socket
+from typing import Iterator
+
+import polars as pl
+import pytest
+
+import pysapscript
+from pysapscript.remote import RemoteClient, RemoteServer, protocol
+from pysapscript.types_ import exceptions
+from pysapscript.types_.types import StatusMessage, FieldResult, NavigateAction
+from pysapscript.simulated import (
+    SimulatedSapGui,
+    SimulatedSession,
+    SimulatedCTextField,
+    SimulatedGridView,
+    SimulatedTree,
+    SimulatedListOutput,
+)
+
+
+GRID = "wnd[0]/usr/cntlGRID1/shellcont/shell"
+TREE = "wnd[0]/usr/cntlTREE/shellcont/shell"
+FIELD = "wnd[0]/usr/ctxtDATABROWSE-TABLENAME"
+
+
+def build_se16(session: SimulatedSession) -> None:
+    session.place(FIELD, SimulatedCTextField("ctxtDATABROWSE-TABLENAME", label="Table Name"))
+    session.place(GRID, SimulatedGridView("shell", ["MATNR", "MTART"], [[f"M{i}", "FERT"] for i in range(45)]))
+    session.register_v_key(8, lambda s: s.set_status("S", "45 entries found", "00", "001", ("45",)))
+
+    tree = session.place(TREE, SimulatedTree("shell"))
+    tree.add_node("1", "Folder", folder=True, expanded=True)
+    tree.add_node("2", "Child", parent="1")
+
+
+@pytest.fixture
+def sap_gui() -> SimulatedSapGui:
+    sap_gui = SimulatedSapGui()
+    sap_gui.application.open_connection().register_transaction("SE16", build_se16)
+
+    return sap_gui
+
+
+@pytest.fixture
+def client(sap_gui: SimulatedSapGui) -> Iterator[RemoteClient]:
+    with RemoteServer(pysapscript.Sapscript(sap_gui_auto=sap_gui), token="secret").start() as server:
+        with RemoteClient(*server.address, token="secret", timeout=10) as client:
+            yield client
+
+
+def test_window_api_is_mirrored(client: RemoteClient) -> None:
+    main_window = client.attach_window(0, 0)
+    main_window.start_transaction("SE16")
+    main_window.write(FIELD, "MARA")
+
+    assert client.list_sessions() == [(0, 0)]
+    assert main_window.read(FIELD) == "MARA"
+    assert main_window.connection == 0
+
+    table = main_window.read_shell_table(GRID)
+    assert table.rows == 45
+    assert table[0] == {"MATNR": "M0", "MTART": "FERT"}
+
+    tree = main_window.read_shell_tree(TREE)
+    assert len(tree) == 2
+    assert tree.get_node_by_key("2").label == "Child"
+
+
+def test_table_streams_as_arrow(client: RemoteClient) -> None:
+    main_window = client.attach_window(0, 0)
+    main_window.start_transaction("SE16")
+
+    frame = main_window.read_shell_table(GRID).to_polars_dataframe()
+
+    assert isinstance(frame, pl.DataFrame)
+    assert frame.shape == (45, 2)
+    assert frame["MATNR"][44] == "M44"
+
+
+def test_batch_is_one_round_trip(sap_gui: SimulatedSapGui, client: RemoteClient) -> None:
+    main_window = client.attach_window(0, 0)
+
+    with client.batch():
+        main_window.start_transaction("SE16")
+        main_window.write(FIELD, "MARA")
+        main_window.send_v_key(value=8)
+        text = main_window.read(FIELD)
+        status = main_window.read_status()
+
+    assert client._next_id == 2
+    assert text.value == "MARA"
+    assert isinstance(status.value, StatusMessage)
+    assert status.value.number == "001"
+
+
+def test_batch_stops_at_first_error(client: RemoteClient) -> None:
+    main_window = client.attach_window(0, 0)
+
+    with pytest.raises(exceptions.ActionException):
+        with client.batch():
+            missing = main_window.read("wnd[0]/usr/txtMISSING")
+            skipped = main_window.start_transaction("SE16")
+
+    with pytest.raises(exceptions.ActionException):
+        missing.value
+
+    with pytest.raises(exceptions.RemoteException, match="Skipped"):
+        skipped.value
+
+
+def test_invalid_token_is_refused(sap_gui: SimulatedSapGui) -> None:
+    with RemoteServer(pysapscript.Sapscript(sap_gui_auto=sap_gui), token="secret").start() as server:
+        with pytest.raises(exceptions.RemoteException, match="Invalid token"):
+            RemoteClient(*server.address, token="wrong", timeout=10)
+
+
+def test_token_is_required_outside_loopback(sap_gui: SimulatedSapGui) -> None:
+    with pytest.raises(ValueError, match="Token is required"):
+        RemoteServer(pysapscript.Sapscript(sap_gui_auto=sap_gui), host="0.0.0.0")
+
+
+def test_wire_types_round_trip() -> None:
+    values = [NavigateAction.back, FieldResult("wnd[0]/usr/txtA", True, "x"), StatusMessage("S", "00", "001", ("45",), "")]
+    blobs: list[bytes] = []
+
+    encoded = protocol.encode(values, blobs, lambda obj: pytest.fail(f"{obj} sent as reference"))
+
+    assert protocol.decode(encoded, blobs, lambda _: None) == values
+
+
+@pytest.mark.parametrize(
+    "tagged",
+    [
+        {"$dataclass": "pysapscript.utils.utils:kill_process", "fields": {}},
+        {"$enum": "pysapscript.utils.utils:kill_process", "value": "saplogon.exe"},
+        {"$dataclass": "os:system", "fields": {"command": "echo"}},
+        {"$dataclass": "pysapscript.types_.types:NavigateAction", "fields": {}},
+        {"$enum": "pysapscript.types_.types:StatusMessage", "value": "S"},
+        {"$dataclass": ["pysapscript.types_.types:FieldResult"], "fields": {}},
+    ],
+)
+def test_foreign_tagged_type_is_refused(tagged: dict) -> None:
+    with pytest.raises(ValueError, match="Refusing to decode type"):
+        protocol.decode(tagged, [], lambda _: None)
+
+
+def test_foreign_tagged_argument_is_refused_by_server(sap_gui: SimulatedSapGui) -> None:
+    foreign = {"$dataclass": "pysapscript.utils.utils:kill_process", "fields": {"process": "saplogon.exe"}}
+
+    with RemoteServer(pysapscript.Sapscript(sap_gui_auto=sap_gui), token="secret").start() as server:
+        with socket.create_connection(server.address, timeout=10) as sock:
+            protocol.send_frame(sock, {"version": protocol.VERSION, "token": "secret"})
+            protocol.recv_frame(sock)
+            protocol.send_frame(sock, {"id": 1, "ops": [{"target": "sapscript", "method": "list_sessions", "args": [foreign]}]})
+            header, _ = protocol.recv_frame(sock)
+
+    assert header["results"] == [{"error": "ValueError", "message": f"Refusing to decode type {foreign['$dataclass']}"}]
+
+
+def test_generator_is_read_in_worker(sap_gui: SimulatedSapGui, client: RemoteClient) -> None:
+    lines = ["Material    Plant"] + [f"M-{i:04}      1000" for i in range(30)]
+    SimulatedListOutput(lines, page_size=10).show(sap_gui.application.Children(0).Children(0))
+
+    rows = client.attach_window(0, 0).iter_list_output()
+
+    assert [row["Material"] for row in rows] == [f"M-{i:04}" for i in range(30)]
@@ -0,0 +1,112 @@
+import threading
+import time
+
+import pytest
+
+import pysapscript
+from pysapscript.scheduler import JobScheduler, THROUGHPUT_WINDOW_SECONDS
+from pysapscript.simulated import SimulatedSapGui
+from pysapscript.types_ import exceptions
+
+
+@pytest.fixture
+def sapscript() -> pysapscript.Sapscript:
+    sap_gui = SimulatedSapGui()
+    connection = sap_gui.application.open_connection()
+    connection.open_session()
+
+    return pysapscript.Sapscript(sap_gui_auto=sap_gui)
+
+
+def session_of(window: pysapscript.Window) -> int:
+    return window.session
+
+
+def test_jobs_run_by_priority(sapscript: pysapscript.Sapscript) -> None:
+    started = threading.Event()
+    release = threading.Event()
+    order: list[str] = []
+
+    def block(_: pysapscript.Window) -> None:
+        started.set()
+        release.wait(5)
+
+    with JobScheduler(sapscript, [(0, 0)]) as scheduler:
+        scheduler.submit(block)
+        started.wait(5)
+
+        futures = [
+            scheduler.submit(lambda _, name=name: order.append(name), priority=priority)
+            for name, priority in [("low", 5), ("high", -1), ("normal", 0), ("normal 2", 0)]
+        ]
+        release.set()
+        [future.result(timeout=5) for future in futures]
+
+    assert order == ["high", "normal", "normal 2", "low"]
+
+
+def test_jobs_spread_over_sessions(sapscript: pysapscript.Sapscript) -> None:
+    with JobScheduler(sapscript) as scheduler:
+        futures = [scheduler.submit(session_of) for _ in range(10)]
+        sessions = {future.result(timeout=5) for future in futures}
+
+    assert sessions <= {0, 1}
+    assert scheduler.stats().jobs_done == 10
+
+
+def test_action_exception_is_retried(sapscript: pysapscript.Sapscript) -> None:
+    attempts: list[int] = []
+
+    def flaky(_: pysapscript.Window) -> str:
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise exceptions.ActionException("busy")
+
+        return "done"
+
+    def broken(_: pysapscript.Window) -> None:
+        raise exceptions.ActionException("broken")
+
+    with JobScheduler(sapscript, [(0, 0)]) as scheduler:
+        retried = scheduler.submit(flaky, retries=2)
+        failing = scheduler.submit(broken, retries=1)
+
+        assert retried.result(timeout=5) == "done"
+        with pytest.raises(exceptions.ActionException):
+            failing.result(timeout=5)
+
+    stats = scheduler.stats()
+    assert (stats.jobs_done, stats.jobs_failed, stats.jobs_retried) == (1, 1, 3)
+
+
+def test_timeout_fails_job_and_session_continues(sapscript: pysapscript.Sapscript) -> None:
+    with JobScheduler(sapscript, [(0, 0)]) as scheduler:
+        slow = scheduler.submit(lambda _: time.sleep(0.3), timeout=0.05)
+        following = scheduler.submit(session_of)
+
+        with pytest.raises(TimeoutError):
+            slow.result(timeout=0.2)
+
+        assert following.result(timeout=5) == 0
+
+
+def test_submit_fails_when_no_session_attached(sapscript: pysapscript.Sapscript) -> None:
+    scheduler = JobScheduler(sapscript, [(0, 5)])
+    scheduler.start()
+    scheduler._runners[0].join(5)
+
+    with pytest.raises(exceptions.AttachException):
+        scheduler.submit(session_of)
+
+    scheduler.shutdown()
+
+
+def test_finish_times_are_trimmed_without_stats(sapscript: pysapscript.Sapscript, monkeypatch: pytest.MonkeyPatch) -> None:
+    with JobScheduler(sapscript, [(0, 0)]) as scheduler:
+        [scheduler.submit(session_of).result(timeout=5) for _ in range(3)]
+
+        later = time.monotonic() + THROUGHPUT_WINDOW_SECONDS + 1
+        monkeypatch.setattr(time, "monotonic", lambda: later)
+        scheduler.submit(session_of).result(timeout=5)
+
+        assert len(scheduler._finished) == 1
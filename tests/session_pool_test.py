@@ -0,0 +1,141 @@
+import threading
+
+import pytest
+
+import pysapscript
+from pysapscript.simulated import SimulatedSapGui
+from pysapscript.types_ import exceptions
+
+
+@pytest.fixture
+def sap_gui() -> SimulatedSapGui:
+    sap_gui = SimulatedSapGui()
+    sap_gui.application.open_connection("SQ4", "012")
+
+    return sap_gui
+
+
+@pytest.fixture
+def sapscript(sap_gui: SimulatedSapGui) -> pysapscript.Sapscript:
+    return pysapscript.Sapscript(sap_gui_auto=sap_gui)
+
+
+def close_session(sap_gui: SimulatedSapGui, session: int) -> None:
+    connection = sap_gui.application.Children(0)
+    connection.CloseSession(f"/app/con[0]/ses[{session}]")
+
+
+def test_lease_and_return(sapscript: pysapscript.Sapscript) -> None:
+    pool = sapscript.session_pool(3)
+
+    assert len(pool) == 3
+    with pool.lease() as first, pool.lease() as second:
+        assert pool.free == 1
+        assert first.session != second.session
+
+    assert pool.free == 3
+
+    with pool.lease(), pool.lease(), pool.lease():
+        with pytest.raises(exceptions.SessionPoolExhaustedException):
+            with pool.lease():
+                pass
+
+
+def test_dead_session_is_replaced_on_lease(sap_gui: SimulatedSapGui, sapscript: pysapscript.Sapscript) -> None:
+    pool = sapscript.session_pool(2)
+    close_session(sap_gui, 1)
+
+    with pool.lease() as leased:
+        assert leased.session == 1
+        assert leased._session_handle.Id == "/app/con[0]/ses[1]"
+
+    assert len(pool) == 2
+
+
+def test_failed_replacement_keeps_pool_size(
+    sap_gui: SimulatedSapGui,
+    sapscript: pysapscript.Sapscript,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pool = sapscript.session_pool(2)
+    close_session(sap_gui, 1)
+
+    def fail(*_: object) -> None:
+        raise exceptions.WindowDidNotAppearException("no window")
+
+    monkeypatch.setattr(sapscript, "open_new_window", fail)
+    with pytest.raises(exceptions.WindowDidNotAppearException):
+        with pool.lease():
+            pass
+
+    assert pool.free == 2
+
+    monkeypatch.undo()
+    with pool.lease() as replaced:
+        assert replaced._session_handle.Id == "/app/con[0]/ses[1]"
+
+    assert len(pool) == 2
+
+
+def test_release_failure_does_not_hide_caller_error(
+    sap_gui: SimulatedSapGui,
+    sapscript: pysapscript.Sapscript,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pool = sapscript.session_pool(1)
+
+    def fail(*_: object) -> None:
+        raise exceptions.WindowDidNotAppearException("no window")
+
+    with pytest.raises(KeyError):
+        with pool.lease() as leased:
+            close_session(sap_gui, leased.session)
+            monkeypatch.setattr(sapscript, "open_new_window", fail)
+            raise KeyError("caller error")
+
+    assert pool.free == 1
+
+
+def test_new_window_number_survives_closed_session(sap_gui: SimulatedSapGui, sapscript: pysapscript.Sapscript) -> None:
+    main_window = sapscript.attach_window(0, 0)
+    second = sapscript.open_new_window(main_window, timeout=1)
+    sapscript.open_new_window(main_window, timeout=1)
+    close_session(sap_gui, second.session)
+
+    reopened = sapscript.open_new_window(main_window, timeout=1)
+
+    assert reopened.session == 1
+    assert sapscript.attach_window(0, 2)._session_handle.Id == "/app/con[0]/ses[2]"
+    assert sapscript.list_sessions() == [(0, 0), (0, 2), (0, 1)]
+
+
+def test_concurrent_leases_get_distinct_sessions(sapscript: pysapscript.Sapscript) -> None:
+    pool = sapscript.session_pool(3)
+    barrier = threading.Barrier(3, timeout=5)
+    leased: list[int] = []
+
+    def lease() -> None:
+        with pool.lease() as window:
+            leased.append(window.session)
+            barrier.wait()
+
+    threads = [threading.Thread(target=lease) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert sorted(leased) == [0, 1, 2]
+    assert pool.free == 3
+
+
+def test_replacement_fails_when_no_session_is_alive(sap_gui: SimulatedSapGui, sapscript: pysapscript.Sapscript) -> None:
+    pool = sapscript.session_pool(2)
+    close_session(sap_gui, 1)
+    close_session(sap_gui, 0)
+
+    with pytest.raises(exceptions.AttachException, match="No session of connection 0 is alive"):
+        with pool.lease():
+            pass
+
+    assert pool.free == 2
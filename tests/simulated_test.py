@@ -0,0 +1,458 @@
+import sys
+
+import pytest
+
+import pysapscript
+from pysapscript import popups
+from pysapscript.types_ import exceptions
+from pysapscript.shell_tree import Node
+from pysapscript.tree_loader import NODE_ATTRIBUTES
+from pysapscript.simulated import (
+    SimulatedSapGui,
+    SimulatedSession,
+    SimulatedCTextField,
+    SimulatedTextField,
+    SimulatedRadioButton,
+    SimulatedCheckBox,
+    SimulatedComboBox,
+    SimulatedGridView,
+    SimulatedTree,
+    SimulatedTableControl,
+    SimulatedListOutput,
+    COLUMN_TREE,
+)
+
+
+GRID = "wnd[0]/usr/cntlGRID1/shellcont/shell"
+TREE = "wnd[0]/usr/cntlTREE/shellcont/shell"
+TABLE_CONTROL = "wnd[0]/usr/tblSAPLITEMS"
+MENU_TREE = "wnd[0]/usr/cntlMENU/shellcont/shell"
+ITEM_TREE = "wnd[0]/usr/cntlCOLUMNS/shellcont/shell"
+
+
+def build_se16(session: SimulatedSession) -> None:
+    session.place(
+        "wnd[0]/usr/ctxtDATABROWSE-TABLENAME",
+        SimulatedCTextField("ctxtDATABROWSE-TABLENAME", label="Table Name", tooltip="Name of the table"),
+    )
+    session.place("wnd[0]/usr/chkGD-SAPEDIT", SimulatedCheckBox("chkGD-SAPEDIT", text="SAP Edit"))
+    session.place("wnd[0]/usr/txtGD-MAX_LINES", SimulatedTextField("txtGD-MAX_LINES", "500", max_length=5))
+    session.place("wnd[0]/usr/radGD-ALL", SimulatedRadioButton("radGD-ALL", "All", selected=True))
+    session.place("wnd[0]/usr/radGD-NONE", SimulatedRadioButton("radGD-NONE", "None"))
+    session.place("wnd[0]/usr/cmbGD-FORMAT", SimulatedComboBox("cmbGD-FORMAT", {"A": "ALV Grid", "L": "List"}))
+    session.place(GRID, SimulatedGridView("shell", ["MATNR", "MTART"], [[f"M{i}", "FERT"] for i in range(55)]))
+    session.register_v_key(8, lambda s: s.set_status("S", "55 entries found", "00", "001", ("55",)))
+
+    session.place(TABLE_CONTROL, SimulatedTableControl(
+        "tblSAPLITEMS",
+        ["txtITEM-POSNR", "ctxtITEM-MATNR", "chkITEM-SELKZ"],
+        [[f"{i:04}", f"M{i}", i % 2 == 0] for i in range(25)] + [["", "", False]] * 5,
+        visible_rows=10,
+    ))
+
+    tree = session.place(TREE, SimulatedTree("shell"))
+    tree.add_node("1", "Folder", folder=True, expanded=True)
+    tree.add_node("2", "Child 1", parent="1")
+    tree.add_node("3", "Child 2", parent="1")
+    tree.add_node("4", "Subfolder", parent="1", folder=True, expanded=True)
+    tree.add_node("5", "Grandchild", parent="4")
+    tree.add_node("6", "Other")
+
+    menu = session.place(MENU_TREE, SimulatedTree("shell", load_on_expand=True))
+    menu.add_node("A", "Office", folder=True)
+    menu.add_node("A1", "Workplace", parent="A")
+    menu.add_node("A11", "Inbox", parent="A1")
+    menu.add_node("B", "Logistics", folder=True)
+    menu.add_node("B1", "Orders", parent="B")
+
+    columns = session.place(ITEM_TREE, SimulatedTree("shell", tree_type=COLUMN_TREE, columns={"QTY": "Quantity", "UNIT": "Unit"}))
+    columns.add_node("P", "Plant 1000", folder=True, expanded=True)
+    columns.add_node("P1", "Material A", parent="P", items={"QTY": "5", "UNIT": "PC"})
+    columns.add_node("P2", "Material B", parent="P", items={"QTY": "7"})
+
+
+@pytest.fixture
+def sap_gui() -> SimulatedSapGui:
+    sap_gui = SimulatedSapGui()
+    connection = sap_gui.application.open_connection("SQ4", "012")
+    connection.register_transaction("SE16", build_se16, title="Data Browser: Initial Screen")
+
+    return sap_gui
+
+
+@pytest.fixture
+def main_window(sap_gui: SimulatedSapGui) -> pysapscript.Window:
+    main_window = pysapscript.Sapscript(sap_gui_auto=sap_gui).attach_window(0, 0)
+    main_window.start_transaction("SE16")
+
+    return main_window
+
+
+def test_transaction_builds_screen(sap_gui: SimulatedSapGui, main_window: pysapscript.Window) -> None:
+    session = sap_gui.application.Children(0).Children(0)
+
+    assert session.Info.Transaction == "SE16"
+    assert session.main_window.Text == "Data Browser: Initial Screen"
+    assert main_window.find(label="table name").id == "wnd[0]/usr/ctxtDATABROWSE-TABLENAME"
+
+
+def test_unknown_transaction_shows_error(main_window: pysapscript.Window) -> None:
+    main_window.start_transaction("ZZZ")
+
+    assert main_window.read_status().type == "E"
+
+
+def test_fields(main_window: pysapscript.Window) -> None:
+    main_window.write("wnd[0]/usr/ctxtDATABROWSE-TABLENAME", "MARA")
+    main_window.set_checkbox("wnd[0]/usr/chkGD-SAPEDIT", True)
+
+    assert main_window.read("wnd[0]/usr/ctxtDATABROWSE-TABLENAME") == "MARA"
+    assert main_window.read_screen(as_dict=True)["wnd[0]/usr/chkGD-SAPEDIT"]["selected"] is True
+
+    with pytest.raises(exceptions.ActionException):
+        main_window.write("wnd[0]/usr/ctxtMISSING", "MARA")
+
+
+def test_find_by_name_type_and_tooltip(main_window: pysapscript.Window) -> None:
+    table_name = "wnd[0]/usr/ctxtDATABROWSE-TABLENAME"
+
+    assert main_window.find(name="DATABROWSE-TABLENAME").id == table_name
+    assert main_window.find(tooltip="name of the TABLE").id == table_name
+    assert main_window.find(type="GuiCTextField", label="Table Name").id == table_name
+    assert main_window.find(type="GuiCTextField", label="SAP Edit") is None
+    assert [e.id for e in main_window.find_all(type="GuiRadioButton")] == ["wnd[0]/usr/radGD-ALL", "wnd[0]/usr/radGD-NONE"]
+    assert main_window.find_all(name="MISSING") == []
+
+
+def test_find_index_is_rebuilt_after_action_and_screen_change(
+    sap_gui: SimulatedSapGui,
+    main_window: pysapscript.Window,
+) -> None:
+    assert main_window.find(name="GD-MAX_LINES").text == "500"
+
+    main_window.write("wnd[0]/usr/txtGD-MAX_LINES", "200")
+    assert main_window.find(name="GD-MAX_LINES").text == "200"
+
+    session = sap_gui.application.Children(0).Children(0)
+    session.place("wnd[0]/usr/txtGD-NEW", SimulatedTextField("txtGD-NEW", "new"))
+    assert main_window.find(name="GD-NEW") is None
+
+    session.Info.ScreenNumber = 2000
+    assert main_window.find(name="GD-NEW").text == "new"
+
+
+def test_read_screen_is_cached(sap_gui: SimulatedSapGui, main_window: pysapscript.Window) -> None:
+    first = main_window.read_screen(as_dict=True)
+    sap_gui.reset_calls()
+
+    assert main_window.read_screen(as_dict=True) == first
+    assert "findById" not in sap_gui.calls and "Children" not in sap_gui.calls
+    fingerprint_calls = sap_gui.call_count
+
+    main_window.write("wnd[0]/usr/txtGD-MAX_LINES", "200")
+    sap_gui.reset_calls()
+    assert main_window.read_screen(as_dict=True)["wnd[0]/usr/txtGD-MAX_LINES"]["text"] == "200"
+    assert sap_gui.call_count > fingerprint_calls
+
+    session = sap_gui.application.Children(0).Children(0)
+    session.place("wnd[0]/usr/txtGD-NEW", SimulatedTextField("txtGD-NEW", "new"))
+    assert "wnd[0]/usr/txtGD-NEW" not in main_window.read_screen(as_dict=True)
+
+    session.Info.ScreenNumber = 2000
+    assert main_window.read_screen(as_dict=True)["wnd[0]/usr/txtGD-NEW"]["text"] == "new"
+    assert "wnd[0]/usr/txtGD-NEW" in main_window.read_screen(as_dict=True, use_cache=False)
+
+
+def test_dropdown_by_text(sap_gui: SimulatedSapGui, main_window: pysapscript.Window) -> None:
+    dropdown = "wnd[0]/usr/cmbGD-FORMAT"
+    main_window.set_dropdown(dropdown, "List", "text")
+    assert main_window.read_many([dropdown])[dropdown].value == "L"
+
+    sap_gui.reset_calls()
+    main_window.set_dropdown(dropdown, " alv grid ", "text")
+    assert main_window.read_many([dropdown])[dropdown].value == "A"
+    assert "Entries" not in sap_gui.calls
+
+    assert "List" in main_window.read_dropdown_entries(dropdown)
+    with pytest.raises(exceptions.ActionException, match="not found"):
+        main_window.set_dropdown(dropdown, "ALV", "text")
+
+
+def test_table_control_pages(sap_gui: SimulatedSapGui, main_window: pysapscript.Window) -> None:
+    frame = main_window.read_table_control(TABLE_CONTROL)
+
+    assert frame.columns == ["ITEM-POSNR", "ITEM-MATNR", "ITEM-SELKZ"]
+    assert frame.height == 30
+    assert frame["ITEM-MATNR"][24] == "M24"
+    assert frame["ITEM-SELKZ"][:3].to_list() == [True, False, True]
+
+    main_window.write_table_control(TABLE_CONTROL, [{"ITEM-MATNR": f"N{i}", "ITEM-SELKZ": True} for i in range(8)], 22)
+    rows = sap_gui.application.findById(f"/app/con[0]/ses[0]/{TABLE_CONTROL}").rows
+
+    assert [row[1] for row in rows[21:]] == ["M21"] + [f"N{i}" for i in range(8)]
+    assert rows[29][2] is True
+
+    with pytest.raises(exceptions.ActionException, match="do not fit"):
+        main_window.write_table_control(TABLE_CONTROL, [{"ITEM-MATNR": "X"}], 30)
+
+
+def test_list_output_pages(sap_gui: SimulatedSapGui, main_window: pysapscript.Window) -> None:
+    lines = ["Stock report", "-" * 40, "Material    Plant   Description        Qty", "-" * 40]
+    lines += [f"M-{i:04}      1000    Part {i}   {i * 10:>10}" for i in range(50)]
+    session = sap_gui.application.Children(0).Children(0)
+    SimulatedListOutput(lines, page_size=15).show(session)
+
+    frame = main_window.read_list_output(header=1)
+
+    assert frame.columns == ["Material", "Plant", "Description", "Qty"]
+    assert frame.height == 50
+    assert frame.row(49) == ("M-0049", "1000", "Part 49", "490")
+    assert next(main_window.iter_list_output(header=1))["Description"] == "Part 0"
+
+
+def test_shell_table_loads_all_rows(main_window: pysapscript.Window) -> None:
+    table = main_window.read_shell_table(GRID)
+
+    assert table.rows == 55
+    assert table.to_polars_dataframe()["MATNR"][-1] == "M54"
+
+
+@pytest.mark.parametrize("missing", ["pandas", "pyarrow"])
+def test_to_pandas_names_missing_extra(
+    main_window: pysapscript.Window,
+    monkeypatch: pytest.MonkeyPatch,
+    missing: str,
+) -> None:
+    table = main_window.read_shell_table(GRID)
+    monkeypatch.setitem(sys.modules, missing, None)
+
+    with pytest.raises(ImportError, match=rf"{missing} is missing, install pysapscript\[pandas\]"):
+        table.to_pandas_dataframe()
+
+
+def test_unloaded_rows_read_empty(sap_gui: SimulatedSapGui, main_window: pysapscript.Window) -> None:
+    grid = sap_gui.application.findById(f"/app/con[0]/ses[0]/{GRID}")
+
+    assert grid.GetCellValue(0, "MATNR") == "M0"
+    assert grid.GetCellValue(54, "MATNR") == ""
+
+
+def test_shell_tree(main_window: pysapscript.Window) -> None:
+    tree = main_window.read_shell_tree(TREE)
+    folder = tree.get_node_folders()[0]
+
+    assert [n.label for n in folder.get_children()] == ["Child 1", "Child 2", "Subfolder"]
+
+
+def test_shell_tree_hierarchy(sap_gui: SimulatedSapGui, main_window: pysapscript.Window) -> None:
+    tree = main_window.read_shell_tree(TREE)
+    folder, _, _, subfolder, grandchild, other = tree
+
+    sap_gui.reset_calls()
+    assert [n.label for n in subfolder.get_children()] == ["Grandchild"]
+    assert [n.label for n in folder.get_descendants()] == ["Child 1", "Child 2", "Subfolder", "Grandchild"]
+    assert grandchild.get_parent() == subfolder
+    assert other.get_parent() is None
+    assert [n.get_depth() for n in tree] == [0, 1, 1, 1, 2, 0]
+    assert sap_gui.calls["GetSubNodesCol"] == 2
+    assert sum(count for method, count in sap_gui.calls.items() if method.startswith("Get")) == 2
+
+
+def test_shell_tree_reads_requested_attributes(sap_gui: SimulatedSapGui, main_window: pysapscript.Window) -> None:
+    sap_gui.reset_calls()
+    tree = main_window.read_shell_tree(TREE, attributes=["label"])
+
+    assert [n.label for n in tree] == ["Folder", "Child 1", "Child 2", "Subfolder", "Grandchild", "Other"]
+    assert tree[0].is_folder is None
+    assert tree.load_stats.calls == {"GetAllNodeKeys": 1, "GetNodeTextByKey": 6}
+    assert tree.load_stats.calls_per_node == 7 / 6
+    assert sap_gui.calls["GetNodeTextByKey"] == 6
+
+    assert tree[4].get_depth() == 2
+    assert tree.load_stats.calls["GetParent"] == 6
+
+
+def test_shell_tree_lookups(main_window: pysapscript.Window) -> None:
+    tree = main_window.read_shell_tree(TREE)
+
+    assert tree.get_node_by_key("5").label == "Grandchild"
+    assert tree.get_node_by_key("missing") is None
+    assert [n.key for n in tree.get_nodes_by_label("Child 1")] == ["2"]
+    assert tree.get_node_by_path("Folder/Subfolder/Grandchild").key == "5"
+    assert tree.get_node_by_path("Subfolder/Grandchild") is None
+    assert [n.key for n in tree.find_nodes(pattern=r"^Child \d$")] == ["2", "3"]
+    assert [n.key for n in tree.find_nodes(prefix="G")] == ["5"]
+    assert [n.key for n in tree.get_node_folders()] == ["1", "4"]
+
+
+def test_shell_tree_folder_methods_need_is_folder(main_window: pysapscript.Window) -> None:
+    tree = main_window.read_shell_tree(TREE, attributes=["label"])
+
+    for method in (tree.get_node_folders, tree.get_node_not_folders, tree.expand_all, tree.collapse_all, tree.select_all):
+        with pytest.raises(exceptions.ActionException, match="is_folder of tree .* is not loaded"):
+            method()
+
+    with pytest.raises(exceptions.ActionException, match="label of tree .* is not loaded"):
+        main_window.read_shell_tree(TREE, attributes=["is_folder"]).get_node_by_path("Folder")
+
+
+def test_lazy_shell_tree(sap_gui: SimulatedSapGui, main_window: pysapscript.Window) -> None:
+    menu = main_window.read_shell_tree(MENU_TREE, lazy=True)
+
+    assert [n.label for n in menu] == ["Office", "Logistics"]
+    assert "GetAllNodeKeys" not in menu.load_stats.calls
+
+    inbox = menu.get_node_by_path("Office/Workplace/Inbox")
+    assert inbox.key == "A11"
+    assert inbox.get_depth() == 2
+    assert menu.get_node_by_key("B1") is None
+
+    assert [n.label for n in menu.walk(max_depth=0)] == ["Office", "Logistics"]
+    walked = list(menu.walk())
+    assert [n.label for n in walked] == ["Office", "Workplace", "Inbox", "Logistics", "Orders"]
+    assert walked[-1].get_parent().label == "Logistics"
+    assert menu.get_node_by_key("B1") is walked[-1]
+    assert len(menu) == 5
+
+
+def test_lazy_shell_tree_expand_all_reads_one_level(main_window: pysapscript.Window) -> None:
+    menu = main_window.read_shell_tree(MENU_TREE, lazy=True)
+    menu.expand_all()
+
+    assert sorted(n.key for n in menu) == ["A", "A1", "B", "B1"]
+    assert menu.get_node_by_key("B1").get_parent().label == "Logistics"
+
+
+def test_lazy_shell_tree_to_polars_in_tree_order(main_window: pysapscript.Window) -> None:
+    menu = main_window.read_shell_tree(MENU_TREE, lazy=True)
+    menu.get_node_by_label("Logistics").get_children()
+    menu.get_node_by_path("Office/Workplace/Inbox")
+
+    assert [n.key for n in menu.get_nodes()] == ["A", "B", "B1", "A1", "A11"]
+    assert menu.to_polars().select("key", "depth").rows() == [("A", 0), ("A1", 1), ("A11", 2), ("B", 0), ("B1", 1)]
+
+
+def test_column_tree_to_polars(main_window: pysapscript.Window) -> None:
+    assert main_window.read_shell_tree(ITEM_TREE)[1].items is None
+    assert Node(None, "P1", "Material A", None, None, False, 0).items is None
+
+    tree = main_window.read_shell_tree(ITEM_TREE, attributes=NODE_ATTRIBUTES)
+
+    assert tree[1].items == {"QTY": "5", "UNIT": "PC"}
+    assert tree.get_columns("title") == ["Quantity", "Unit"]
+
+    df = tree.to_polars(column_names="title")
+    assert df.columns == ["key", "parent_key", "depth", "path", "label", "Quantity", "Unit"]
+    assert df.row(2) == ("P2", "P", 1, "Plant 1000/Material B", "Material B", "7", "")
+    assert tree.load_stats.calls["GetItemText"] == 6
+
+    simple = main_window.read_shell_tree(TREE).to_polars()
+    assert simple.columns == ["key", "parent_key", "depth", "path", "label"]
+    assert simple["path"][4] == "Folder/Subfolder/Grandchild"
+
+
+def test_write_and_read_many_mixed_elements(main_window: pysapscript.Window) -> None:
+    values = {
+        "wnd[0]/usr/ctxtDATABROWSE-TABLENAME": "MARA",
+        "wnd[0]/usr/txtGD-MAX_LINES": "100",
+        "wnd[0]/usr/chkGD-SAPEDIT": True,
+        "wnd[0]/usr/radGD-NONE": True,
+        "wnd[0]/usr/cmbGD-FORMAT": "L",
+    }
+
+    assert all(result.ok for result in main_window.write_many(values).values())
+
+    read = main_window.read_many([*values, "wnd[0]/usr/radGD-ALL"])
+    assert {element: result.value for element, result in read.items()} == {**values, "wnd[0]/usr/radGD-ALL": False}
+
+
+def test_write_and_read_many_continue_after_failure(main_window: pysapscript.Window) -> None:
+    results = main_window.write_many({
+        "wnd[0]/usr/ctxtDATABROWSE-TABLENAME": "MARA",
+        "wnd[0]/usr/cmbGD-FORMAT": "X",
+        "wnd[0]/usr/txtGD-MISSING": "1",
+        "wnd[0]/usr/txtGD-MAX_LINES": "123456",
+        "wnd[0]/usr/chkGD-SAPEDIT": True,
+    })
+
+    assert [element for element, result in results.items() if not result.ok] == [
+        "wnd[0]/usr/cmbGD-FORMAT", "wnd[0]/usr/txtGD-MISSING", "wnd[0]/usr/txtGD-MAX_LINES",
+    ]
+    assert "Key X is not an entry" in results["wnd[0]/usr/cmbGD-FORMAT"].error
+
+    read = main_window.read_many(["wnd[0]/usr/txtGD-MISSING", "wnd[0]/usr/txtGD-MAX_LINES", "wnd[0]/usr/chkGD-SAPEDIT"])
+    assert [(r.ok, r.value) for r in read.values()] == [(False, None), (True, "500"), (True, True)]
+    assert read["wnd[0]/usr/txtGD-MISSING"].error.startswith("Error reading element wnd[0]/usr/txtGD-MISSING")
+
+
+def test_status_bar(main_window: pysapscript.Window) -> None:
+    main_window.send_v_key(value=8)
+    status = main_window.wait_for_status(lambda s: s.type == "S", timeout=1)
+
+    assert status.parameters == ("55",)
+
+
+def test_popup_handler(sap_gui: SimulatedSapGui, main_window: pysapscript.Window) -> None:
+    session = sap_gui.application.Children(0).Children(0)
+    session.register_v_key(8, lambda s: s.open_popup("Information", "Selection is empty"))
+    main_window.add_popup_handler(pysapscript.PopupHandler(title="Information", press="tbar[0]/btn[0]", capture=True))
+
+    main_window.send_v_key(value=8)
+
+    assert main_window.popup_log[0].text == "Selection is empty"
+    assert session.Children.Count == 1
+
+
+def test_popup_handler_action_does_not_reenter(
+    sap_gui: SimulatedSapGui,
+    main_window: pysapscript.Window,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = sap_gui.application.Children(0).Children(0)
+    session.register_v_key(8, lambda s: s.open_popup("Confirm", "Continue?"))
+    calls: list[int] = []
+    original = popups.handle_popups
+
+    def counting(window: pysapscript.Window, handlers: list) -> list:
+        calls.append(1)
+        return original(window, handlers)
+
+    main_window.add_popup_handler(pysapscript.PopupHandler(
+        title="Confirm", action=lambda window, popup: window.press(f"{popup.id}/tbar[0]/btn[0]"),
+    ))
+    monkeypatch.setattr(popups, "handle_popups", counting)
+    main_window.send_v_key(value=8)
+
+    assert len(calls) == 1
+    assert [p.title for p in main_window.popup_log] == ["Confirm"]
+    assert main_window.popup_log[0].error is None
+    assert session.Children.Count == 1
+
+
+def test_popup_failure_is_not_reported_as_press_failure(
+    main_window: pysapscript.Window,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def broken(*_: object) -> None:
+        raise RuntimeError("popup vanished")
+
+    monkeypatch.setattr(popups, "handle_popups", broken)
+    main_window.add_popup_handler(pysapscript.PopupHandler(title="Information", press="tbar[0]/btn[0]"))
+
+    with pytest.raises(exceptions.ActionException, match="^Error handling popups: popup vanished"):
+        main_window.press("wnd[0]/tbar[0]/btn[0]")
+
+
+def test_open_new_window(sap_gui: SimulatedSapGui) -> None:
+    pss = pysapscript.Sapscript(sap_gui_auto=sap_gui)
+    new_window = pss.open_new_window(pss.attach_window(0, 0), timeout=1)
+
+    assert new_window.session == 1
+    assert pss.list_sessions() == [(0, 0), (0, 1)]
+
+
+def test_calls_are_counted(sap_gui: SimulatedSapGui, main_window: pysapscript.Window) -> None:
+    sap_gui.reset_calls()
+    main_window.read("wnd[0]/usr/ctxtDATABROWSE-TABLENAME")
+
+    assert sap_gui.calls == {"findById": 1, "text": 1}